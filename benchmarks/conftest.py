@@ -0,0 +1,35 @@
+"""Pytest session configuration of the benchmarks running on the fake backend."""
+import ee
+import pytest
+
+import geetools  # noqa: F401
+from geetools.ee_governor import DEFAULT_LIMITS, governor
+
+PROJECT = "fake-project"
+"The project of the fake backend."
+
+
+def pytest_configure() -> None:
+    """Initialize earth engine offline and lift the rate limits to measure the client-side costs only."""
+    ee.geetools.FakeBackend(PROJECT).initialize()
+    for endpoint in DEFAULT_LIMITS:
+        governor.configure(endpoint, rate=1e9, concurrency=100)
+
+
+@pytest.fixture
+def backend():
+    """An active fake backend without any asset."""
+    with ee.geetools.FakeBackend(PROJECT, seed=0) as backend:
+        yield backend
+
+
+@pytest.fixture
+def tree(backend):
+    """A folder of 5 subfolders containing 40 images each."""
+    root = ee.Asset(backend.root) / "tree"
+    backend.add(root.as_posix(), "FOLDER")
+    for i in range(5):
+        backend.add((root / f"folder_{i}").as_posix(), "FOLDER")
+        for j in range(40):
+            backend.add((root / f"folder_{i}" / f"image_{j}").as_posix(), properties={"index": j})
+    return root
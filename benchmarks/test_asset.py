@@ -0,0 +1,36 @@
+"""Benchmark the Asset helpers."""
+import ee
+
+
+def test_iterdir_recursive(benchmark, tree):
+    """List a tree of 205 assets."""
+    assets = benchmark(tree.iterdir, recursive=True)
+    assert len(assets) == 205
+
+
+def test_copy_folder(benchmark, backend, tree):
+    """Copy a tree of 205 assets."""
+    def setup():
+        for name in [n for n in backend.assets if n.startswith(f"{backend.root}/copy")]:
+            del backend.assets[name]
+
+    benchmark.pedantic(tree.copy, args=(ee.Asset(backend.root) / "copy",), setup=setup, rounds=5)
+    assert ee.Asset(backend.root, "copy", "folder_4", "image_39").exists()
+
+
+def test_delete_folder(benchmark, backend, tree):
+    """Delete a tree of 205 assets."""
+    assets = dict(backend.assets)
+
+    def setup():
+        backend.assets.update(assets)
+
+    benchmark.pedantic(tree.delete, kwargs={"recursive": True, "dry_run": False}, setup=setup, rounds=5)
+    assert not tree.exists()
+
+
+def test_set_properties(benchmark, tree):
+    """Update the properties of a single image."""
+    image = tree / "folder_0" / "image_0"
+    benchmark(image.setProperties, foo="bar", **{"system:time_start": 0})
+    assert image.exists()
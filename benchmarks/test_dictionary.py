@@ -0,0 +1,24 @@
+"""Benchmark the conversion of large reduction dictionaries to tables."""
+import ee
+import pytest
+
+import geetools  # noqa: F401
+
+ROWS = {f"2020-{i // 28 + 1:02d}-{i % 28 + 1:02d}": [i * 0.1 + b for b in range(12)] for i in range(336)}
+"A reduction by dates of a 12 bands collection, as returned by ``datesByBands``."
+
+
+def test_to_table(benchmark, backend):
+    """Build and encode the server-side table of the list values."""
+    dictionary = ee.Dictionary(ROWS)
+    expression = benchmark(lambda: ee.serializer.encode(dictionary.geetools.toTable("list")))
+    benchmark.extra_info.update(ee.geetools.GraphInspector().inspect(expression))
+
+
+@pytest.mark.parametrize("to", ["pandas", "arrow"])
+def test_to_dataframe(benchmark, backend, to):
+    """Convert the fetched dictionary on the client, without any request."""
+    dictionary = ee.Dictionary(ROWS)
+    table = benchmark(dictionary.geetools.toDataFrame, "list", to)
+    assert table.shape == ((336, 12) if to == "pandas" else (336, 13))
+    assert backend.calls["computeValue"] == 0
@@ -0,0 +1,22 @@
+"""Benchmark the export helpers."""
+import ee
+
+
+def test_imagecollection_to_asset(benchmark, backend):
+    """Plan and start the export of 100 images."""
+    indices = [f"image_{i}" for i in range(100)]
+    backend.results.update({"AggregateFeatureCollection.array": indices, "Element.get": "image"})
+    collection = ee.ImageCollection([ee.Image(i).set("system:index", str(i)) for i in range(3)])
+    region = ee.Geometry.Point([0, 0]).buffer(100)
+
+    def export():
+        backend.assets.pop(f"{backend.root}/export", None)
+        tasks = ee.batch.Export.geetools.imagecollection.toAsset(
+            collection, "system:index", "export", f"{backend.root}/export", region=region, scale=30
+        )
+        [t.start() for t in tasks]
+        return tasks
+
+    tasks = benchmark(export)
+    assert len(tasks) == 100
+    assert backend.calls["exportImage"] >= 100
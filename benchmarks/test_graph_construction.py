@@ -0,0 +1,255 @@
+"""Benchmark the client-side construction of the graphs built by the geetools accessors.
+
+Every public method of the accessors is either benchmarked or listed in :py:data:`EXCLUDED`, a new method
+fails :py:func:`test_coverage` until it is added to one of them.
+"""
+
+import ee
+import pytest
+
+import geetools  # noqa: F401
+
+CALLS = {
+    "DateRange.split": lambda o: ee.DateRange("2020-01-01", "2021-01-01").geetools.split(1, "month"),
+    "DateRange.unitMillis": lambda o: ee.DateRange.geetools.unitMillis("day"),
+    "Dictionary.fromPairs": lambda o: ee.Dictionary.geetools.fromPairs([["a", 1], ["b", 2]]),
+    "Dictionary.sort": lambda o: ee.Dictionary({"b": 1, "a": 2}).geetools.sort(),
+    "Dictionary.getMany": lambda o: ee.Dictionary({"b": 1, "a": 2}).geetools.getMany(["a"]),
+    "Dictionary.toTable": lambda o: ee.Dictionary({"a": {"x": 1}, "b": {"x": 2}}).geetools.toTable("dict"),
+    "Array.full": lambda o: ee.Array.geetools.full(3, 3, 0),
+    "Array.set": lambda o: ee.Array([[1, 2], [3, 4]]).geetools.set(0, 0, 5),
+    "Date.fromEpoch": lambda o: ee.Date.geetools.fromEpoch(10, "day"),
+    "Date.fromDOY": lambda o: ee.Date.geetools.fromDOY(10, 2020),
+    "Date.now": lambda o: ee.Date.geetools.now(),
+    "Date.getUnitSinceEpoch": lambda o: ee.Date("2020-01-01").geetools.getUnitSinceEpoch("day"),
+    "Date.isLeap": lambda o: ee.Date("2020-01-01").geetools.isLeap(),
+    "Date.toDOY": lambda o: ee.Date("2020-01-01").geetools.toDOY(),
+    "List.product": lambda o: ee.List([1, 2]).geetools.product(["a", "b"]),
+    "List.complement": lambda o: ee.List([1, 2]).geetools.complement([2, 3]),
+    "List.intersection": lambda o: ee.List([1, 2]).geetools.intersection([2, 3]),
+    "List.union": lambda o: ee.List([1, 2]).geetools.union([2, 3]),
+    "List.delete": lambda o: ee.List([1, 2]).geetools.delete(0),
+    "List.sequence": lambda o: ee.List.geetools.sequence(1, 10, 2),
+    "List.replaceMany": lambda o: ee.List(["a", "b"]).geetools.replaceMany({"a": "c"}),
+    "List.join": lambda o: ee.List(["a", "b"]).geetools.join(", "),
+    "List.toStrings": lambda o: ee.List([1, "a"]).geetools.toStrings(),
+    "List.zip": lambda o: ee.List([[1, 2], [3, 4]]).geetools.zip(),
+    "List.chunked": lambda o: ee.List([1, 2, 3, 4, 5]).geetools.chunked(2),
+    "Number.truncate": lambda o: ee.Number(1.2345).geetools.truncate(2),
+    "Number.isClose": lambda o: ee.Number(1).geetools.isClose(1.0001, 0.01),
+    "String.eq": lambda o: ee.String("a").geetools.eq("b"),
+    "String.format": lambda o: ee.String("{a} {b}").geetools.format({"a": 1, "b": "x"}),
+    "Feature.toFeatureCollection": lambda o: ee.Feature(o["point"], {"a": 1}).geetools.toFeatureCollection(),
+    "Feature.removeProperties": lambda o: ee.Feature(o["point"], {"a": 1}).geetools.removeProperties(["a"]),
+    "FeatureCollection.toImage": lambda o: o["features"].geetools.toImage(),
+    "FeatureCollection.toDictionary": lambda o: o["features"].geetools.toDictionary("b"),
+    "FeatureCollection.addId": lambda o: o["features"].geetools.addId(),
+    "FeatureCollection.mergeGeometries": lambda o: o["features"].geetools.mergeGeometries(),
+    "FeatureCollection.columnNames": lambda o: o["features"].geetools.columnNames(),
+    "FeatureCollection.toPolygons": lambda o: o["features"].geetools.toPolygons(),
+    "FeatureCollection.byProperties": lambda o: o["features"].geetools.byProperties("b", ["a"]),
+    "FeatureCollection.byFeatures": lambda o: o["features"].geetools.byFeatures("b", ["a"]),
+    "FeatureCollection.fromGeoInterface": lambda o: ee.FeatureCollection.geetools.fromGeoInterface(
+        {
+            "type": "FeatureCollection",
+            "features": [
+                {
+                    "type": "Feature",
+                    "geometry": {"type": "Point", "coordinates": [0, 0]},
+                    "properties": {"a": 1},
+                }
+            ],
+        }
+    ),
+    "FeatureCollection.areaSort": lambda o: o["features"].geetools.areaSort(),
+    "FeatureCollection.filterGeometryType": lambda o: o["features"].geetools.filterGeometryType("Polygon"),
+    "FeatureCollection.breakGeometries": lambda o: o["features"].geetools.breakGeometries(),
+    "Filter.dateRange": lambda o: ee.Filter.date("2020", "2021").geetools.dateRange(
+        ee.DateRange("2020-01-01", "2021-01-01")
+    ),
+    "Image.addDate": lambda o: o["image"].geetools.addDate(),
+    "Image.addSuffix": lambda o: o["image"].geetools.addSuffix("_x"),
+    "Image.addPrefix": lambda o: o["image"].geetools.addPrefix("x_"),
+    "Image.rename": lambda o: o["image"].geetools.rename({"B2": "blue"}),
+    "Image.remove": lambda o: o["image"].geetools.remove(["B2"]),
+    "Image.doyToDate": lambda o: o["image"].geetools.doyToDate(2020, band="B2"),
+    "Image.getValues": lambda o: o["image"].geetools.getValues(o["point"], 10),
+    "Image.minScale": lambda o: o["image"].geetools.minScale(),
+    "Image.merge": lambda o: o["image"].geetools.merge([o["image"], o["image"]]),
+    "Image.clipOnCollection": lambda o: o["image"].geetools.clipOnCollection(o["features"]),
+    "Image.bufferMask": lambda o: o["image"].geetools.bufferMask(),
+    "Image.full": lambda o: o["image"].geetools.full([1, 2], ["a", "b"]),
+    "Image.fullLike": lambda o: o["image"].geetools.fullLike(0),
+    "Image.reduceBands": lambda o: o["image"].geetools.reduceBands("mean"),
+    "Image.negativeClip": lambda o: o["image"].geetools.negativeClip(o["region"]),
+    "Image.format": lambda o: o["image"].geetools.format("{system_date}"),
+    "Image.gauss": lambda o: o["image"].geetools.gauss("B2"),
+    "Image.repeat": lambda o: o["image"].geetools.repeat("B2", 3),
+    "Image.removeZeros": lambda o: o["image"].geetools.removeZeros(),
+    "Image.interpolateBands": lambda o: o["image"].geetools.interpolateBands([0, 1], [1, 0]),
+    "Image.isletMask": lambda o: o["image"].geetools.isletMask(10),
+    "Image.removeProperties": lambda o: o["image"].geetools.removeProperties(["system:time_start"]),
+    "Image.distanceToMask": lambda o: o["image"].geetools.distanceToMask(o["image"].select("B2").gt(1)),
+    "Image.distance": lambda o: o["image"].geetools.distance(o["image"]),
+    "Image.maskCoverRegion": lambda o: o["image"].geetools.maskCoverRegion(o["region"], 10, "B2"),
+    "Image.maskCoverRegions": lambda o: o["image"].geetools.maskCoverRegions(o["features"], 10, "B2"),
+    "Image.maskCover": lambda o: o["image"].geetools.maskCover(10),
+    "Image.fromList": lambda o: ee.Image.geetools.fromList([o["image"], o["image"]]),
+    "Image.classToBands": lambda o: o["image"].geetools.classToBands({1: "one", 2: "two"}, "B2"),
+    "Image.classMask": lambda o: o["image"].geetools.classMask({1: "one", 2: "two"}, ["one"], "B2"),
+    "Image.byBands": lambda o: o["image"].geetools.byBands(o["features"], bands=["B2", "B3"], scale=10),
+    "Image.byRegions": lambda o: o["image"].geetools.byRegions(o["features"], bands=["B2", "B3"], scale=10),
+    "Image.pixelArea": lambda o: ee.Image.geetools.pixelArea("ha"),
+    "ImageCollection.append": lambda o: o["collection"].geetools.append(o["image"]),
+    "ImageCollection.collectionMask": lambda o: o["collection"].geetools.collectionMask(),
+    "ImageCollection.integral": lambda o: o["collection"].geetools.integral("B2"),
+    "ImageCollection.outliers": lambda o: o["collection"].geetools.outliers(["B2"]),
+    "ImageCollection.outlierBounds": lambda o: o["collection"].geetools.outlierBounds(["B2"]),
+    "ImageCollection.validPixel": lambda o: o["collection"].geetools.validPixel("B2"),
+    "ImageCollection.containsBandNames": lambda o: o["collection"].geetools.containsBandNames(["B2"], "ALL"),
+    "ImageCollection.containsAllBands": lambda o: o["collection"].geetools.containsAllBands(["B2"]),
+    "ImageCollection.containsAnyBands": lambda o: o["collection"].geetools.containsAnyBands(["B2"]),
+    "ImageCollection.aggregateArray": lambda o: o["collection"].geetools.aggregateArray(
+        ["system:time_start"]
+    ),
+    "ImageCollection.groupInterval": lambda o: o["s2"]
+    .filterDate("2020", "2021")
+    .geetools.groupInterval("month"),
+    "ImageCollection.closestDate": lambda o: o["collection"].geetools.closestDate(),
+    "ImageCollection.fillGaps": lambda o: o["collection"].geetools.fillGaps(),
+    "ImageCollection.medoid": lambda o: o["collection"].geetools.medoid(),
+    "ImageCollection.sortMany": lambda o: o["collection"].geetools.sortMany(["system:time_start", "a"]),
+    "ImageCollection.datesByBands": lambda o: o["collection"].geetools.datesByBands(
+        o["region"], bands=["B2"], scale=10
+    ),
+    "ImageCollection.datesByRegions": lambda o: o["collection"].geetools.datesByRegions(
+        "B2", o["features"], scale=10
+    ),
+    "ImageCollection.doyByBands": lambda o: o["collection"].geetools.doyByBands(
+        o["region"], bands=["B2"], scale=10
+    ),
+    "ImageCollection.doyByRegions": lambda o: o["collection"].geetools.doyByRegions(
+        "B2", o["features"], scale=10
+    ),
+    "ImageCollection.doyBySeasons": lambda o: o["collection"].geetools.doyBySeasons(
+        "B2", o["region"], 100, 200, scale=10
+    ),
+    "ImageCollection.doyByYears": lambda o: o["collection"].geetools.doyByYears("B2", o["region"], scale=10),
+    "ImageCollection.reduceRegion": lambda o: o["collection"].geetools.reduceRegion(
+        "mean", o["region"], scale=10
+    ),
+    "ImageCollection.reduceRegions": lambda o: o["collection"].geetools.reduceRegions(
+        "mean", o["features"], scale=10
+    ),
+    "Join.byProperty": lambda o: ee.Join.geetools.byProperty(o["features"], o["features"], "b"),
+}
+"The calls building a graph on the client, keyed by the accessor method they use."
+
+EXCLUDED = [
+    # helpers that do not build a graph
+    "Date.check_unit",
+    "Date.to_datetime",
+    "DateRange.check_unit",
+    "Image.index_list",
+    # methods requesting the server while building the graph
+    "Geometry.keepType",
+    "Image.toGrid",
+    "Image.toGridAsset",
+    "Image.spectralIndices",
+    "Image.matchHistogram",
+    "Image.maskClouds",
+    "Image.panSharpen",
+    "Image.tasseledCap",
+    "Image.byRegionsChunked",
+    "ImageCollection.closest",
+    "ImageCollection.spectralIndices",
+    "ImageCollection.maskClouds",
+    "ImageCollection.panSharpen",
+    "ImageCollection.tasseledCap",
+    "ImageCollection.reduceInterval",
+    "ImageCollection.index",
+    "ImageCollection.bandSignatures",
+    "ImageCollection.datesChunked",
+    "ImageCollection.doyTable",
+    "ImageCollection.to_xarray",
+    "FeatureCollection.schema",
+    "Dictionary.toDataFrame",
+    # methods reading the STAC catalog
+    "Image.getSTAC",
+    "Image.getDOI",
+    "Image.getCitation",
+    "Image.getScaleParams",
+    "Image.getOffsetParams",
+    "Image.scaleAndOffset",
+    "Image.preprocess",
+    "ImageCollection.getSTAC",
+    "ImageCollection.getDOI",
+    "ImageCollection.getCitation",
+    "ImageCollection.getScaleParams",
+    "ImageCollection.getOffsetParams",
+    "ImageCollection.scaleAndOffset",
+    "ImageCollection.preprocess",
+    # plots
+    "FeatureCollection.plot",
+    "FeatureCollection.plot_by_features",
+    "FeatureCollection.plot_by_properties",
+    "FeatureCollection.plot_hist",
+    "Image.plot",
+    "Image.plot_by_bands",
+    "Image.plot_by_regions",
+    "Image.plot_hist",
+    "ImageCollection.plot_dates_by_bands",
+    "ImageCollection.plot_dates_by_regions",
+    "ImageCollection.plot_doy_by_bands",
+    "ImageCollection.plot_doy_by_regions",
+    "ImageCollection.plot_doy_by_seasons",
+    "ImageCollection.plot_doy_by_years",
+]
+"The public accessor methods that are not benchmarked as their cost is dominated by the server or the plots."
+
+
+@pytest.fixture(scope="module")
+def o():
+    """The objects used as inputs of the benchmarked calls."""
+    point = ee.Geometry.Point([0, 0])
+    region = point.buffer(100)
+    image = ee.Image.constant([1, 2, 3, 4]).rename(["B2", "B3", "B4", "B8"]).set("system:time_start", 0)
+    collection = ee.ImageCollection([image, image.set("system:time_start", 86400000)])
+    features = [ee.Feature(region, {"a": 1, "b": "x"}), ee.Feature(point, {"a": 2, "b": "y"})]
+    s2 = ee.ImageCollection("COPERNICUS/S2_SR_HARMONIZED")
+    data = dict(point=point, region=region, image=image, collection=collection, s2=s2)
+    return {**data, "features": ee.FeatureCollection(features)}
+
+
+@pytest.mark.parametrize("name", list(CALLS))
+def test_graph_construction(benchmark, backend, o, name):
+    """Build and encode the graph of a single accessor method call."""
+    benchmark.group = name.split(".")[0]
+    benchmark(lambda: ee.serializer.encode(CALLS[name](o)))
+    assert backend.calls["computeValue"] == 0
+
+
+def test_accessor(benchmark):
+    """Access the geetools namespace of the same image."""
+    image = ee.Image(1)
+    benchmark(lambda: image.geetools)
+
+
+def test_chained_calls(benchmark, o):
+    """Build a chain of accessor calls on a per-tile loop."""
+
+    def chain():
+        for i in range(10):
+            image = o["image"].geetools.addSuffix(f"_{i}").geetools.removeZeros().geetools.fullLike(i)
+            image.geetools.reduceBands("mean").geetools.bufferMask()
+
+    benchmark(chain)
+
+
+def test_coverage():
+    """Check that every public accessor method is either benchmarked or excluded."""
+    methods = [
+        f"{a.__name__.removesuffix('Accessor')}.{n}" for a, n, _ in ee.geetools.GraphInspector()._methods()
+    ]
+    assert sorted(set(methods) - set(CALLS) - set(EXCLUDED)) == []
+    assert sorted((set(CALLS) | set(EXCLUDED)) - set(methods)) == []
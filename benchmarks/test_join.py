@@ -0,0 +1,29 @@
+"""Benchmark the join helpers on large synthetic tables."""
+import ee
+import pytest
+
+import geetools  # noqa: F401
+
+
+def table(size: int, value: str) -> ee.FeatureCollection:
+    """A synthetic table of ``size`` rows with a (site, year) composite key built on the server."""
+
+    def row(i):
+        i = ee.Number(i)
+        return ee.Feature(None, {"site": i.mod(1000), "year": i.divide(1000).floor(), value: i})
+
+    return ee.FeatureCollection(ee.List.sequence(0, size - 1).map(row))
+
+
+@pytest.mark.parametrize("field", ["site", ["site", "year"]], ids=["single", "composite"])
+@pytest.mark.parametrize("how,outer", [("first", False), ("first", True), ("all", False), ("all", True)])
+def test_by_property(benchmark, backend, field, how, outer):
+    """Build and encode a join of two tables of 100 000 rows."""
+    primary, secondary = table(100_000, "ndvi"), table(100_000, "visit")
+
+    def join():
+        return ee.serializer.encode(ee.Join.geetools.byProperty(primary, secondary, field, outer, how))
+
+    expression = benchmark(join)
+    benchmark.extra_info.update(ee.geetools.GraphInspector().inspect(expression))
+    assert backend.calls["computeValue"] == 0
@@ -0,0 +1,40 @@
+"""Benchmark the client-side reduction helpers."""
+import ee
+import pytest
+
+import geetools  # noqa: F401
+
+
+@pytest.fixture
+def regions():
+    """1000 point regions."""
+    points = [ee.Feature(ee.Geometry.Point([i / 10, 0]), {"id": i}) for i in range(1000)]
+    return ee.FeatureCollection(points)
+
+
+def test_by_regions_chunked(benchmark, backend, regions):
+    """Reduce 1000 regions in chunks of 100."""
+    features = [{"id": str(i), "properties": {"B1": 1.0, "B2": 2.0}} for i in range(100)]
+    backend.results.update(
+        {"Dictionary": {"size": 1000, "labels": ["B1", "B2"]}, "Collection.map": {"features": features}}
+    )
+    image = ee.Image([1, 2]).rename(["B1", "B2"])
+    table = benchmark(image.geetools.byRegionsChunked, regions, "mean", chunkSize=100)
+    assert table.shape == (1000, 2)
+    assert backend.calls["computeValue"] > 10
+
+
+@pytest.mark.parametrize("method", ["exact", "mean"])
+def test_medoid(benchmark, backend, method):
+    """Build the medoid of 20 images with the quadratic and the linear methods."""
+    images = [ee.Image.constant([v, v * 2]).rename(["a", "b"]) for v in range(20)]
+    ic = ee.ImageCollection(images)
+    benchmark.group = "medoid"
+    expression = benchmark(lambda: ee.serializer.encode(ic.geetools.medoid(method)))
+    statistics = ee.geetools.GraphInspector().inspect(expression)
+    # the server evaluates N^2 image differences per pixel in exact mode and 2N in linear mode
+    differences = len(images) ** 2 if method == "exact" else 2 * len(images)
+    benchmark.extra_info.update(statistics, imageDifferences=differences)
+    exact = ee.geetools.GraphInspector().inspect(ic.geetools.medoid())
+    assert statistics["bytes"] < 2 * exact["bytes"]
+    assert backend.calls["computeValue"] == 0
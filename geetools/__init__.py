@@ -33,6 +33,13 @@ from .ee_array import ArrayAccessor
 from .ee_date_range import DateRangeAccessor
 from .ee_export import ExportAccessor
 from .ee_profiler import Profiler
+from .ee_governor import Governor
+from .ee_executor import Executor
+from .ee_evaluator import Evaluator
+from .ee_graph import GraphInspector
+from .ee_fake_backend import FakeBackend
+from .ee_archive import GraphArchive
+from .ee_cache import AssetCache
 
 __title__ = "geetools"
 __summary__ = "A set of useful tools to use with Google Earth Engine Python" "API"
@@ -15,15 +15,30 @@ def register_class_accessor(klass: type, name: str) -> Callable:
 
     Returns:
         The accessor function to the class.
+
+    Note:
+        The accessor classes should define ``__slots__`` as an instance is built every time the namespace is
+        accessed on a new object.
     """
 
     def decorator(accessor: Callable) -> object:
         class ClassAccessor:
+            __slots__ = ("_last", "accessor", "name")
+
             def __init__(self, name: str, accessor: Callable):
                 self.name, self.accessor = name, accessor
+                self._last: tuple = (object(), None)
 
             def __get__(self, obj: object, *args) -> object:
-                return self.accessor(obj)
+                # chained calls access the namespace of the same object many times in a row, the last accessor
+                # is reused instead of building a new one. It cannot be stored on the object itself as
+                # ee.ComputedObject hashes its whole __dict__, and only one object is kept alive per class.
+                last = self._last
+                if last[0] is obj:
+                    return last[1]
+                instance = self.accessor(obj)
+                self._last = (obj, instance)
+                return instance
 
         # check if the accessor already exists for this class
         if hasattr(klass, name):
@@ -0,0 +1,299 @@
+"""A compact binary container of many expression graphs with cross-graph deduplication."""
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import mmap
+import os
+import struct
+from pathlib import Path
+from typing import Iterator
+
+import ee
+
+from .accessors import _register_extention
+from .ee_graph import _order, _rewrite
+
+MAGIC = b"\x89GEE"
+"The bytes opening and closing a .gee archive."
+
+VERSION = 2
+"The version of the .gee archive format. Version 1 is the plain JSON file written by older geetools versions."
+
+COMPRESSIONS = ["none", "gzip", "zstd"]
+"The compression codecs of the archive blocks, their position is the codec id stored in the header."
+
+_HEADER = struct.Struct("<4sBB2x")
+"Magic bytes, format version and codec id."
+
+_FOOTER = struct.Struct("<QQ4s")
+"Offset and length of the index followed by the magic bytes."
+
+_INLINE_BYTES = 64
+"The size of the smallest inline subgraph stored as a shared value."
+
+
+def _compress(data: bytes, compression: str, level: int | None = None) -> bytes:
+    """Compress a block with one of the :py:data:`COMPRESSIONS` codecs."""
+    if compression == "gzip":
+        return gzip.compress(data, compresslevel=9 if level is None else level, mtime=0)
+    elif compression == "zstd":
+        return _zstd().ZstdCompressor(level=3 if level is None else level).compress(data)
+    return data
+
+
+def _decompress(data: bytes, compression: str) -> bytes:
+    """Decompress a block compressed by :py:func:`_compress`."""
+    if compression == "gzip":
+        return gzip.decompress(data)
+    elif compression == "zstd":
+        return _zstd().ZstdDecompressor().decompress(data)
+    return data
+
+
+def _zstd():
+    """Import the optional ``zstandard`` package."""
+    try:
+        import zstandard
+    except ImportError as e:
+        raise ImportError("The zstd compression requires the zstandard package: pip install zstandard") from e
+    return zstandard
+
+
+def _canonical(node: dict) -> bytes:
+    """The compact and deterministic JSON representation of a value node."""
+    return json.dumps(node, sort_keys=True, separators=(",", ":")).encode()
+
+
+def _hash(expression: dict) -> tuple[str, dict[str, dict]]:
+    """Split an expression into values named after the hash of their content and of the values they reference.
+
+    The inline subgraphs larger than :py:data:`_INLINE_BYTES` are moved to their own value so identical
+    subgraphs get the same name whatever the graph they come from and are shared between the graphs of an
+    archive.
+
+    Returns:
+        The name of the result and the hashed values.
+    """
+    names: dict[str, str] = {}
+    values: dict[str, dict] = {}
+
+    def store(node: dict, content: bytes | None = None) -> str:
+        content = content or _canonical(node)
+        key = hashlib.blake2b(content, digest_size=12).hexdigest()
+        values[key] = node
+        return key
+
+    def visit(node: dict, hoist: bool = True) -> dict:
+        if "valueReference" in node:
+            return {"valueReference": names[node["valueReference"]]}
+        elif "functionDefinitionValue" in node:
+            definition = node["functionDefinitionValue"]
+            node = {"functionDefinitionValue": {**definition, "body": names[definition["body"]]}}
+        elif "argumentReference" not in node:
+            node = _rewrite(node, visit)
+        invocation = node.get("functionInvocationValue", {})
+        if "functionReference" in invocation:
+            reference = names[invocation["functionReference"]]
+            node = {"functionInvocationValue": {**invocation, "functionReference": reference}}
+        if hoist and len(content := _canonical(node)) >= _INLINE_BYTES:
+            return {"valueReference": store(node, content)}
+        return node
+
+    for name in _order(expression)[::-1]:
+        names[name] = store(visit(expression["values"][name], hoist=False))
+    return names[expression["result"]], values
+
+
+@_register_extention(ee.geetools)
+class GraphArchive:
+    """A .gee archive storing many :py:class:`ee.ComputedObject` graphs in a single file.
+
+    The archive is made of a header, a list of compressed blocks and a compressed index closed by a footer.
+    Every value of a graph is named after the hash of its content so a subgraph shared by several graphs (a
+    region, a preprocessing chain...) is stored once: adding a graph writes a single block containing only the
+    values that are not in the archive yet. The archive is read through a memory map and loading one graph only
+    decompresses the blocks it uses. In append mode the new blocks, index and footer are written after the
+    existing footer so the previous content of the archive stays readable until the archive is closed, and is
+    restored if the context is left on an error.
+
+    Parameters:
+        path: The path of the archive.
+        mode: ``"r"`` to read an existing archive, ``"w"`` to create a new one or ``"a"`` to add graphs to an
+            existing one.
+        compression: The codec of the blocks of a new archive, one of :py:data:`COMPRESSIONS`. ``"zstd"``
+            requires the ``zstandard`` package. Existing archives keep their codec.
+        level: The compression level, the codec default if not set.
+
+    Examples:
+        .. code-block:: python
+
+            import ee, geetools
+
+            ee.Initialize()
+
+            region = ee.Geometry.Point([0, 0]).buffer(1000)
+            collection = ee.ImageCollection("COPERNICUS/S2_SR_HARMONIZED").filterBounds(region)
+
+            with ee.geetools.GraphArchive("pipelines.gee", "w") as archive:
+                archive.add("count", collection.size())
+                archive.add("mean", collection.mean().clip(region))
+
+            with ee.geetools.GraphArchive("pipelines.gee") as archive:
+                print(archive.names())
+                print(archive["count"].getInfo())
+    """
+
+    def __init__(
+        self, path: os.PathLike, mode: str = "r", compression: str = "gzip", level: int | None = None
+    ):
+        """Open the archive file."""
+        if mode not in ["r", "w", "a"]:
+            raise ValueError(f"mode should be one of 'r', 'w' or 'a', not {mode!r}")
+        if compression not in COMPRESSIONS:
+            raise ValueError(f"compression should be one of {COMPRESSIONS}, not {compression!r}")
+        self.path, self.mode, self.compression, self.level = Path(path), mode, compression, level
+        self._graphs: dict[str, dict] = {}
+        self._blocks: list[tuple[int, int]] = []
+        self._cache: dict[int, dict[str, dict]] = {}
+        self._known: dict[str, int] = {}
+        self._map: mmap.mmap | None = None
+
+        if mode == "w":
+            self._file = self.path.open("wb")
+            self._file.write(_HEADER.pack(MAGIC, VERSION, COMPRESSIONS.index(compression)))
+            self._offset = _HEADER.size
+            return
+
+        self._file = self.path.open("rb" if mode == "r" else "r+b")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._offset = self._readIndex()
+        if mode == "a":
+            self._known = {h: i for i in range(len(self._blocks)) for h in self._block(i)}
+            self._map.close()
+            self._map = None
+            self._offset = self._end = self._file.seek(0, os.SEEK_END)
+
+    def __enter__(self):
+        """Use the archive as a context manager."""
+        return self
+
+    def __exit__(self, *args):
+        """Close the archive when leaving the context, an appended archive is restored on error."""
+        if args[0] is not None and self.mode == "a" and not self._file.closed:
+            self._file.truncate(self._end)
+            self._file.close()
+            return
+        self.close()
+
+    def __len__(self) -> int:
+        """The number of graphs of the archive."""
+        return len(self._graphs)
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the names of the graphs."""
+        return iter(self._graphs)
+
+    def __contains__(self, name: str) -> bool:
+        """Check if a graph is stored in the archive."""
+        return name in self._graphs
+
+    def __getitem__(self, name: str) -> ee.ComputedObject:
+        """Load a graph."""
+        return self.get(name)
+
+    def names(self) -> list[str]:
+        """The names of the graphs in the order they were added."""
+        return list(self._graphs)
+
+    def add(self, name: str, obj: ee.ComputedObject) -> GraphArchive:
+        """Add a graph to the archive.
+
+        The block of the graph is written immediately so the graphs of a pipeline can be streamed to the
+        archive without keeping them in memory.
+
+        Parameters:
+            name: The name of the graph in the archive.
+            obj: The object to store.
+
+        Returns:
+            The archive itself to chain the calls.
+        """
+        if self.mode == "r":
+            raise ValueError("The archive is opened in read mode.")
+        if name in self._graphs:
+            raise ValueError(f"A graph named {name!r} is already stored in the archive.")
+        result, values = _hash(ee.serializer.encode(obj))
+        new = {h: v for h, v in values.items() if h not in self._known}
+        if new:
+            content = json.dumps(new, separators=(",", ":")).encode()
+            self._blocks.append(self._write(content))
+            self._known.update(dict.fromkeys(new, len(self._blocks) - 1))
+        self._graphs[name] = {"result": result, "blocks": sorted({self._known[h] for h in values})}
+        return self
+
+    def get(self, name: str) -> ee.ComputedObject:
+        """Load a graph from the archive.
+
+        Parameters:
+            name: The name of the graph.
+
+        Returns:
+            The decoded object.
+        """
+        if name not in self._graphs:
+            raise KeyError(f"No graph named {name!r} in {self.path}, available graphs are {self.names()}")
+        graph, values = self._graphs[name], {}
+        for i in graph["blocks"]:
+            values.update(self._block(i))
+        return ee.deserializer.decodeCloudApi({"result": graph["result"], "values": values})
+
+    def items(self) -> Iterator[tuple[str, ee.ComputedObject]]:
+        """Iterate over the graphs of the archive, decoding them one at a time."""
+        for name in self._graphs:
+            yield name, self.get(name)
+
+    def close(self):
+        """Write the index of a new archive and close the file."""
+        if self._file.closed:
+            return
+        if self.mode != "r":
+            index = json.dumps({"graphs": self._graphs, "blocks": self._blocks}, separators=(",", ":"))
+            offset, length = self._write(index.encode())
+            self._file.write(_FOOTER.pack(offset, length, MAGIC))
+        if self._map is not None:
+            self._map.close()
+        self._file.close()
+
+    def _write(self, content: bytes) -> tuple[int, int]:
+        """Compress and append a block to the file, returning its offset and length."""
+        data = _compress(content, self.compression, self.level)
+        self._file.write(data)
+        offset, self._offset = self._offset, self._offset + len(data)
+        return offset, len(data)
+
+    def _read(self, offset: int, length: int) -> bytes:
+        """Read and decompress a block of the memory mapped file."""
+        assert self._map is not None
+        return _decompress(self._map[offset : offset + length], self.compression)
+
+    def _block(self, i: int) -> dict[str, dict]:
+        """Decode a block, keeping it in memory for the next graphs sharing it."""
+        if i not in self._cache:
+            self._cache[i] = json.loads(self._read(*self._blocks[i]))
+        return self._cache[i]
+
+    def _readIndex(self) -> int:
+        """Read the header and the index of an existing archive and return the offset of the index."""
+        assert self._map is not None
+        if len(self._map) < _HEADER.size + _FOOTER.size or not self._map[: len(MAGIC)] == MAGIC:
+            raise ValueError(f"{self.path} is not a .gee archive.")
+        _, version, codec = _HEADER.unpack(self._map[: _HEADER.size])
+        offset, length, magic = _FOOTER.unpack(self._map[-_FOOTER.size :])
+        if version > VERSION or magic != MAGIC:
+            raise ValueError(f"{self.path} is not a supported .gee archive (version {version}).")
+        self.compression = COMPRESSIONS[codec]
+        index = json.loads(self._read(offset, length))
+        self._graphs, self._blocks = index["graphs"], [tuple(b) for b in index["blocks"]]
+        return offset
@@ -10,6 +10,8 @@ from .accessors import register_class_accessor
 class ArrayAccessor:
     """Toolbox for the :py:class:`ee.Array` class."""
 
+    __slots__ = ("_obj",)
+
     def __init__(self, obj: ee.Array):
         """Initialize the Array class."""
         self._obj = obj
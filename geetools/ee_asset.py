@@ -11,6 +11,7 @@ import ee.data
 from ee._state import get_state
 
 from .accessors import _register_extention
+from .ee_executor import executor
 from .utils import format_description
 
 
@@ -195,7 +196,7 @@ class Asset(os.PathLike):
                 asset.exists()
         """
         try:
-            ee.data.getAsset(self.as_posix())
+            executor.execute(ee.data.getAsset, self.as_posix(), endpoint="metadata")
             return True
         except ee.EEException:
             if raised is True:
@@ -274,7 +275,7 @@ class Asset(os.PathLike):
         if self.is_folder():
             raise ValueError(f"Asset {self.as_posix()} is a folder.")
 
-        return int(ee.data.getAsset(self.as_posix())["sizeBytes"])
+        return int(executor.execute(ee.data.getAsset, self.as_posix(), endpoint="metadata")["sizeBytes"])
 
     def is_relative_to(self, other: os.PathLike) -> bool:
         """Return True if the asset is relative to another asset.
@@ -398,7 +399,7 @@ class Asset(os.PathLike):
                 asset.type
         """
         self.exists(raised=True)
-        return ee.data.getAsset(self.as_posix())["type"]
+        return executor.execute(ee.data.getAsset, self.as_posix(), endpoint="metadata")["type"]
 
     def is_project(self, raised: bool = False) -> bool:
         """Return ``True`` if the asset is a project.
@@ -469,12 +470,14 @@ class Asset(os.PathLike):
 
         # no need for recursion if recursive is false we directly return the result of th API call
         if recursive is False:
-            asset_ids = ee.data.listAssets({"parent": self.as_posix()})["assets"]
+            parent = {"parent": self.as_posix()}
+            asset_ids = executor.execute(ee.data.listAssets, parent, endpoint="metadata")["assets"]
             return [Asset(asset["id"]) for asset in asset_ids]
 
         # recursive function to get all the assets
         def _recursive_get(folder, asset_list):
-            for asset in ee.data.listAssets({"parent": str(folder)})["assets"]:
+            parent = {"parent": str(folder)}
+            for asset in executor.execute(ee.data.listAssets, parent, endpoint="metadata")["assets"]:
                 asset_list.append(Asset(asset["id"]))
                 if asset["type"] in ["FOLDER", "IMAGE_COLLECTION"] and recursive is True:
                     asset_list = _recursive_get(asset["id"], asset_list)
@@ -518,12 +521,12 @@ class Asset(os.PathLike):
         # 2 option either there is 1 single element in the list or all the parents are included
         # we need to walk it in reversed to make sure the parents are build first.
         for p in reversed(to_be_created):
-            ee.data.createFolder(p.as_posix())
+            executor.execute(ee.data.createFolder, p.as_posix(), endpoint="metadata")
 
         # now that all the parents are there, we can create the requested container
         if not self.exists():
             asset_type = "IMAGE_COLLECTION" if image_collection is True else "FOLDER"
-            ee.data.createAsset({"type": asset_type}, self.as_posix())
+            executor.execute(ee.data.createAsset, {"type": asset_type}, self.as_posix(), endpoint="metadata")
 
         return self
 
@@ -608,7 +611,7 @@ class Asset(os.PathLike):
 
         def delete(asset):
             output.append(str(asset))
-            dry_run is True or ee.data.deleteAsset(str(asset))
+            dry_run is True or executor.execute(ee.data.deleteAsset, str(asset), endpoint="metadata")
 
         is_container = self.is_folder() or self.is_image_collection()
         if recursive is True and is_container:
@@ -689,7 +692,7 @@ class Asset(os.PathLike):
 
             # if the asset is an image collection we need to copy the properties of the collection
             if self.is_image_collection():
-                original_dict = ee.data.getAsset(self.as_posix())
+                original_dict = executor.execute(ee.data.getAsset, self.as_posix(), endpoint="metadata")
                 props = original_dict["properties"]
                 if "startTime" in original_dict:
                     props["system:time_start"] = original_dict["startTime"]
@@ -702,7 +705,13 @@ class Asset(os.PathLike):
                 loc_asset = new_asset / asset._path.relative_to(self._path)
                 asset.copy(loc_asset, overwrite=overwrite)
         else:
-            ee.data.copyAsset(self.as_posix(), new_asset.as_posix(), allowOverwrite=True)
+            executor.execute(
+                ee.data.copyAsset,
+                self.as_posix(),
+                new_asset.as_posix(),
+                allowOverwrite=True,
+                endpoint="metadata",
+            )
 
         return new_asset
 
@@ -812,10 +821,12 @@ class Asset(os.PathLike):
         update_mask = [f"properties.{k}" for k in props]
 
         # we can now update the asset by setting both system and asset properties
-        ee.data.updateAsset(
+        executor.execute(
+            ee.data.updateAsset,
             asset_id=self.as_posix(),
             asset={**system, "properties": props},
             update_mask=list(system.keys()) + update_mask,
+            endpoint="metadata",
         )
 
         return self
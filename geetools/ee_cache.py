@@ -0,0 +1,266 @@
+"""A content-addressed cache materializing expensive intermediate results as Earth Engine assets."""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import time
+from typing import Any, Callable
+
+import ee
+import pandas as pd
+
+from .accessors import _register_extention
+from .ee_archive import _hash
+from .ee_executor import executor
+
+PROVENANCE = ["key", "algorithm", "label", "parameters", "version", "created", "lastUsed"]
+"The provenance fields stored in the ``geetools_<field>`` properties of the cached assets."
+
+EXPORT_PARAMETERS = ["region", "scale", "crs", "crsTransform", "maxPixels"]
+"The export parameters changing the content of a cached asset, they are part of its key."
+
+DONE_STATES = ["COMPLETED", "FAILED", "CANCELLED"]
+"The states of a finished export task."
+
+
+@_register_extention(ee.geetools)
+class AssetCache:
+    """A cache of :py:class:`ee.Image` and :py:class:`ee.ImageCollection` objects exported as assets.
+
+    Objects are identified by the hash of their graph, computed like the names of the values of a
+    :py:class:`ee.geetools.GraphArchive`, combined with the export parameters of :py:data:`EXPORT_PARAMETERS`
+    so the same object exported on another grid gets its own asset. The first time an object is materialized it is exported to an asset
+    of the cache folder named after its hash, the next times (in the same session or in a later run) the
+    object is replaced by the asset and the expensive intermediate computation is skipped. Each asset stores
+    its provenance in its properties and the least recently used assets are evicted when the cache grows
+    larger than a maximum size.
+
+    Parameters:
+        folder: The folder storing the cached assets. It should only be used by the cache.
+        maxBytes: The maximum total size of the cached assets kept by :py:meth:`evict`.
+        sleep: The function used to wait between two checks of the export tasks.
+
+    Examples:
+        .. code-block:: python
+
+            import ee, geetools
+
+            ee.Initialize()
+
+            cache = ee.geetools.AssetCache("projects/my-project/assets/cache", maxBytes=10 * 2**30)
+
+            region = ee.Geometry.Point([11.95, 45.34]).buffer(10000)
+            collection = ee.ImageCollection("COPERNICUS/S2_SR_HARMONIZED").filterBounds(region)
+            medoid = collection.filterDate("2020-01-01", "2021-01-01").geetools.medoid()
+
+            # the first run exports the medoid, the next ones read it from the cache
+            medoid = cache.materialize(medoid, "medoid 2020", region=region, scale=10)
+            ndvi = medoid.normalizedDifference(["B8", "B4"])
+    """
+
+    metrics: dict[str, int]
+    "The number of ``hits`` and ``misses`` of :py:meth:`materialize` and the number of ``evicted`` assets."
+
+    tasks: dict[str, list[ee.batch.Task]]
+    "The export tasks started by the cache, keyed by the hash of the exported object."
+
+    def __init__(
+        self, folder: os.PathLike, maxBytes: int | None = None, sleep: Callable[[float], Any] = time.sleep
+    ):
+        """Initialize an empty cache session."""
+        self.folder, self.maxBytes, self.sleep = ee.Asset(folder), maxBytes, sleep
+        self.metrics = {"hits": 0, "misses": 0, "evicted": 0}
+        self.tasks = {}
+
+    def key(self, obj: ee.ComputedObject, **kwargs) -> str:
+        """The hash of the graph of an object and of its export parameters.
+
+        Parameters:
+            obj: The object to identify.
+            **kwargs: The export parameters of the object, only the :py:data:`EXPORT_PARAMETERS` are used.
+
+        Returns:
+            The name of the cached asset of the object.
+        """
+        key = _hash(ee.serializer.encode(obj))[0]
+        parameters = self._parameters(**kwargs)
+        if not parameters:
+            return key
+        content = json.dumps({"graph": key, **parameters}, sort_keys=True, separators=(",", ":"))
+        return hashlib.blake2b(content.encode(), digest_size=12).hexdigest()
+
+    def materialize(
+        self, obj: ee.Image | ee.ImageCollection, label: str = "", wait: bool = False, **kwargs
+    ) -> ee.Image | ee.ImageCollection:
+        """Replace an object by its cached asset, exporting it on the first use.
+
+        Parameters:
+            obj: The image or the image collection to materialize.
+            label: A human readable description of the object stored in the provenance of the asset.
+            wait: Wait for the export to finish and return the asset instead of the object itself.
+            **kwargs: The parameters of :py:meth:`ee.batch.Export.image.toAsset` e.g. ``region``, ``scale`` or
+                ``crs``, used on the first use only.
+
+        Returns:
+            The cached asset if it exists, the object itself otherwise.
+        """
+        if not isinstance(obj, (ee.Image, ee.ImageCollection)):
+            raise TypeError(f"Only images and image collections can be cached, not {type(obj).__name__}.")
+        key = self.key(obj, **kwargs)
+        cached = self._lookup(type(obj), key)
+        if cached is not None:
+            self.metrics["hits"] += 1
+            (self.folder / key).setProperties(geetools_lastUsed=int(time.time() * 1000))
+            return cached
+
+        self.metrics["misses"] += 1
+        if key not in self.tasks:
+            self.tasks[key] = self._export(obj, key, label, **kwargs)
+        if wait is False:
+            return obj
+        self.wait([key])
+        return self._lookup(type(obj), key) or obj
+
+    def wait(self, keys: list[str] | None = None, timeout: float | None = None, interval: float = 30.0):
+        """Wait for the export tasks of the cache to finish.
+
+        Parameters:
+            keys: The hashes of the objects to wait for, all the exported objects if not set.
+            timeout: The maximum number of seconds to wait, no limit if not set.
+            interval: The number of seconds between two checks of the tasks.
+        """
+        tasks = [t for k in (keys or list(self.tasks)) for t in self.tasks.get(k, [])]
+        start = time.monotonic()
+        while True:
+            states = [executor.execute(t.status, endpoint="metadata")["state"] for t in tasks]
+            tasks = [t for t, s in zip(tasks, states) if s not in DONE_STATES]
+            if not tasks:
+                return
+            if timeout is not None and time.monotonic() - start > timeout:
+                raise TimeoutError(f"{len(tasks)} cache exports are still running after {timeout} seconds.")
+            self.sleep(interval)
+
+    def report(self) -> pd.DataFrame:
+        """The cached assets and their provenance.
+
+        Returns:
+            A table indexed by the hash of the cached objects with their ``type``, their size in ``bytes`` and
+            their provenance fields, the most recently used first.
+        """
+        columns = ["type", "bytes", *PROVENANCE[1:]]
+        entries = self._entries()
+        if not entries:
+            return pd.DataFrame(columns=columns).rename_axis("key")
+        table = pd.DataFrame(entries).set_index("key").rename_axis("key")[columns]
+        return table.sort_values("lastUsed", ascending=False)
+
+    def evict(self, maxBytes: int | None = None) -> list[ee.Asset]:
+        """Delete the least recently used assets until the cache is smaller than a maximum size.
+
+        Parameters:
+            maxBytes: The maximum total size of the cache, :py:attr:`maxBytes` if not set.
+
+        Returns:
+            The deleted assets.
+        """
+        maxBytes = self.maxBytes if maxBytes is None else maxBytes
+        if maxBytes is None:
+            raise ValueError("A maximum size is required to evict the cached assets.")
+        entries = sorted(self._entries(), key=lambda e: e["lastUsed"])
+        total, evicted = sum(e["bytes"] for e in entries), []
+        for entry in entries:
+            if total <= maxBytes:
+                break
+            asset = self.folder / entry["key"]
+            asset.delete(recursive=entry["type"] == "IMAGE_COLLECTION", dry_run=False)
+            total -= entry["bytes"]
+            evicted.append(asset)
+        self.metrics["evicted"] += len(evicted)
+        return evicted
+
+    def _parameters(self, **kwargs) -> dict[str, Any]:
+        """The normalized export parameters of :py:data:`EXPORT_PARAMETERS` that are set.
+
+        Server-side regions are replaced by the hash of their graph, numbers are converted to floats or
+        integers and the projection code is upper cased so equivalent parameters give the same key.
+        """
+        parameters = {k: kwargs[k] for k in EXPORT_PARAMETERS if kwargs.get(k) is not None}
+        if isinstance(parameters.get("region"), ee.ComputedObject):
+            parameters["region"] = _hash(ee.serializer.encode(parameters["region"]))[0]
+        if "scale" in parameters:
+            parameters["scale"] = float(parameters["scale"])
+        if "crs" in parameters:
+            parameters["crs"] = str(parameters["crs"]).upper()
+        if "crsTransform" in parameters:
+            parameters["crsTransform"] = [float(v) for v in parameters["crsTransform"]]
+        if "maxPixels" in parameters:
+            parameters["maxPixels"] = int(parameters["maxPixels"])
+        return parameters
+
+    def _provenance(self, obj: ee.ComputedObject, key: str, label: str, **kwargs) -> dict[str, Any]:
+        """The properties describing how a cached asset was computed."""
+        from . import __version__
+
+        expression = ee.serializer.encode(obj)
+        invocation = expression["values"][expression["result"]].get("functionInvocationValue", {})
+        parameters = json.dumps(self._parameters(**kwargs), sort_keys=True, separators=(",", ":"))
+        now = int(time.time() * 1000)
+        fields = [key, invocation.get("functionName", ""), label, parameters, __version__, now, now]
+        return {f"geetools_{name}": value for name, value in zip(PROVENANCE, fields)}
+
+    def _lookup(self, klass: type, key: str) -> ee.Image | ee.ImageCollection | None:
+        """Load the cached asset of an object if it exists and is complete."""
+        asset = self.folder / key
+        try:
+            info = executor.execute(ee.data.getAsset, asset.as_posix(), endpoint="metadata")
+        except ee.EEException:
+            return None
+        if klass is ee.Image and info["type"] == "IMAGE":
+            return ee.Image(asset.as_posix())
+        elif klass is ee.ImageCollection and info["type"] == "IMAGE_COLLECTION":
+            size = info.get("properties", {}).get("geetools_size")
+            if size is not None and len(asset.iterdir()) == int(size):
+                return ee.ImageCollection(asset.as_posix())
+        return None
+
+    def _export(
+        self, obj: ee.Image | ee.ImageCollection, key: str, label: str, **kwargs
+    ) -> list[ee.batch.Task]:
+        """Start the export tasks of an object to the cache folder."""
+        self.folder.mkdir(parents=True, exist_ok=True)
+        provenance, asset = self._provenance(obj, key, label, **kwargs), self.folder / key
+        if isinstance(obj, ee.Image):
+            description = f"geetools_cache_{key}"
+            tasks = [
+                ee.batch.Export.image.toAsset(obj.set(provenance), description, asset.as_posix(), **kwargs)
+            ]
+        else:
+            tasks = ee.batch.Export.geetools.imagecollection.toAsset(
+                obj, "system:index", f"geetools_cache_{key}", asset.as_posix(), **kwargs
+            )
+            asset.setProperties(**provenance, geetools_size=len(tasks))
+        for task in tasks:
+            executor.execute(task.start, endpoint="export")
+        return tasks
+
+    def _entries(self) -> list[dict[str, Any]]:
+        """The size, type and provenance of the assets of the cache folder."""
+        if not self.folder.exists():
+            return []
+        entries = []
+        for asset in self.folder.iterdir():
+            if not re.fullmatch("[0-9a-f]{24}", asset.name):
+                continue
+            info = executor.execute(ee.data.getAsset, asset.as_posix(), endpoint="metadata")
+            size = int(info.get("sizeBytes", 0))
+            if info["type"] == "IMAGE_COLLECTION":
+                size = sum(child.st_size for child in asset.iterdir())
+            properties = info.get("properties", {})
+            entry = {name: properties.get(f"geetools_{name}") for name in PROVENANCE}
+            updated = pd.Timestamp(info.get("updateTime", 0)).value // 10**6
+            entry.update(key=asset.name, type=info["type"], bytes=size)
+            entry["lastUsed"] = int(properties.get("geetools_lastUsed", updated))
+            entries.append(entry)
+        return entries
@@ -7,6 +7,7 @@ from pathlib import Path
 
 import ee
 
+from . import ee_archive
 from .accessors import _register_extention
 
 
@@ -44,13 +45,15 @@ def isInstance(self, klass: type) -> ee.Number:
 
 # -- .gee files ----------------------------------------------------------------
 @_register_extention(ee.ComputedObject)  # type: ignore
-def save(self, path: os.PathLike) -> Path:
+def save(self, path: os.PathLike, compression: str = "gzip") -> Path:
     """Save a :py:class:`ee.ComputedObject` to a .gee file.
 
-    The file contains the JSON representation of the object. It still needs to be computed via :py:meth:`ee.ComputedObject.getInfo` to be used.
+    The file is a :py:class:`ee.geetools.GraphArchive` containing the compressed graph of the object, named after
+    the file stem. It still needs to be computed via :py:meth:`ee.ComputedObject.getInfo` to be used.
 
     Parameters:
         path: The path to save the object to.
+        compression: The compression codec, one of ``"none"``, ``"gzip"`` or ``"zstd"``.
 
     Returns:
         The path to the saved file.
@@ -70,20 +73,25 @@ def save(self, path: os.PathLike) -> Path:
             with TemporaryDirectory() as tmp:
                 file = Path(tmp) / "test.gee"
                 img.save(file)
-                print(file.read_text())
+                print(f"{file.stat().st_size} bytes")
     """
     path = Path(path).with_suffix(".gee")
-    path.write_text(json.dumps(ee.serializer.encode(self)))
+    with ee.geetools.GraphArchive(path, "w", compression) as archive:
+        archive.add(path.stem, self)
     return path
 
 
 @staticmethod  # type: ignore
 @_register_extention(ee.ComputedObject)  # type: ignore
-def open(path: os.PathLike) -> ee.ComputedObject:
+def open(path: os.PathLike, name: str | None = None) -> ee.ComputedObject:
     """Open a .gee file as a ComputedObject.
 
+    The plain JSON files written by older versions of geetools are still supported.
+
     Parameters:
         path: The path to the file to open.
+        name: The name of the graph to load from a :py:class:`ee.geetools.GraphArchive` containing several
+            graphs. Not needed when the file contains a single graph.
 
     Returns:
         The ComputedObject instance.
@@ -109,7 +117,15 @@ def open(path: os.PathLike) -> ee.ComputedObject:
     if (path := Path(path)).suffix != ".gee":
         raise ValueError("File must be a .gee file")
 
-    return ee.deserializer.decode(json.loads(path.read_text()))
+    with path.open("rb") as f:
+        legacy = f.read(len(ee_archive.MAGIC)) != ee_archive.MAGIC
+    if legacy:
+        return ee.deserializer.decode(json.loads(path.read_text()))
+
+    with ee.geetools.GraphArchive(path) as archive:
+        if name is None and len(archive) != 1:
+            raise ValueError(f"{path} contains several graphs, select one of {archive.names()} with name.")
+        return archive.get(name or archive.names()[0])
 
 
 # placeholder classes for the isInstance method --------------------------------
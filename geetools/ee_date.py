@@ -7,6 +7,8 @@ from zoneinfo import ZoneInfo
 import ee
 
 from .accessors import register_class_accessor
+from .ee_evaluator import foldable
+from .ee_executor import executor
 
 EE_EPOCH = datetime(1970, 1, 1, 0, 0, 0)
 
@@ -15,6 +17,8 @@ EE_EPOCH = datetime(1970, 1, 1, 0, 0, 0)
 class DateAccessor:
     """Toolbox for the :py:class:`ee.Date` class."""
 
+    __slots__ = ("_obj",)
+
     def __init__(self, obj: ee.Date):
         """Initialize the Date class."""
         self._obj = obj
@@ -45,6 +49,7 @@ class DateAccessor:
         return ee.Date(EE_EPOCH.isoformat()).advance(number, unit)
 
     @classmethod
+    @foldable
     def fromDOY(cls, doy: int, year: int) -> ee.Date:
         """Create a date from a day of year and a year.
 
@@ -128,7 +133,7 @@ class DateAccessor:
 
         """
         tz = tz if isinstance(tz, ZoneInfo) else ZoneInfo(tz)
-        timestamp = self._obj.millis().getInfo() / 1000
+        timestamp = executor.execute(self._obj.millis().getInfo) / 1000
         return datetime.fromtimestamp(timestamp, tz=ZoneInfo("UTC")).astimezone(tz)
 
     def getUnitSinceEpoch(self, unit: str = "day") -> ee.Number:
@@ -2,24 +2,34 @@
 from __future__ import annotations
 
 import ee
+import numpy as np
 
 from .accessors import register_class_accessor
+from .ee_evaluator import _DateRange, _evaluate, _Unfoldable, foldable
 
 
 @register_class_accessor(ee.DateRange, "geetools")
 class DateRangeAccessor:
     """Toolbox for the :py:class:`ee.DateRange` class."""
 
+    __slots__ = ("_obj",)
+
     def __init__(self, obj: ee.DateRange):
         """Initialize the DateRange class."""
         self._obj = obj
 
     # -- date range operations -------------------------------------------------
+    @foldable
     def split(self, interval: int | ee.Number, unit: str = "day") -> ee.List:
         """Convert a :py:class:`ee.DateRange` to a list of :py:class:`ee.DateRange`.
 
         The DateRange will be split in multiple DateRanges of the specified interval and Unit.
         For example "1", "day". if the end date is not included the last dateRange length will be adapted.
+        Months and years follow the calendar like :py:meth:`ee.Date.advance`, they are not approximated by a
+        fixed number of days.
+
+        When the DateRange and the interval are known on the client, the boundaries are computed locally and
+        sent as a single literal list. Otherwise they are computed on the server.
 
         Parameters:
             interval: The interval to split the DateRange
@@ -40,16 +50,31 @@ class DateRangeAccessor:
                 dateList.getInfo()
         """
         self.check_unit(unit)
-        interval = ee.Number(interval).toInt().multiply(self.unitMillis(unit))
-        start, end = self._obj.start().millis(), self._obj.end().millis()
-
-        timestampList = ee.List.sequence(start, end, interval)
-        timestampList = timestampList.add(ee.Number(end).toFloat()).distinct()
-        indexList = ee.List.sequence(0, timestampList.size().subtract(2))
 
-        return indexList.map(
-            lambda i: ee.DateRange(timestampList.get(i), timestampList.get(ee.Number(i).add(1)))
-        )
+        # the boundaries of a client-side range are computed once and shipped as a single literal list
+        try:
+            dateRange, step = _evaluate(self._obj, {}), _evaluate(ee.Number(interval), {})
+            if not isinstance(dateRange, _DateRange) or int(step) != step or step <= 0:
+                raise _Unfoldable("Only client-side ranges split by a positive integer are computed locally")
+        except _Unfoldable:
+            return self._splitServer(interval, unit)
+        bounds = _boundaries(dateRange.start.millis, dateRange.end.millis, int(step), unit)
+        bounds = ee.List(bounds.tolist())
+        pairs = bounds.slice(0, -1).zip(bounds.slice(1))
+        return pairs.map(lambda p: ee.DateRange(ee.List(p).get(0), ee.List(p).get(1)))
+
+    def _splitServer(self, interval: int | ee.Number, unit: str) -> ee.List:
+        """Split a server-side :py:class:`ee.DateRange` with the calendar aware ``ee.Date.advance``."""
+        interval = ee.Number(interval).toInt()
+        start, end = self._obj.start(), self._obj.end()
+        count = end.difference(start, unit).divide(interval).ceil()
+
+        def toRange(i):
+            rangeStart = start.advance(ee.Number(i).multiply(interval), unit)
+            rangeEnd = rangeStart.advance(interval, unit).millis().min(end.millis())
+            return ee.DateRange(rangeStart, rangeEnd)
+
+        return ee.List.sequence(0, count.subtract(1)).map(toRange)
 
     # -- utils -----------------------------------------------------------------
     @staticmethod
@@ -77,3 +102,25 @@ class DateRangeAccessor:
             "year": 1000 * 60 * 60 * 24 * 365,
         }
         return ee.Number(millis[unit])
+
+
+def _boundaries(start: int, end: int, interval: int, unit: str) -> np.ndarray:
+    """The boundaries of the intervals splitting a time range, in milliseconds since the epoch.
+
+    Months and years are advanced from the start date like ``ee.Date.advance``: the day of the month is kept and
+    clamped to the last day of the shorter months, the last interval is cut at the end of the range.
+    """
+    if unit in ["month", "year"]:
+        date = np.datetime64(start, "ms")
+        month, day = date.astype("datetime64[M]"), date.astype("datetime64[D]")
+        months = (np.datetime64(end, "ms").astype("datetime64[M]") - month).astype(int)
+        step = interval * (12 if unit == "year" else 1)
+        months = month + np.arange(0, months // step + 2) * step
+        lengths = (months + 1).astype("datetime64[D]") - months.astype("datetime64[D]")
+        dayOfMonth = np.minimum(day - month.astype("datetime64[D]"), lengths - 1)
+        bounds = (months.astype("datetime64[D]") + dayOfMonth + (date - day)).astype("int64")
+    else:
+        millis = {"second": 1000, "minute": 60000, "hour": 3600000, "day": 86400000}
+        bounds = np.arange(start, end, interval * millis[unit], dtype="int64")
+    bounds = bounds[bounds < end]
+    return np.append(bounds, np.int64(end))
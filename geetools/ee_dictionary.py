@@ -1,22 +1,31 @@
 """Extra methods for the :py:class:`ee.Dictionary` class."""
+
 from __future__ import annotations
 
-from typing import Literal
+from typing import TYPE_CHECKING, Literal
 
 import ee
+import pandas as pd
 
 from .accessors import register_class_accessor
+from .ee_evaluator import Evaluator, foldable
+
+if TYPE_CHECKING:
+    import pyarrow
 
 
 @register_class_accessor(ee.Dictionary, "geetools")
 class DictionaryAccessor:
     """Toolbox for the :py:class:`ee.Dictionary` class."""
 
+    __slots__ = ("_obj",)
+
     def __init__(self, obj: ee.Dictionary):
         """Initialize the Dictionary class."""
         self._obj = obj
 
     # -- alternative constructor -----------------------------------------------
+    @foldable
     def fromPairs(self, list: list | ee.List) -> ee.Dictionary:
         """Create a dictionary from a list of ``[[key, value], ...]]`` pairs.
 
@@ -43,6 +52,7 @@ class DictionaryAccessor:
         return ee.Dictionary.fromLists(keys, values)
 
     # -- dictionary operations -------------------------------------------------
+    @foldable
     def sort(self) -> ee.Dictionary:
         """Sort the dictionary by keys in ascending order.
 
@@ -64,6 +74,7 @@ class DictionaryAccessor:
         values = orderededKeys.map(lambda key: self._obj.get(key))
         return ee.Dictionary.fromLists(orderededKeys, values)
 
+    @foldable
     def getMany(self, list: list | ee.List) -> ee.List:
         """Extract values from a list of keys.
 
@@ -184,12 +195,16 @@ class DictionaryAccessor:
             props = ee.Dictionary(value).combine(index)
             return ee.Feature(None, props)
 
+        # the column names are built once for the longest list and sliced by every row
+        sizes = self._obj.values().map(lambda value: ee.List(value).size()).add(0)
+        size = ee.Number(sizes.reduce(ee.Reducer.max()))
+        columns = ee.List.sequence(0, size).slice(0, size)
+        columns = columns.map(lambda k: ee.String("value_").cat(ee.Number(k).toInt()))
+
         def features_from_list(key, value) -> ee.Feature:
             index = {"system:index": ee.String(key)}
             values = ee.List(value)
-            columns = ee.List.sequence(0, values.size().subtract(1))
-            columns = columns.map(lambda k: ee.String("value_").cat(ee.Number(k).toInt()))
-            props = ee.Dictionary.fromLists(columns, values).combine(index)
+            props = ee.Dictionary.fromLists(columns.slice(0, values.size()), values).combine(index)
             return ee.Feature(None, props)
 
         def features_from_any(key, value) -> ee.Feature:
@@ -203,3 +218,67 @@ class DictionaryAccessor:
         }
         features = self._obj.map(make_features[valueType]).values()
         return ee.FeatureCollection(features)
+
+    def toDataFrame(
+        self,
+        valueType: Literal["dict", "list", "value"] = "value",
+        backend: Literal["pandas", "arrow"] = "pandas",
+    ) -> pd.DataFrame | pyarrow.Table:
+        """Fetch a :py:class:`ee.Dictionary` and convert it to a client-side table.
+
+        The table has the same columns as :py:meth:`toTable` but it is built on the client from the fetched
+        dictionary, in a single vectorized operation, so no :py:class:`ee.FeatureCollection` is computed on
+        the server. Use it instead of ``toTable().getInfo()`` when the dictionary is fetched anyway, e.g. for
+        the large reductions of :py:meth:`ee.ImageCollection.geetools.datesByRegions`. Dictionaries that only
+        contain client-side values are converted without any request.
+
+        Parameters:
+            valueType: this will define how to process the values, see :py:meth:`toTable`.
+            backend: ``"pandas"`` for a :py:class:`pandas.DataFrame` indexed by the keys of the dictionary or
+                ``"arrow"`` for a :py:class:`pyarrow.Table` with the keys in the ``system:index`` column.
+                ``"arrow"`` requires the ``pyarrow`` package.
+
+        Returns:
+            The table with one row per key of the dictionary.
+
+        Examples:
+            .. jupyter-execute::
+
+                import ee, geetools
+                from geetools.utils import initialize_documentation
+
+                initialize_documentation()
+
+                d = ee.Dictionary({
+                  "Argentina": [12, 278.289196625],
+                  "Armenia": [13, 3.13783139285],
+                })
+                d.geetools.toDataFrame("list")
+        """
+        if valueType not in ["dict", "list", "value"]:
+            raise ValueError(f"valueType should be one of 'dict', 'list' or 'value', not {valueType!r}")
+        if backend not in ["pandas", "arrow"]:
+            raise ValueError(f"backend should be one of 'pandas' or 'arrow', not {backend!r}")
+
+        # Earth Engine dictionaries are sorted by key, folded client-side ones keep their insertion order
+        data = dict(sorted(Evaluator().evaluate(self._obj).items()))
+        if valueType == "value":
+            table = pd.Series(data, name="value", dtype=None if data else object).to_frame()
+        else:
+            table = pd.DataFrame.from_dict(data, orient="index")
+        if valueType == "list":
+            table.columns = [f"value_{i}" for i in range(len(table.columns))]
+        table = table.rename_axis("system:index")
+
+        if backend == "arrow":
+            return _pyarrow().Table.from_pandas(table.reset_index(), preserve_index=False)
+        return table
+
+
+def _pyarrow():
+    """Import the optional ``pyarrow`` package."""
+    try:
+        import pyarrow
+    except ImportError as e:
+        raise ImportError("The arrow backend requires the pyarrow package: pip install pyarrow") from e
+    return pyarrow
@@ -0,0 +1,567 @@
+"""A client-side evaluator folding the Earth Engine objects built only from literal values."""
+from __future__ import annotations
+
+import calendar
+import functools
+import math
+import re
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable
+
+import ee
+
+from .accessors import _register_extention
+from .ee_executor import executor
+
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+"The origin of the Earth Engine timestamps."
+
+MONTHS = ["January", "February", "March", "April", "May", "June"]
+MONTHS += ["July", "August", "September", "October", "November", "December"]
+"The english names of the months used by the Joda date formatter."
+
+DAYS = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+"The english names of the days used by the Joda date formatter."
+
+
+class _Unfoldable(Exception):
+    """Raised when a part of the graph cannot be evaluated on the client."""
+
+
+@dataclass(frozen=True)
+class _Date:
+    """A client-side :py:class:`ee.Date` stored as milliseconds since the epoch in UTC."""
+
+    millis: int
+
+    @property
+    def datetime(self) -> datetime:
+        """The date as a timezone aware python datetime."""
+        return EPOCH + timedelta(milliseconds=self.millis)
+
+    @classmethod
+    def fromDatetime(cls, date: datetime) -> _Date:
+        """Create a date from a timezone aware python datetime."""
+        return cls((date - EPOCH) // timedelta(milliseconds=1))
+
+
+@dataclass(frozen=True)
+class _DateRange:
+    """A client-side :py:class:`ee.DateRange`."""
+
+    start: _Date
+    end: _Date
+
+
+# -- helpers -------------------------------------------------------------------
+
+
+def _toDate(value: Any) -> _Date:
+    """Cast a number of milliseconds, an ISO string or a date into a date."""
+    if isinstance(value, _Date):
+        return value
+    elif isinstance(value, (int, float)) and not isinstance(value, bool):
+        return _Date(int(value))
+    elif isinstance(value, str) and re.fullmatch(r"\d{4}-\d{2}-\d{2}(T\d{2}:\d{2}(:\d{2})?)?", value):
+        return _Date.fromDatetime(datetime.fromisoformat(value).replace(tzinfo=timezone.utc))
+    raise _Unfoldable(f"Cannot parse {value!r} as a date")
+
+
+def _toString(value: Any) -> str:
+    """Convert a value to a string the same way as the server."""
+    if isinstance(value, str):
+        return value
+    elif isinstance(value, int) and not isinstance(value, bool):
+        return str(value)
+    # the server formatting of float and other objects is not reproduced
+    raise _Unfoldable(f"Cannot convert {value!r} to a string")
+
+
+def _number(value: Any) -> int | float:
+    """Check that a value is a number."""
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise _Unfoldable(f"{value!r} is not a number")
+    return value
+
+
+def _integer(value: Any) -> int:
+    """Check that a value is a number and truncate it to an integer."""
+    return int(_number(value))
+
+
+def _flatten(values: list) -> list:
+    """Flatten nested lists recursively."""
+    return [v for e in values for v in (_flatten(e) if isinstance(e, list) else [e])]
+
+
+def _distinct(values: list) -> list:
+    """Drop the duplicated values keeping the first occurrences."""
+    output: list = []
+    for value in values:
+        if value not in output:
+            output.append(value)
+    return output
+
+
+def _sequence(start, end=None, step=None, count=None) -> list:
+    """Reproduce ``ee.List.sequence``."""
+    start, step = _number(start), 1 if step is None else _number(step)
+    if step == 0 or (end is None and count is None):
+        raise _Unfoldable("Invalid sequence")
+    end = start + (_number(count) - 1) * step if end is None else _number(end)
+    size = math.floor((end - start) / step) + 1
+    return [start + i * step for i in range(max(size, 0))]
+
+
+def _split(string, regex, flags=None) -> list:
+    """Reproduce the Java split dropping the trailing empty strings."""
+    if regex == "" or flags:
+        raise _Unfoldable("Unsupported split")
+    parts = re.split(regex, string)
+    while parts and parts[-1] == "":
+        parts.pop()
+    return parts
+
+
+def _match(input, regex, flags=None) -> list:
+    """Reproduce the Javascript match: all the matches with ``"g"``, the first one and its groups otherwise."""
+    if flags not in [None, "", "g"]:
+        raise _Unfoldable("Unsupported flags")
+    if flags == "g":
+        return [m.group(0) for m in re.finditer(regex, input)]
+    m = re.search(regex, input)
+    return [] if m is None else [m.group(0), *m.groups()]
+
+
+def _replace(input, regex, replacement, flags=None) -> str:
+    """Reproduce the Javascript replace for plain replacement strings."""
+    if flags not in [None, "", "g"] or "$" in replacement:
+        raise _Unfoldable("Unsupported replacement")
+    return re.sub(regex, lambda _: replacement, input, count=0 if flags == "g" else 1)
+
+
+def _compareTo(string1, string2) -> int:
+    """Reproduce the Java string comparison."""
+    for a, b in zip(string1, string2):
+        if a != b:
+            return ord(a) - ord(b)
+    return len(string1) - len(string2)
+
+
+def _formatNumber(number, pattern=None) -> str:
+    """Reproduce the Java number formatting for the usual patterns."""
+    pattern = "%s" if pattern is None else pattern
+    conversion = re.fullmatch(r"%[-+0 ,]*\d*(\.\d+)?([dfes])", pattern)
+    if conversion is None or (conversion.group(2) == "d" and isinstance(number, float)):
+        raise _Unfoldable(f"Unsupported pattern {pattern}")
+    if conversion.group(2) == "s":
+        return _toString(number)
+    return pattern % number
+
+
+def _advance(date, delta, unit, timeZone=None) -> _Date:
+    """Reproduce ``ee.Date.advance`` in UTC, the months and years being clamped to the end of the month."""
+    if timeZone is not None:
+        raise _Unfoldable("Time zones are not supported")
+    seconds = {"second": 1, "minute": 60, "hour": 3600, "day": 86400, "week": 604800}
+    if unit in seconds:
+        return _Date(date.millis + round(_number(delta) * seconds[unit] * 1000))
+    if unit not in ["month", "year"] or int(delta) != delta:
+        raise _Unfoldable(f"Cannot advance {delta} {unit}")
+    d = date.datetime
+    months = d.year * 12 + d.month - 1 + int(delta) * (12 if unit == "year" else 1)
+    year, month = divmod(months, 12)
+    day = min(d.day, calendar.monthrange(year, month + 1)[1])
+    return _Date.fromDatetime(d.replace(year=year, month=month + 1, day=day))
+
+
+def _fromYMD(year, month, day, timeZone=None) -> _Date:
+    """Reproduce ``ee.Date.fromYMD`` in UTC."""
+    if timeZone is not None:
+        raise _Unfoldable("Time zones are not supported")
+    start = datetime(_integer(year), 1, 1, tzinfo=timezone.utc)
+    date = _advance(_Date.fromDatetime(start), _integer(month) - 1, "month")
+    return _Date(date.millis + (_integer(day) - 1) * 86400000)
+
+
+def _formatDate(date, format=None, timeZone=None) -> str:
+    """Reproduce the Joda date formatting for the usual patterns in UTC."""
+    if format is None or timeZone is not None:
+        raise _Unfoldable("Only explicit formats in UTC are supported")
+    d = date.datetime
+    fields = {
+        "y": d.year,
+        "Y": d.year,
+        "M": d.month,
+        "d": d.day,
+        "D": d.timetuple().tm_yday,
+        "H": d.hour,
+        "m": d.minute,
+        "s": d.second,
+    }
+    output = []
+    for m in re.finditer(r"'([^']*)'|(([a-zA-Z])\3*)|([^a-zA-Z'])", format):
+        quoted, token, letter, literal = m.group(1), m.group(2), m.group(3), m.group(4)
+        if quoted is not None:
+            output.append(quoted or "'")
+        elif literal is not None:
+            output.append(literal)
+        elif letter in "yY" and len(token) == 2:
+            output.append(f"{d.year % 100:02d}")
+        elif letter == "M" and len(token) >= 3:
+            output.append(MONTHS[d.month - 1] if len(token) > 3 else MONTHS[d.month - 1][:3])
+        elif letter == "E":
+            output.append(DAYS[d.weekday()] if len(token) > 3 else DAYS[d.weekday()][:3])
+        elif letter in fields:
+            output.append(str(fields[letter]).zfill(len(token)))
+        else:
+            raise _Unfoldable(f"Unsupported date pattern {token}")
+    return "".join(output)
+
+
+def _objectType(value) -> str:
+    """Reproduce ``ee.Algorithms.ObjectType``."""
+    types = {str: "String", int: "Integer", float: "Float", list: "List", dict: "Dictionary", _Date: "Date"}
+    if type(value) not in types:
+        raise _Unfoldable(f"Unknown type {type(value)}")
+    return types[type(value)]
+
+
+def _get(values, index):
+    """Get an element of a list, negative indices counting from the end."""
+    return values[_integer(index)]
+
+
+def _set(values, index, element):
+    """Replace an element of a list."""
+    values = list(values)
+    values[_integer(index)] = element
+    return values
+
+
+def _slice(values, start, end=None, step=None):
+    """Slice a list or a string."""
+    end = None if end is None else _integer(end)
+    return values[_integer(start) : end : None if step is None else _integer(step)]
+
+
+def _replaceFirst(values, oldval, newval):
+    """Replace the first occurrence of a value in a list."""
+    values = list(values)
+    if oldval in values:
+        values[values.index(oldval)] = newval
+    return values
+
+
+def _dictionaryGet(dictionary, key, defaultValue=None):
+    """Get a value of a dictionary falling back to the default value if any."""
+    if key in dictionary:
+        return dictionary[key]
+    elif defaultValue is not None:
+        return defaultValue
+    raise _Unfoldable(f"Missing key {key}")
+
+
+def _fromLists(keys, values):
+    """Create a dictionary from the keys and values lists."""
+    if len(keys) != len(values) or not all(isinstance(k, str) for k in keys):
+        raise _Unfoldable("Invalid dictionary")
+    return dict(sorted(zip(keys, values)))
+
+
+def _date(value, timeZone=None) -> _Date:
+    """Create a date in UTC."""
+    if timeZone is not None:
+        raise _Unfoldable("Time zones are not supported")
+    return _toDate(value)
+
+
+def _dateRange(start, end=None, timeZone=None):
+    """Create a date range from 2 dates or cast a date range."""
+    if isinstance(start, _DateRange) and end is None and timeZone is None:
+        return start
+    elif end is None or timeZone is not None:
+        raise _Unfoldable("Only complete date ranges in UTC are supported")
+    return _DateRange(_toDate(start), _toDate(end))
+
+
+ALGORITHMS: dict[str, Callable] = {
+    # lists
+    "List.add": lambda list, element: [*list, element],
+    "List.cat": lambda list, other: [*list, *other],
+    "List.contains": lambda list, element: int(element in list),
+    "List.distinct": lambda list: _distinct(list),
+    "List.flatten": lambda list: _flatten(list),
+    "List.get": lambda list, index: _get(list, index),
+    "List.indexOf": lambda list, element: list.index(element) if element in list else -1,
+    "List.join": lambda list, separator="": _toString(separator).join(_toString(e) for e in list),
+    "List.removeAll": lambda list, other: [e for e in list if e not in other],
+    "List.replace": lambda list, oldval, newval: _replaceFirst(list, oldval, newval),
+    "List.reverse": lambda list: list[::-1],
+    "List.sequence": _sequence,
+    "List.set": lambda list, index, element: _set(list, index, element),
+    "List.size": lambda list: len(list),
+    "List.slice": lambda list, start, end=None, step=None: _slice(list, start, end, step),
+    "List.sort": lambda list, keys=None: (
+        sorted(list) if keys is None else [e for _, e in sorted(zip(keys, list))]
+    ),
+    "List.zip": lambda list, other: [[a, b] for a, b in zip(list, other)],
+    # strings
+    "String": lambda input: _toString(input),
+    "String.cat": lambda string1, string2: _toString(string1) + _toString(string2),
+    "String.compareTo": _compareTo,
+    "String.match": _match,
+    "String.replace": _replace,
+    "String.slice": lambda string, start, end=None: _slice(string, start, end),
+    "String.split": _split,
+    # numbers
+    "Number.add": lambda left, right: _number(left) + _number(right),
+    "Number.and": lambda left, right: int(bool(_number(left)) and bool(_number(right))),
+    "Number.divide": lambda left, right: _number(left) / _number(right),
+    "Number.eq": lambda left, right: int(_number(left) == _number(right)),
+    "Number.floor": lambda input: math.floor(_number(input)),
+    "Number.format": _formatNumber,
+    "Number.gt": lambda left, right: int(_number(left) > _number(right)),
+    "Number.gte": lambda left, right: int(_number(left) >= _number(right)),
+    "Number.int": lambda input: _integer(input),
+    "Number.lt": lambda left, right: int(_number(left) < _number(right)),
+    "Number.lte": lambda left, right: int(_number(left) <= _number(right)),
+    "Number.max": lambda left, right: max(_number(left), _number(right)),
+    "Number.min": lambda left, right: min(_number(left), _number(right)),
+    "Number.mod": lambda left, right: type(left * right)(math.fmod(_number(left), _number(right))),
+    "Number.multiply": lambda left, right: _number(left) * _number(right),
+    "Number.neq": lambda left, right: int(_number(left) != _number(right)),
+    "Number.not": lambda input: int(not _number(input)),
+    "Number.or": lambda left, right: int(bool(_number(left)) or bool(_number(right))),
+    "Number.subtract": lambda left, right: _number(left) - _number(right),
+    "Number.toFloat": lambda input: float(_number(input)),
+    "Number.toInt": lambda input: _integer(input),
+    # dictionaries
+    "Dictionary": lambda input=None: dict(sorted((input or {}).items())),
+    "Dictionary.combine": lambda first, second, overwrite=True: dict(
+        sorted(({**first, **second} if overwrite else {**second, **first}).items())
+    ),
+    "Dictionary.fromLists": _fromLists,
+    "Dictionary.get": _dictionaryGet,
+    "Dictionary.keys": lambda dictionary: sorted(dictionary),
+    "Dictionary.values": lambda dictionary, keys=None: [dictionary[k] for k in (keys or sorted(dictionary))],
+    # dates
+    "Date": _date,
+    "Date.advance": _advance,
+    "Date.format": _formatDate,
+    "Date.fromYMD": _fromYMD,
+    "Date.millis": lambda date: date.millis,
+    "DateRange": _dateRange,
+    "DateRange.end": lambda dateRange: dateRange.end,
+    "DateRange.start": lambda dateRange: dateRange.start,
+    # algorithms
+    "ObjectType": lambda value: _objectType(value),
+}
+"The Earth Engine algorithms reproduced on the client, keyed by their server name."
+
+
+def _evaluate(obj: Any, variables: dict[str, Any], memo: dict[int, tuple] | None = None) -> Any:
+    """Evaluate an object on the client.
+
+    Args:
+        obj: The object to evaluate.
+        variables: The values of the variables of the enclosing functions.
+        memo: The values of the objects already evaluated that do not depend on any variable, keyed by id.
+
+    Raises:
+        _Unfoldable: If the object depends on server-side data or on an algorithm not reproduced on the client.
+    """
+    if obj is None or isinstance(obj, (str, int, float)):
+        return obj
+    elif isinstance(obj, (list, tuple)):
+        return [_evaluate(e, variables, memo) for e in obj]
+    elif isinstance(obj, dict):
+        return {k: _evaluate(v, variables, memo) for k, v in obj.items()}
+    elif isinstance(obj, ee.CustomFunction):
+        names = [a["name"] for a in obj._signature["args"]]
+        return lambda *args: _evaluate(obj._body, {**variables, **dict(zip(names, args))}, memo)
+    elif not isinstance(obj, ee.ComputedObject):
+        raise _Unfoldable(f"Unknown object {type(obj)}")
+
+    # the objects that do not depend on the variables (e.g. a literal used in a mapped function) are evaluated once
+    memo = {} if memo is None else memo
+    constant = not variables or (obj.func is None and obj.varName is None)
+    if constant and id(obj) in memo:
+        return memo[id(obj)][1]
+    value = _evaluateComputed(obj, variables, memo)
+    if constant:
+        memo[id(obj)] = (obj, value)
+    return value
+
+
+def _evaluateComputed(obj: ee.ComputedObject, variables: dict[str, Any], memo: dict[int, tuple]) -> Any:
+    """Evaluate a literal, a variable or a function call on the client."""
+    # literals and variables
+    if obj.func is None:
+        if obj.varName is not None:
+            if obj.varName not in variables:
+                raise _Unfoldable(f"Unknown variable {obj.varName}")
+            return variables[obj.varName]
+        for attribute in ["_list", "_dictionary", "_string", "_number"]:
+            if getattr(obj, attribute, None) is not None:
+                return _evaluate(getattr(obj, attribute), variables, memo)
+        raise _Unfoldable(f"Unknown literal {type(obj)}")
+
+    # function calls
+    name = obj.func.getSignature().get("name") if isinstance(obj.func, ee.ApiFunction) else None
+    if name == "If":
+        condition = _evaluate(obj.args.get("condition"), variables, memo)
+        branch = "trueCase" if condition not in [None, 0, "", [], {}] else "falseCase"
+        return _evaluate(obj.args.get(branch), variables, memo)
+    elif name == "List.map":
+        function = _evaluate(obj.args["baseAlgorithm"], variables, memo)
+        values = _evaluate(obj.args["list"], variables, memo)
+        mapped = [function(e) for e in values]
+        return [e for e in mapped if e is not None] if obj.args.get("dropNulls") else mapped
+    elif name == "List.iterate":
+        function = _evaluate(obj.args["function"], variables, memo)
+        values = _evaluate(obj.args["list"], variables, memo)
+        first = _evaluate(obj.args["first"], variables, memo)
+        return functools.reduce(lambda acc, e: function(e, acc), values, first)
+    elif name not in ALGORITHMS:
+        raise _Unfoldable(f"{name} is not evaluated on the client")
+
+    args = {k: _evaluate(v, variables, memo) for k, v in obj.args.items()}
+    try:
+        return ALGORITHMS[name](**args)
+    except _Unfoldable:
+        raise
+    except Exception as e:
+        # let the server raise its own error message
+        raise _Unfoldable(str(e)) from e
+
+
+def _toInfo(value: Any) -> Any:
+    """Convert a client-side value to the output of ``getInfo``."""
+    if isinstance(value, _Date):
+        return {"type": "Date", "value": value.millis}
+    elif isinstance(value, _DateRange):
+        return {"type": "DateRange", "dates": [value.start.millis, value.end.millis]}
+    elif isinstance(value, list):
+        return [_toInfo(e) for e in value]
+    elif isinstance(value, dict):
+        return {k: _toInfo(v) for k, v in value.items()}
+    return value
+
+
+def _toObject(value: Any) -> Any:
+    """Convert a client-side value to a literal-backed Earth Engine object."""
+    if isinstance(value, _Date):
+        return ee.Date(value.millis)
+    elif isinstance(value, _DateRange):
+        return ee.DateRange(value.start.millis, value.end.millis)
+    elif isinstance(value, list):
+        return [_toObject(e) for e in value]
+    elif isinstance(value, dict):
+        return {k: _toObject(v) for k, v in value.items()}
+    return value
+
+
+_state = threading.local()
+"The evaluators enabled in each thread."
+
+
+@_register_extention(ee.geetools)
+class Evaluator:
+    """A client-side evaluator folding the Earth Engine objects built only from literal values.
+
+    Many geetools methods are called with plain Python values and still build a graph that needs a request to
+    be read. The evaluator reproduces a subset of the Earth Engine algorithms (list, string, number, dictionary
+    and date operations) on the client. When all the leaves of a graph are literals, it is evaluated
+    locally. Otherwise the server is used as usual.
+
+    Used as a context manager, the geetools methods marked as foldable return literal-backed objects
+    (e.g. ``ee.List([...])``) instead of graphs. The number of folded objects and of server fallbacks are kept
+    in :py:attr:`metrics`.
+
+    Examples:
+        .. code-block:: python
+
+            import ee, geetools
+
+            ee.Initialize()
+
+            with ee.geetools.Evaluator() as evaluator:
+                chunks = ee.List([1, 2, 3, 4, 5]).geetools.chunked(2)
+                print(evaluator.evaluate(chunks))
+            print(evaluator.metrics)
+    """
+
+    metrics: dict[str, int]
+    "The number of objects folded on the client and of objects evaluated on the server."
+
+    def __init__(self):
+        """Initialize the evaluator."""
+        self._lock = threading.Lock()
+        self.metrics = {"folded": 0, "fallback": 0}
+
+    def __enter__(self):
+        """Fold the geetools foldable methods in the current thread."""
+        _state.stack = [*getattr(_state, "stack", []), self]
+        return self
+
+    def __exit__(self, *args):
+        """Stop folding the geetools foldable methods."""
+        _state.stack = _state.stack[:-1]
+
+    def evaluate(self, obj: Any) -> Any:
+        """Get the value of an object, on the client when possible.
+
+        Parameters:
+            obj: The Earth Engine object to evaluate.
+
+        Returns:
+            The same value as ``obj.getInfo()``.
+        """
+        try:
+            value = _toInfo(_evaluate(obj, {}))
+        except _Unfoldable:
+            self._count("fallback")
+            return executor.execute(obj.getInfo)
+        self._count("folded")
+        return value
+
+    def fold(self, obj: ee.ComputedObject) -> ee.ComputedObject:
+        """Replace an object by a literal-backed object of the same type when it can be evaluated on the client.
+
+        Parameters:
+            obj: The Earth Engine object to fold.
+
+        Returns:
+            The literal-backed object or the original object if it depends on server-side data.
+        """
+        klasses = [ee.List, ee.Dictionary, ee.String, ee.Number, ee.Date]
+        klass = next((k for k in klasses if isinstance(obj, k)), None)
+        try:
+            value = _evaluate(obj, {}) if klass is not None else None
+        except _Unfoldable:
+            value = None
+        if value is None:
+            self._count("fallback")
+            return obj
+        self._count("folded")
+        return ee.Date(value.millis) if klass is ee.Date else klass(_toObject(value))
+
+    def _count(self, key: str):
+        """Increment one of the metrics in a thread-safe way."""
+        with self._lock:
+            self.metrics[key] += 1
+
+
+def foldable(method: Callable) -> Callable:
+    """Fold the output of a method when an :py:class:`Evaluator` is used in the current thread."""
+
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        output = method(*args, **kwargs)
+        stack = getattr(_state, "stack", [])
+        return stack[-1].fold(output) if stack else output
+
+    return wrapper
@@ -0,0 +1,176 @@
+"""An execution layer retrying the Earth Engine calls made by geetools."""
+from __future__ import annotations
+
+import random
+import re
+import threading
+import time
+from typing import Any, Callable, TypeVar
+
+import ee
+
+from .accessors import _register_extention
+from .ee_governor import Governor, governor
+
+T = TypeVar("T")
+
+THROTTLING_ERRORS = [
+    "too many concurrent aggregations",
+    "too many requests",
+    "rate limit",
+    "quota exceeded",
+]
+"The lowercase messages of the errors raised when the client is sending too many requests."
+
+THROTTLING_STATUS = re.compile(r"(?:error|status(?: code)?|\"code\")\W{0,3}429\b")
+"The pattern of the 429 HTTP status in a lowercase error message, a bare 429 can be part of an id or a value."
+
+MEMORY_ERRORS = [
+    "user memory limit exceeded",
+    "out of memory",
+    "too many pixels",
+]
+"The lowercase messages of the errors raised when a computation is too big for the server."
+
+
+@_register_extention(ee.geetools)
+class Executor:
+    """An execution layer retrying the Earth Engine calls according to the error they raise.
+
+    The errors are classified in 3 categories:
+
+    - ``"throttling"``: the call is retried after a jittered exponential backoff.
+    - ``"memory"``: the call is retried with a doubled ``tileScale`` keyword argument (up to ``maxTileScale``) or with ``bestEffort=True`` if the called function supports it.
+    - ``"fatal"``: the error is raised immediately.
+
+    The number of errors of each category and the number of retries are kept in :py:attr:`metrics`.
+
+    Parameters:
+        maxRetries: The maximum number of retries of a single call.
+        baseDelay: The delay in seconds before the first retry of a throttled call.
+        maxDelay: The maximum delay in seconds between 2 retries of a throttled call.
+        maxTileScale: The maximum ``tileScale`` used to retry a call that ran out of memory.
+        sleep: The function used to wait between 2 retries. Replace it to test without waiting.
+        seed: The seed of the random generator used for the jitter.
+        governor: The :py:class:`Governor <geetools.Governor>` limiting the rate and concurrency of the calls. Default to the process-wide one.
+
+    Examples:
+        .. code-block:: python
+
+            import ee, geetools
+
+            ee.Initialize()
+
+            image = ee.Image("COPERNICUS/S2_SR_HARMONIZED/20200101T100319_20200101T100321_T32TQM")
+            reduce = lambda tileScale: image.reduceRegion("mean", scale=10, tileScale=tileScale).getInfo()
+            executor = ee.geetools.Executor()
+            values = executor.execute(reduce, tileScale=1)
+            print(executor.metrics)
+    """
+
+    metrics: dict[str, int]
+    "The number of calls, retries and errors of each category handled by the executor."
+
+    def __init__(
+        self,
+        maxRetries: int = 5,
+        baseDelay: float = 1.0,
+        maxDelay: float = 60.0,
+        maxTileScale: float = 16,
+        sleep: Callable[[float], Any] = time.sleep,
+        seed: int | None = None,
+        governor: Governor = governor,
+    ):
+        """Initialize the executor."""
+        self.maxRetries, self.baseDelay, self.maxDelay = maxRetries, baseDelay, maxDelay
+        self.maxTileScale, self.sleep, self.governor = maxTileScale, sleep, governor
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.metrics = {"calls": 0, "retries": 0, "throttling": 0, "memory": 0, "fatal": 0}
+
+    def classify(self, error: Exception) -> str:
+        """Classify an error raised by an Earth Engine call.
+
+        Parameters:
+            error: The error to classify.
+
+        Returns:
+            One of ``"throttling"``, ``"memory"`` or ``"fatal"``.
+        """
+        message = str(error).lower()
+        if any(m in message for m in MEMORY_ERRORS):
+            return "memory"
+        elif any(m in message for m in THROTTLING_ERRORS) or THROTTLING_STATUS.search(message):
+            return "throttling"
+        elif self._status(error) == 429:
+            return "throttling"
+        return "fatal"
+
+    def delay(self, attempt: int) -> float:
+        """Compute the delay before retrying a throttled call.
+
+        The delay follows a "full jitter" exponential backoff: it is drawn uniformly between 0 and
+        ``baseDelay * 2**attempt`` capped to ``maxDelay``.
+
+        Parameters:
+            attempt: The number of the retry starting from 0.
+
+        Returns:
+            The delay in seconds.
+        """
+        return self._random.uniform(0, min(self.maxDelay, self.baseDelay * 2**attempt))
+
+    def execute(self, func: Callable[..., T], *args, endpoint: str = "compute", **kwargs) -> T:
+        """Call a function and retry it according to the errors it raises.
+
+        Parameters:
+            func: The function to call. It will typically end with a ``getInfo`` or an ``ee.data`` call.
+            *args: The positional arguments of the function.
+            endpoint: The endpoint class of the call used by the governor, one of ``"metadata"``, ``"compute"`` or ``"export"``.
+            **kwargs: The keyword arguments of the function. ``tileScale`` and ``bestEffort`` are updated when the call runs out of memory.
+
+        Returns:
+            The output of the function.
+        """
+        self._count("calls")
+        attempt = 0
+        while True:
+            try:
+                with self.governor.acquire(endpoint):
+                    return func(*args, **kwargs)
+            except ee.EEException as e:
+                category = self.classify(e)
+                self._count(category)
+                if attempt >= self.maxRetries or category == "fatal":
+                    raise e
+                elif category == "memory" and kwargs.get("tileScale", self.maxTileScale) < self.maxTileScale:
+                    kwargs["tileScale"] = min(kwargs["tileScale"] * 2, self.maxTileScale)
+                elif category == "memory" and kwargs.get("bestEffort") is False:
+                    kwargs["bestEffort"] = True
+                elif category == "memory":
+                    raise e
+                else:
+                    self.sleep(self.delay(attempt))
+                self._count("retries")
+                attempt += 1
+
+    @staticmethod
+    def _status(error: BaseException | None) -> int | None:
+        """The HTTP status of the ``HttpError`` translated into an Earth Engine error, if any."""
+        seen = set()
+        while error is not None and id(error) not in seen:
+            seen.add(id(error))
+            status = getattr(getattr(error, "resp", None), "status", None)
+            if status is not None:
+                return int(status)
+            error = error.__cause__ or error.__context__
+        return None
+
+    def _count(self, key: str):
+        """Increment one of the metrics in a thread-safe way."""
+        with self._lock:
+            self.metrics[key] += 1
+
+
+executor = Executor()
+"The process-wide executor used by geetools for its client-side calls."
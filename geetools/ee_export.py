@@ -4,6 +4,7 @@ from __future__ import annotations
 import ee
 
 from .accessors import register_class_accessor
+from .ee_executor import executor
 from .utils import format_asset_id, format_description
 
 
@@ -11,6 +12,8 @@ from .utils import format_asset_id, format_description
 class ExportAccessor:
     """Toolbox for the :py:class:`ee.batch.Export` class."""
 
+    __slots__ = ("_obj",)
+
     def __init__(self, obj: ee.batch.Export):
         """Initialize the ExportAccessor class."""
         self._obj = obj
@@ -69,15 +72,16 @@ class ExportAccessor:
             aid = ee.Asset(assetId) if assetId else ee.Asset("~").expanduser() / description
 
             # create the ImageCollection asset
-            ee.data.createAsset({"type": "IMAGE_COLLECTION"}, aid.as_posix())
+            asset = {"type": "IMAGE_COLLECTION"}
+            executor.execute(ee.data.createAsset, asset, aid.as_posix(), endpoint="metadata")
 
             # loop over the collection and export each image
-            system_indices = imagecollection.aggregate_array("system:index").getInfo()
+            system_indices = executor.execute(imagecollection.aggregate_array("system:index").getInfo)
             task_list = []
             for sys_idx in system_indices:
                 # extract image information
                 locImage = imagecollection.filter(ee.Filter.eq(index_property, sys_idx)).first()
-                loc_id = locImage.get(index_property).getInfo()
+                loc_id = executor.execute(locImage.get(index_property).getInfo)
 
                 # override the parameters related to the image itself
                 kwargs["image"] = locImage
@@ -134,12 +138,12 @@ class ExportAccessor:
             fid = folder if folder else description
 
             # loop over the collection and export each image
-            system_indices = imagecollection.aggregate_array("system:index").getInfo()
+            system_indices = executor.execute(imagecollection.aggregate_array("system:index").getInfo)
             task_list = []
             for sys_idx in system_indices:
                 # extract image information
                 locImage = imagecollection.filter(ee.Filter.eq(index_property, sys_idx)).first()
-                loc_id = locImage.get(index_property).getInfo()
+                loc_id = executor.execute(locImage.get(index_property).getInfo)
 
                 # override the parameters related to the image itself
                 # the folder will be created by the first task
@@ -197,12 +201,12 @@ class ExportAccessor:
             fid = folder if folder else description
 
             # loop over the collection and export each image
-            system_indices = imagecollection.aggregate_array("system:index").getInfo()
+            system_indices = executor.execute(imagecollection.aggregate_array("system:index").getInfo)
             task_list = []
             for sys_idx in system_indices:
                 # extract image information
                 locImage = imagecollection.filter(ee.Filter.eq(index_property, sys_idx)).first()
-                loc_id = locImage.get(index_property).getInfo()
+                loc_id = executor.execute(locImage.get(index_property).getInfo)
 
                 # override the parameters related to the image itself
                 # the folder will be created by the first task
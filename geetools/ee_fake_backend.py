@@ -0,0 +1,373 @@
+"""An in-process fake of the Earth Engine endpoints used by geetools."""
+from __future__ import annotations
+
+import random
+import threading
+import time
+import uuid
+from collections import Counter
+from datetime import datetime, timezone
+from pathlib import PurePosixPath
+from typing import Any, Callable
+
+import ee
+
+from .accessors import _register_extention
+from .ee_evaluator import _evaluate, _toInfo, _Unfoldable
+
+ENDPOINTS = [
+    "getAsset",
+    "listAssets",
+    "createAsset",
+    "createFolder",
+    "copyAsset",
+    "deleteAsset",
+    "updateAsset",
+    "computeValue",
+    "computePixels",
+    "exportImage",
+    "exportTable",
+    "exportVideo",
+    "exportMap",
+    "getOperation",
+    "listOperations",
+    "cancelOperation",
+]
+"The ``ee.data`` functions replaced by the fake backend."
+
+CONTAINERS = ["FOLDER", "IMAGE_COLLECTION"]
+"The asset types that can contain other assets."
+
+LEGACY_PREFIX = "projects/earthengine-legacy/assets/"
+"The prefix added by the API to the absolute asset names of the export destinations."
+
+
+def _now() -> str:
+    """The current time in the RFC 3339 format used by the API."""
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+@_register_extention(ee.geetools)
+class FakeBackend:
+    """An in-process fake of the ``ee.data`` endpoints used by geetools.
+
+    Used as a context manager, the backend replaces the functions of :py:data:`ENDPOINTS` in ``ee.data``. Assets are
+    stored in memory, export tasks are recorded as operations and :py:meth:`computeValue` evaluates the literal
+    graphs on the client or returns the canned :py:attr:`results`. Every call can be slowed down with a latency
+    and can fail with an injected error, which makes it possible to test and benchmark the client-side costs of
+    geetools without an Earth Engine account.
+
+    Parameters:
+        project: The cloud project of the fake assets and operations.
+        latency: The delay in seconds of every call or a delay per endpoint.
+        failureRate: The probability of a call to fail with ``failureMessage``.
+        failureMessage: The message of the errors raised randomly.
+        results: The values returned by ``computeValue`` keyed by the name of the last algorithm of the graph. A
+            callable receives the object to compute.
+        sleep: The function used to wait for the latency. Replace it to simulate time in tests.
+        seed: The seed of the random generator used for the failures.
+
+    Examples:
+        .. code-block:: python
+
+            import ee, geetools
+
+            backend = ee.geetools.FakeBackend(latency=0.05)
+            backend.initialize()
+
+            with backend:
+                ee.Asset("projects/fake-project/assets/folder").mkdir()
+                print(ee.Asset("projects/fake-project/assets").iterdir())
+            print(backend.calls)
+    """
+
+    assets: dict[str, dict]
+    "The fake assets keyed by their name."
+
+    operations: dict[str, dict]
+    "The fake long running operations keyed by their name."
+
+    calls: Counter
+    "The number of calls of each endpoint."
+
+    def __init__(
+        self,
+        project: str = "fake-project",
+        latency: float | dict[str, float] = 0.0,
+        failureRate: float = 0.0,
+        failureMessage: str = "Too many concurrent aggregations.",
+        results: dict[str, Any] | None = None,
+        sleep: Callable[[float], Any] = time.sleep,
+        seed: int | None = None,
+    ):
+        """Initialize an empty backend."""
+        self.project, self.latency, self.sleep = project, latency, sleep
+        self.failureRate, self.failureMessage = failureRate, failureMessage
+        self.results = results or {}
+        self.assets, self.operations, self.calls = {}, {}, Counter()
+        self._failures: dict[str, list[Exception]] = {}
+        self._random = random.Random(seed)
+        self._lock = threading.RLock()
+        self._patched: dict[str, Callable] = {}
+
+    def __enter__(self):
+        """Replace the ``ee.data`` endpoints by the fake ones."""
+        for name in ENDPOINTS:
+            self._patched[name] = getattr(ee.data, name)
+            setattr(ee.data, name, self._endpoint(name))
+        return self
+
+    def __exit__(self, *args):
+        """Restore the ``ee.data`` endpoints."""
+        for name, function in self._patched.items():
+            setattr(ee.data, name, function)
+        self._patched = {}
+
+    @property
+    def root(self) -> str:
+        """The name of the root folder of the project assets."""
+        return f"projects/{self.project}/assets"
+
+    def initialize(self):
+        """Initialize the Earth Engine API without credentials nor network.
+
+        The algorithm signatures are the ones shipped with the API test suite. They cover the common algorithms
+        but some recent ones may be missing.
+        """
+        from ee import apitestcase
+
+        install, getAlgorithms = ee.data._install_cloud_api_resource, ee.data.getAlgorithms
+        ee.data._install_cloud_api_resource, ee.data.getAlgorithms = lambda: None, apitestcase.GetAlgorithms
+        try:
+            ee.Initialize(None, "", project=self.project)
+        finally:
+            ee.data._install_cloud_api_resource, ee.data.getAlgorithms = install, getAlgorithms
+
+    def fail(self, endpoint: str, message: str | Exception, times: int = 1):
+        """Make the next calls of an endpoint fail.
+
+        Parameters:
+            endpoint: The name of the endpoint.
+            message: The message of the :py:class:`ee.EEException` to raise or the exception itself.
+            times: The number of consecutive calls to fail.
+        """
+        error = message if isinstance(message, Exception) else ee.EEException(message)
+        with self._lock:
+            self._failures.setdefault(endpoint, []).extend([error] * times)
+
+    def add(self, name: str, type: str = "IMAGE", properties: dict | None = None, **metadata) -> dict:
+        """Store an asset directly, without checking its parent nor counting a call.
+
+        Parameters:
+            name: The name of the asset.
+            type: The type of the asset.
+            properties: The properties of the asset.
+            **metadata: Other fields of the asset e.g. ``startTime`` or ``sizeBytes``.
+
+        Returns:
+            The stored asset.
+        """
+        name = self._name(name)
+        asset = {"type": type, "name": name, "id": name, "updateTime": _now(), "sizeBytes": "0"}
+        asset.update(properties=dict(properties or {}), **metadata)
+        with self._lock:
+            self.assets[name] = asset
+        return asset
+
+    def run(self):
+        """Complete all the pending operations and create the assets they export."""
+        with self._lock:
+            for operation in self.operations.values():
+                if operation["done"]:
+                    continue
+                operation["done"] = True
+                operation["metadata"].update(state="SUCCEEDED", updateTime=_now())
+                destination = operation.pop("destination", None)
+                if destination is not None:
+                    self.add(destination, operation.pop("assetType"))
+
+    # -- endpoints ------------------------------------------------------------
+
+    def getAsset(self, asset_id: str) -> dict:
+        """Fake :py:func:`ee.data.getAsset`."""
+        name = self._name(asset_id)
+        with self._lock:
+            if name not in self.assets:
+                raise ee.EEException(f"Asset '{asset_id}' does not exist or doesn't allow access.")
+            return {**self.assets[name], "properties": dict(self.assets[name]["properties"])}
+
+    def listAssets(self, params: str | dict) -> dict:
+        """Fake :py:func:`ee.data.listAssets` with the ``pageSize`` and ``pageToken`` pagination."""
+        params = {"parent": params} if isinstance(params, str) else params
+        parent = self._name(params["parent"])
+        with self._lock:
+            if not self._isContainer(parent):
+                raise ee.EEException(f"Asset '{params['parent']}' is not a container.")
+            children = [a for n, a in sorted(self.assets.items()) if str(PurePosixPath(n).parent) == parent]
+        start = int(params.get("pageToken") or 0)
+        size = int(params.get("pageSize") or len(children) or 1)
+        output: dict[str, Any] = {"assets": children[start : start + size]}
+        if start + size < len(children):
+            output["nextPageToken"] = str(start + size)
+        return output
+
+    def createAsset(self, value: dict, path: str | None = None, properties: dict | None = None) -> dict:
+        """Fake :py:func:`ee.data.createAsset`."""
+        name = self._name(path or value["name"])
+        with self._lock:
+            if name in self.assets:
+                raise ee.EEException(f"Cannot overwrite asset '{name}'.")
+            elif not self._isContainer(str(PurePosixPath(name).parent)):
+                raise ee.EEException(f"Parent of asset '{name}' does not exist.")
+            properties = {**value.get("properties", {}), **(properties or {})}
+            return self.add(name, value["type"], properties)
+
+    def createFolder(self, path: str) -> dict:
+        """Fake :py:func:`ee.data.createFolder`."""
+        return self.createAsset({"type": "FOLDER"}, path)
+
+    def copyAsset(self, sourceId: str, destinationId: str, allowOverwrite: bool = False):
+        """Fake :py:func:`ee.data.copyAsset`."""
+        source, destination = self.getAsset(sourceId), self._name(destinationId)
+        with self._lock:
+            if destination in self.assets and allowOverwrite is False:
+                raise ee.EEException(f"Cannot overwrite asset '{destination}'.")
+            elif not self._isContainer(str(PurePosixPath(destination).parent)):
+                raise ee.EEException(f"Parent of asset '{destination}' does not exist.")
+            metadata = {k: v for k, v in source.items() if k not in ["type", "name", "id", "properties"]}
+            self.add(destination, source["type"], source["properties"], **metadata)
+
+    def deleteAsset(self, assetId: str):
+        """Fake :py:func:`ee.data.deleteAsset`."""
+        name = self._name(assetId)
+        self.getAsset(name)
+        with self._lock:
+            if any(str(PurePosixPath(n).parent) == name for n in self.assets):
+                raise ee.EEException(f"Asset '{name}' has children and cannot be deleted.")
+            del self.assets[name]
+
+    def updateAsset(self, asset_id: str, asset: dict, update_mask: list[str]):
+        """Fake :py:func:`ee.data.updateAsset` applying the fields of the update mask."""
+        name = self._name(asset_id)
+        self.getAsset(name)
+        fields = {"start_time": "startTime", "end_time": "endTime"}
+        with self._lock:
+            stored = self.assets[name]
+            for mask in update_mask:
+                if mask.startswith("properties."):
+                    key = mask.removeprefix("properties.")
+                    value = asset.get("properties", {}).get(key)
+                    if value is None:
+                        stored["properties"].pop(key, None)
+                    else:
+                        stored["properties"][key] = value
+                else:
+                    stored[fields.get(mask, mask)] = asset.get(mask)
+            stored["updateTime"] = _now()
+
+    def computeValue(self, obj: ee.ComputedObject) -> Any:
+        """Fake :py:func:`ee.data.computeValue`.
+
+        The graphs built only from literal values are evaluated on the client. The others return the value of
+        :py:attr:`results` registered for the name of their last algorithm, or for the name of their class if they
+        are a container of server-side values (e.g. ``"Dictionary"``).
+        """
+        try:
+            return _toInfo(_evaluate(obj, {}))
+        except _Unfoldable:
+            pass
+        name = obj.func.getSignature().get("name") if isinstance(obj.func, ee.ApiFunction) else obj.name()
+        if name not in self.results:
+            raise ee.EEException(f"The fake backend has no result for {name}.")
+        result = self.results[name]
+        return result(obj) if callable(result) else result
+
+    def computePixels(self, params: dict) -> Any:
+        """Fake :py:func:`ee.data.computePixels` returning the result registered as ``"computePixels"``."""
+        result = self.results.get("computePixels", b"")
+        return result(params) if callable(result) else result
+
+    def exportImage(self, request_id: str, params: dict) -> dict:
+        """Fake :py:func:`ee.data.exportImage`."""
+        return self._export("EXPORT_IMAGE", params, "IMAGE")
+
+    def exportTable(self, request_id: str, params: dict) -> dict:
+        """Fake :py:func:`ee.data.exportTable`."""
+        return self._export("EXPORT_FEATURES", params, "TABLE")
+
+    def exportVideo(self, request_id: str, params: dict) -> dict:
+        """Fake :py:func:`ee.data.exportVideo`."""
+        return self._export("EXPORT_VIDEO", params)
+
+    def exportMap(self, request_id: str, params: dict) -> dict:
+        """Fake :py:func:`ee.data.exportMap`."""
+        return self._export("EXPORT_TILES", params)
+
+    def getOperation(self, operation_name: str) -> dict:
+        """Fake :py:func:`ee.data.getOperation`."""
+        with self._lock:
+            if operation_name not in self.operations:
+                raise ee.EEException(f"Operation '{operation_name}' does not exist.")
+            return self._public(self.operations[operation_name])
+
+    def listOperations(self, project: str | None = None) -> list[dict]:
+        """Fake :py:func:`ee.data.listOperations`."""
+        with self._lock:
+            return [self._public(o) for o in self.operations.values()]
+
+    def cancelOperation(self, operation_name: str):
+        """Fake :py:func:`ee.data.cancelOperation`."""
+        self.getOperation(operation_name)
+        with self._lock:
+            operation = self.operations[operation_name]
+            if not operation["done"]:
+                operation["done"] = True
+                operation["metadata"].update(state="CANCELLED", updateTime=_now())
+
+    # -- helpers --------------------------------------------------------------
+
+    def _endpoint(self, name: str) -> Callable:
+        """Wrap an endpoint to count its calls, wait for its latency and raise the injected failures."""
+        function = getattr(self, name)
+
+        def endpoint(*args, **kwargs):
+            with self._lock:
+                self.calls[name] += 1
+                failures = self._failures.get(name, [])
+                error = failures.pop(0) if failures else None
+                if error is None and self.failureRate and self._random.random() < self.failureRate:
+                    error = ee.EEException(self.failureMessage)
+            latency = self.latency.get(name, 0.0) if isinstance(self.latency, dict) else self.latency
+            if latency:
+                self.sleep(latency)
+            if error is not None:
+                raise error
+            return function(*args, **kwargs)
+
+        return endpoint
+
+    def _name(self, asset_id: str) -> str:
+        """Normalize an asset id into an asset name."""
+        return str(asset_id).removeprefix(LEGACY_PREFIX).rstrip("/")
+
+    def _isContainer(self, name: str) -> bool:
+        """Check if an asset name is the project root or a container asset."""
+        return name == self.root or self.assets.get(name, {}).get("type") in CONTAINERS
+
+    def _export(self, type: str, params: dict, assetType: str | None = None) -> dict:
+        """Record a pending export operation."""
+        name = f"projects/{self.project}/operations/{uuid.uuid4().hex.upper()}"
+        metadata = {"state": "PENDING", "description": params.get("description", ""), "type": type}
+        metadata.update(createTime=_now(), updateTime=_now(), priority=params.get("priority", 100))
+        operation: dict[str, Any] = {"name": name, "metadata": metadata, "done": False}
+        destination = params.get("assetExportOptions", {}).get("earthEngineDestination", {}).get("name")
+        if destination is not None and assetType is not None:
+            operation.update(destination=destination, assetType=assetType)
+        with self._lock:
+            self.operations[name] = operation
+        return self._public(operation)
+
+    def _public(self, operation: dict) -> dict:
+        """The fields of an operation returned by the API."""
+        public = {k: v for k, v in operation.items() if k not in ["destination", "assetType"]}
+        return {**public, "metadata": dict(operation["metadata"])}
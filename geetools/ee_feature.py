@@ -10,6 +10,8 @@ from .accessors import register_class_accessor
 class FeatureAccessor:
     """Toolbox for the :py:class:`ee.Feature` class."""
 
+    __slots__ = ("_obj",)
+
     def __init__(self, obj: ee.Feature):
         """Initialize the class."""
         self._obj = obj
@@ -1,7 +1,7 @@
 """Toolbox for the :py:class:`ee.FeatureCollection` class."""
 from __future__ import annotations
 
-from typing import Protocol
+from typing import Callable, Literal, Protocol
 
 import ee
 import geopandas as gpd
@@ -10,7 +10,17 @@ from matplotlib import pyplot as plt
 from matplotlib.axes import Axes
 
 from .accessors import register_class_accessor
-from .utils import plot_data
+from .ee_executor import executor
+from .utils import ClientCache, plot_data
+
+COLUMN_SEPARATOR = "\x1f"
+"The separator used to encode the column names of a feature into a single string signature."
+
+TYPE_SEPARATOR = "\x1e"
+"The separator used to attach the inferred type to a column name in the schema signature."
+
+_SCHEMA_CACHE = ClientCache()
+"Client-side memoization of the collection schemas, keyed by the hash of the collection graph."
 
 
 class GeoInterface(Protocol):
@@ -26,6 +36,8 @@ class GeoInterface(Protocol):
 class FeatureCollectionAccessor:
     """Toolbox for the :py:class:`ee.FeatureCollection` class."""
 
+    __slots__ = ("_obj",)
+
     def __init__(self, obj: ee.FeatureCollection):
         """Initialize the :py:class:`ee.FeatureCollection` class."""
         self._obj = obj
@@ -223,11 +235,27 @@ class FeatureCollectionAccessor:
         union = self._obj.iterate(lambda f, g: f.geometry().union(g, maxError=maxError), first)
         return ee.Geometry(union).dissolve(maxError=maxError)
 
-    def columnNames(self) -> ee.List:
+    def columnNames(
+        self,
+        sample: int = 0,
+        method: Literal["first", "random"] = "first",
+        seed: int = 0,
+    ) -> ee.List:
         """Get the name of the columns (Feature's properties).
 
         get a flatten list of all the columns names in the FeatureCollection including the ones that
-        are not in all features.
+        are not in all features. Each feature is summarized by a single signature string and the
+        distinct signatures are accumulated with a :py:meth:`ee.Reducer.frequencyHistogram` reducer
+        so the intermediate result only grows with the number of different schemas, not with the
+        number of features.
+
+        If the schema of the collection was already fetched with :docstring:`ee.FeatureCollection.geetools.schema`,
+        the memoized names are returned directly without building any server-side computation.
+
+        Args:
+            sample: The number of features to inspect. If ``0`` (default), all the features are inspected.
+            method: The sampling method to use when ``sample`` is set. ``"first"`` inspects the first features of the collection and ``"random"`` inspects a random subset of it.
+            seed: The seed used to draw the random subset when ``method`` is ``"random"``.
 
         Returns:
             A list of all the column names in the FeatureCollection.
@@ -248,9 +276,115 @@ class FeatureCollectionAccessor:
                 column_names = fc.geetools.columnNames()
                 column_names.getInfo()
         """
-        temp_property_name = "__geetools_properties__"
-        fc = self._obj.map(lambda feat: feat.set(temp_property_name, feat.propertyNames()))
-        return fc.aggregate_array(temp_property_name).flatten().distinct()
+        # early exit if the schema is already known client-side
+        schema = _SCHEMA_CACHE.get(self._schemaKey(sample, method, seed))
+        if schema is not None:
+            return ee.List(list(schema.keys()))
+
+        # encode the column names of each feature as a single string and accumulate the distinct ones
+        def signature(feat: ee.Feature, names: ee.List) -> ee.String:
+            return names.join(COLUMN_SEPARATOR)
+
+        signatures = self._distinctSignatures(signature, sample, method, seed)
+        names = signatures.map(lambda s: ee.String(s).split(COLUMN_SEPARATOR)).flatten()
+
+        return names.distinct().removeAll([""])
+
+    def schema(
+        self,
+        sample: int = 0,
+        method: Literal["first", "random"] = "first",
+        seed: int = 0,
+    ) -> dict[str, str]:
+        """Get the schema of the collection as a dictionary of column names and inferred types.
+
+        The types are the ones returned by :py:func:`ee.Algorithms.ObjectType` (e.g. ``"String"``, ``"Integer"``, ``"Float"``).
+        If a column holds different types depending on the features, all of them are reported separated by a ``"|"``.
+        The result is memoized client-side so later calls on the same collection (and later calls to
+        :docstring:`ee.FeatureCollection.geetools.columnNames`) are free.
+
+        Warning:
+            This function is a client-side function.
+
+        Args:
+            sample: The number of features to inspect. If ``0`` (default), all the features are inspected.
+            method: The sampling method to use when ``sample`` is set. ``"first"`` inspects the first features of the collection and ``"random"`` inspects a random subset of it.
+            seed: The seed used to draw the random subset when ``method`` is ``"random"``.
+
+        Returns:
+            A dictionary with the column names as keys and their types as values.
+
+        Example:
+            .. jupyter-execute::
+
+                import ee, geetools
+                from geetools.utils import initialize_documentation
+
+                initialize_documentation()
+
+                fc = ee.FeatureCollection([
+                    ee.Feature(ee.Geometry.Point([0, 0]), {"name": "A", "value": 1}),
+                    ee.Feature(ee.Geometry.Point([1, 1]), {"name": "B", "value": 2.5, "extra": "extra_value"})
+                ])
+
+                fc.geetools.schema()
+        """
+        key = self._schemaKey(sample, method, seed)
+        cached = _SCHEMA_CACHE.get(key)
+        if cached is not None:
+            return dict(cached)
+
+        # encode each column with its type and accumulate the distinct signatures
+        def signature(feat: ee.Feature, names: ee.List) -> ee.String:
+            def withType(name):
+                otype = ee.Algorithms.ObjectType(feat.get(name))
+                return ee.String(name).cat(TYPE_SEPARATOR).cat(otype)
+
+            return names.map(withType).join(COLUMN_SEPARATOR)
+
+        signatures = self._distinctSignatures(signature, sample, method, seed)
+        signatures = executor.execute(signatures.getInfo)
+
+        # merge the signatures client-side, a column can be reported with multiple types
+        types: dict[str, set] = {}
+        for s in signatures:
+            for column in filter(None, s.split(COLUMN_SEPARATOR)):
+                name, otype = column.split(TYPE_SEPARATOR)
+                types.setdefault(name, set()).add(otype)
+        schema = {name: "|".join(sorted(t)) for name, t in types.items()}
+
+        _SCHEMA_CACHE.set(key, schema)
+
+        return dict(schema)
+
+    def _sample(self, sample: int, method: str, seed: int) -> tuple[ee.FeatureCollection, str]:
+        """Reduce the collection to the requested sample and return the name of the generated random column."""
+        if method not in ["first", "random"]:
+            raise ValueError(f"method must be one of ['first', 'random'], got {method}")
+
+        if sample == 0:
+            return self._obj, ""
+        elif method == "first":
+            return self._obj.limit(sample), ""
+
+        randomName = "__geetools_random__"
+        fc = self._obj.randomColumn(randomName, seed)
+        return fc.limit(sample, randomName), randomName
+
+    def _distinctSignatures(self, signature: Callable, sample: int, method: str, seed: int) -> ee.List:
+        """Compute a signature string for each feature and return the distinct ones.
+
+        The ``signature`` function receives the feature and the list of its column names and returns a :py:class:`ee.String`.
+        """
+        fc, randomName = self._sample(sample, method, seed)
+        name = "__geetools_properties__"
+        fc = fc.map(lambda feat: feat.set(name, signature(feat, feat.propertyNames().remove(randomName))))
+        histogram = fc.reduceColumns(ee.Reducer.frequencyHistogram(), [name]).get("histogram")
+        return ee.Dictionary(histogram).keys()
+
+    def _schemaKey(self, sample: int, method: str, seed: int) -> str:
+        """Build the memoization key of the collection schema."""
+        return ClientCache.key(self._obj, sample, method, seed)
 
     def toPolygons(self) -> ee.FeatureCollection:
         """Drop any geometry that is not a Polygon or a multipolygon.
@@ -481,14 +615,14 @@ class FeatureCollectionAccessor:
                     label.set_rotation(45)
         """
         # Get the features and properties
-        props = ee.List(properties) if properties is not None else self._obj.first().propertyNames().getInfo()
+        props = ee.List(properties) if properties is not None else self._obj.first().propertyNames()
         props = props.remove(featureId)
 
         # get the data from server
-        data = self.byProperties(featureId, props, labels).getInfo()
+        data = executor.execute(self.byProperties(featureId, props, labels).getInfo)
 
         # reorder the data according to the labels or properties set by the user
-        labels = labels if labels is not None else props.getInfo()
+        labels = labels if labels is not None else executor.execute(props.getInfo)
         data = {k: data[k] for k in labels}
 
         return plot_data(type=type, data=data, label_name=featureId, colors=colors, ax=ax, **kwargs)
@@ -548,10 +682,10 @@ class FeatureCollectionAccessor:
         props = props.remove(featureId)
 
         # get the data from server
-        data = self.byFeatures(featureId, props, labels).getInfo()
+        data = executor.execute(self.byFeatures(featureId, props, labels).getInfo)
 
         # reorder the data according to the lapbes or properties set by the user
-        labels = labels if labels is not None else props.getInfo()
+        labels = labels if labels is not None else executor.execute(props.getInfo)
         data = {f: {k: data[f][k] for k in labels} for f in data.keys()}
 
         return plot_data(type=type, data=data, label_name=featureId, colors=colors, ax=ax, **kwargs)
@@ -608,7 +742,7 @@ class FeatureCollectionAccessor:
         properties, labels = ee.List([property]), ee.List([label])
 
         # get the data from the server
-        data = self.byProperties(properties=properties, labels=labels).getInfo()
+        data = executor.execute(self.byProperties(properties=properties, labels=labels).getInfo)
 
         # define the ax if not provided by the user
         if ax is None:
@@ -699,8 +833,8 @@ class FeatureCollectionAccessor:
         nonSystemNames = names.filter(ee.Filter.stringStartsWith("item", "system:").Not()).sort()
         systemNames = names.filter(ee.Filter.stringStartsWith("item", "system:")).sort()
         names = nonSystemNames.cat(systemNames)
-        property = property if property != "" else names.get(0).getInfo()
-        data = self._obj.select([property]).getInfo()
+        property = property if property != "" else executor.execute(names.get(0).getInfo)
+        data = executor.execute(self._obj.select([property]).getInfo)
 
         # transform the data to a geodataframe and reproject it to the destination crs
         gdf = gpd.GeoDataFrame.from_features(data["features"]).set_crs(4326).to_crs(crs)
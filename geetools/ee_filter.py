@@ -10,6 +10,8 @@ from .accessors import register_class_accessor
 class FilterAccessor:
     """Toolbox for the :py:class:`ee.Filter` class."""
 
+    __slots__ = ("_obj",)
+
     def __init__(self, obj: ee.Filter):
         """Initialize the Filter class."""
         self._obj = obj
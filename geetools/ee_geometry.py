@@ -4,12 +4,15 @@ from __future__ import annotations
 import ee
 
 from .accessors import register_class_accessor
+from .ee_executor import executor
 
 
 @register_class_accessor(ee.Geometry, "geetools")
 class GeometryAccessor:
     """Toolbox for the :py:class:`ee.Geometry` class."""
 
+    __slots__ = ("_obj",)
+
     def __init__(self, obj: ee.Geometry):
         """Initialize the Geometry class."""
         self._obj = obj
@@ -53,7 +56,7 @@ class GeometryAccessor:
         """
         # will raise an error if self is not a GeometryCollection
         error_msg = "This method can only be used with GeometryCollections"
-        assert self._obj.type().getInfo() == "GeometryCollection", error_msg
+        assert executor.execute(self._obj.type().getInfo) == "GeometryCollection", error_msg
 
         def filterType(geom):
             geom = ee.Geometry(geom)
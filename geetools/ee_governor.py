@@ -0,0 +1,164 @@
+"""A rate limiter and concurrency governor shared by the geetools calls to Earth Engine."""
+from __future__ import annotations
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator
+
+import ee
+
+from .accessors import _register_extention
+
+DEFAULT_LIMITS = {
+    "metadata": {"rate": 20.0, "concurrency": 20},
+    "compute": {"rate": 10.0, "concurrency": 40},
+    "export": {"rate": 1.0, "concurrency": 5},
+}
+"The default number of requests per second and concurrent requests of each endpoint class."
+
+
+class TokenBucket:
+    """A thread-safe token bucket limiting the number of requests per second.
+
+    Parameters:
+        rate: The number of tokens added to the bucket every second.
+        capacity: The maximum number of tokens in the bucket i.e. the size of a burst. Default to ``rate``.
+        clock: The function returning the current time in seconds.
+        sleep: The function used to wait for a token.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Any] = time.sleep,
+    ):
+        """Initialize the bucket full."""
+        self.rate, self.capacity = rate, capacity or max(rate, 1)
+        self.clock, self.sleep = clock, sleep
+        self.tokens, self.updated = self.capacity, clock()
+        self.waited = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Take a token from the bucket, waiting until one is available.
+
+        When the bucket is empty the token is reserved in advance: the bucket goes into debt and the caller
+        waits for the time needed to refill it. Concurrent callers are thus served in order without polling.
+
+        Returns:
+            The time waited in seconds.
+        """
+        with self._lock:
+            now = self.clock()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            delay = max(0.0, -self.tokens / self.rate)
+            self.waited += delay
+        if delay > 0:
+            self.sleep(delay)
+        return delay
+
+
+@_register_extention(ee.geetools)
+class Governor:
+    """A rate limiter and concurrency governor for the requests sent to Earth Engine.
+
+    Each endpoint class (``"metadata"``, ``"compute"`` and ``"export"``) owns a :py:class:`TokenBucket` limiting
+    the number of requests per second and a semaphore limiting the number of requests running at the same time.
+    The geetools :py:class:`Executor <geetools.Executor>` acquires a slot for every call it makes.
+
+    Parameters:
+        limits: The ``rate`` and ``concurrency`` of each endpoint class. Missing classes use :py:data:`DEFAULT_LIMITS`.
+        clock: The function returning the current time in seconds. Replace it to simulate time in tests.
+        sleep: The function used to wait for a token. Replace it to simulate time in tests.
+
+    Examples:
+        .. code-block:: python
+
+            import ee, geetools
+
+            ee.Initialize()
+
+            governor = ee.geetools.Governor({"compute": {"rate": 5, "concurrency": 10}})
+            with governor.acquire("compute"):
+                ee.Number(1).getInfo()
+            print(governor.utilization())
+    """
+
+    def __init__(
+        self,
+        limits: dict[str, dict] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Any] = time.sleep,
+    ):
+        """Initialize the governor with one bucket and one semaphore per endpoint class."""
+        self.clock, self.sleep = clock, sleep
+        self._lock = threading.Lock()
+        self._endpoints: dict[str, dict] = {}
+        for name, limit in {**DEFAULT_LIMITS, **(limits or {})}.items():
+            self.configure(name, **{**DEFAULT_LIMITS.get(name, {}), **limit})
+
+    def configure(self, endpoint: str, rate: float, concurrency: int):
+        """Set the limits of an endpoint class.
+
+        Parameters:
+            endpoint: The name of the endpoint class.
+            rate: The maximum number of requests per second.
+            concurrency: The maximum number of requests running at the same time.
+        """
+        with self._lock:
+            self._endpoints[endpoint] = {
+                "bucket": TokenBucket(rate, clock=self.clock, sleep=self.sleep),
+                "semaphore": threading.BoundedSemaphore(concurrency),
+                "concurrency": concurrency,
+                "inFlight": 0,
+                "requests": 0,
+            }
+
+    @contextmanager
+    def acquire(self, endpoint: str = "compute") -> Iterator[None]:
+        """Wait for a token and a free slot of an endpoint class.
+
+        Parameters:
+            endpoint: The name of the endpoint class.
+        """
+        if endpoint not in self._endpoints:
+            raise ValueError(f"endpoint must be one of {list(self._endpoints)}, got {endpoint}")
+        state = self._endpoints[endpoint]
+        with state["semaphore"]:
+            state["bucket"].acquire()
+            with self._lock:
+                state["inFlight"] += 1
+                state["requests"] += 1
+            try:
+                yield
+            finally:
+                with self._lock:
+                    state["inFlight"] -= 1
+
+    def utilization(self) -> dict[str, dict]:
+        """Report the live usage of each endpoint class.
+
+        Returns:
+            For each endpoint class, the number of requests in flight, the ratio of used concurrent slots,
+            the total number of requests and the total time spent waiting for the rate limiter.
+        """
+        with self._lock:
+            return {
+                name: {
+                    "inFlight": state["inFlight"],
+                    "concurrency": state["inFlight"] / state["concurrency"],
+                    "rate": state["bucket"].rate,
+                    "requests": state["requests"],
+                    "waited": state["bucket"].waited,
+                }
+                for name, state in self._endpoints.items()
+            }
+
+
+governor = Governor()
+"The process-wide governor shared by all the geetools calls."
@@ -0,0 +1,443 @@
+"""An inspector and optimizer of the expression graphs sent to Earth Engine."""
+from __future__ import annotations
+
+import functools
+import json
+import threading
+from typing import Any, Callable
+
+import ee
+import pandas as pd
+
+from .accessors import _register_extention
+from .ee_executor import executor
+
+STATISTICS = ["bytes", "values", "nodes", "treeNodes", "depth", "duplicates", "literalBytes"]
+"The statistics computed by the inspector on an encoded expression."
+
+
+# -- expression walkers ---------------------------------------------------------
+
+
+def _children(node: dict) -> list[dict]:
+    """List the inline value nodes of a value node."""
+    if "arrayValue" in node:
+        return node["arrayValue"]["values"]
+    elif "dictionaryValue" in node:
+        return list(node["dictionaryValue"]["values"].values())
+    elif "functionInvocationValue" in node:
+        return list(node["functionInvocationValue"]["arguments"].values())
+    return []
+
+
+def _references(node: dict) -> list[str]:
+    """List the names of the values referenced by a value node and its inline children."""
+    references = []
+    if "valueReference" in node:
+        references.append(node["valueReference"])
+    elif "functionDefinitionValue" in node:
+        references.append(node["functionDefinitionValue"]["body"])
+    elif "functionReference" in node.get("functionInvocationValue", {}):
+        references.append(node["functionInvocationValue"]["functionReference"])
+    for child in _children(node):
+        references += _references(child)
+    return references
+
+
+def _order(expression: dict) -> list[str]:
+    """Sort the values reachable from the result so that every value comes before the values it references."""
+    values, visited, order = expression["values"], set(), []
+
+    def visit(name: str):
+        if name not in visited:
+            visited.add(name)
+            [visit(r) for r in _references(values[name])]
+            order.append(name)
+
+    visit(expression["result"])
+    return order[::-1]
+
+
+def _freeVariables(expression: dict) -> tuple[Callable[[dict], frozenset], dict[str, frozenset]]:
+    """Compute the argument names used but not defined by each value of an expression.
+
+    Returns:
+        A function computing the free variables of an inline node and the free variables of each named value.
+    """
+    values, free = expression["values"], {}
+
+    def nodeFree(node: dict) -> frozenset:
+        if "argumentReference" in node:
+            return frozenset([node["argumentReference"]])
+        elif "valueReference" in node:
+            return free[node["valueReference"]]
+        elif "functionDefinitionValue" in node:
+            definition = node["functionDefinitionValue"]
+            return free[definition["body"]] - set(definition["argumentNames"])
+        names = frozenset().union(*[nodeFree(c) for c in _children(node)])
+        if "functionReference" in node.get("functionInvocationValue", {}):
+            names |= free[node["functionInvocationValue"]["functionReference"]]
+        return names
+
+    for name in _order(expression)[::-1]:
+        free[name] = nodeFree(values[name])
+    return nodeFree, free
+
+
+def _key(node: Any) -> str:
+    """A canonical representation of a value node used to find identical subgraphs."""
+    return json.dumps(node, sort_keys=True)
+
+
+def _rewrite(node: dict, visit: Callable[[dict], dict]) -> dict:
+    """Rebuild a value node applying ``visit`` to each of its inline children."""
+    if "arrayValue" in node:
+        return {"arrayValue": {"values": [visit(c) for c in node["arrayValue"]["values"]]}}
+    elif "dictionaryValue" in node:
+        values = node["dictionaryValue"]["values"]
+        return {"dictionaryValue": {"values": {k: visit(v) for k, v in values.items()}}}
+    elif "functionInvocationValue" in node:
+        invocation = node["functionInvocationValue"]
+        arguments = {k: visit(v) for k, v in invocation["arguments"].items()}
+        return {"functionInvocationValue": {**invocation, "arguments": arguments}}
+    return node
+
+
+def _rename(node: dict, names: dict[str, str]) -> dict:
+    """Replace the value names referenced by a node and its inline children."""
+    if "valueReference" in node:
+        return {"valueReference": names[node["valueReference"]]}
+    elif "functionDefinitionValue" in node:
+        definition = node["functionDefinitionValue"]
+        return {"functionDefinitionValue": {**definition, "body": names[definition["body"]]}}
+    node = _rewrite(node, lambda c: _rename(c, names))
+    invocation = node.get("functionInvocationValue", {})
+    if "functionReference" in invocation:
+        node = {
+            "functionInvocationValue": {
+                **invocation,
+                "functionReference": names[invocation["functionReference"]],
+            }
+        }
+    return node
+
+
+def _statistics(expression: dict) -> dict[str, int]:
+    """Compute the size statistics of an encoded expression.
+
+    Parameters:
+        expression: A Cloud API expression with a ``result`` name and a dictionary of named ``values``.
+
+    Returns:
+        The number of bytes of the request, the number of named values, the number of nodes of the DAG as sent,
+        the number of nodes and the depth of the expanded tree, the number of subgraphs repeated in the expanded
+        tree and the number of bytes of the literal payloads.
+    """
+    values, order = expression["values"], _order(expression)
+    treeNodes: dict[str, int] = {}
+    depth: dict[str, int] = {}
+
+    def walk(node: dict) -> tuple[int, int, int, int]:
+        """Count the DAG nodes, tree nodes, depth and literal bytes of an inline node."""
+        if "valueReference" in node:
+            return 0, treeNodes[node["valueReference"]], depth[node["valueReference"]], 0
+        own = [walk(c) for c in _children(node)]
+        references = []
+        if "functionDefinitionValue" in node:
+            references.append(node["functionDefinitionValue"]["body"])
+        if "functionReference" in node.get("functionInvocationValue", {}):
+            references.append(node["functionInvocationValue"]["functionReference"])
+        literal = len(json.dumps(node["constantValue"])) if "constantValue" in node else 0
+        literal += len(node.get("bytesValue", ""))
+        return (
+            1 + sum(o[0] for o in own),
+            1 + sum(o[1] for o in own) + sum(treeNodes[r] for r in references),
+            1 + max([o[2] for o in own] + [depth[r] for r in references] + [0]),
+            literal + sum(o[3] for o in own),
+        )
+
+    nodes = literalBytes = 0
+    for name in order[::-1]:
+        n, treeNodes[name], depth[name], b = walk(values[name])
+        nodes, literalBytes = nodes + n, literalBytes + b
+
+    # propagate the number of occurrences of each value in the expanded tree from the result to the leaves
+    occurrences = dict.fromkeys(order, 0)
+    occurrences[expression["result"]] = 1
+    for name in order:
+        for reference in _references(values[name]):
+            occurrences[reference] += occurrences[name]
+
+    return {
+        "bytes": len(json.dumps(expression)),
+        "values": len(order),
+        "nodes": nodes,
+        "treeNodes": treeNodes[expression["result"]],
+        "depth": depth[expression["result"]],
+        "duplicates": sum(o > 1 for o in occurrences.values()),
+        "literalBytes": literalBytes,
+    }
+
+
+# -- optimizer passes -----------------------------------------------------------
+
+
+class _Values:
+    """The named values of an expression being optimized, indexed by their canonical representation."""
+
+    def __init__(self, values: dict[str, dict]):
+        """Index the existing values."""
+        self.values = dict(values)
+        self.names = {_key(v): n for n, v in values.items()}
+
+    def add(self, node: dict) -> str:
+        """Store a node as a named value and return its name, reusing an identical value if any."""
+        key = _key(node)
+        if key not in self.names:
+            name = str(len(self.values))
+            while name in self.values:
+                name = f"{name}_"
+            self.values[name], self.names[key] = node, name
+        return self.names[key]
+
+
+def _hoist(expression: dict) -> dict:
+    """Move the loop-invariant subgraphs of the function bodies to named values.
+
+    A value using argument names it does not define is part of a function body: it is evaluated once per call of
+    the function. Every function invocation inside it that uses no free argument is the same for all the calls and
+    is moved to a named value of the expression, evaluated once per request.
+    """
+    nodeFree, free = _freeVariables(expression)
+    store = _Values(expression["values"])
+
+    def visit(node: dict) -> dict:
+        if "functionInvocationValue" in node and not nodeFree(node):
+            return {"valueReference": store.add(node)}
+        return _rewrite(node, visit)
+
+    for name, value in expression["values"].items():
+        if free.get(name):
+            store.values[name] = _rewrite(value, visit)
+    return {"result": expression["result"], "values": store.values}
+
+
+def _deduplicate(expression: dict) -> dict:
+    """Merge the identical named values and share the function invocations repeated inline."""
+    result, values = expression["result"], dict(expression["values"])
+
+    # merge the identical values until their references are renamed consistently
+    while True:
+        names: dict[str, str] = {}
+        canonical: dict[str, str] = {}
+        for name, value in values.items():
+            names[name] = canonical.setdefault(_key(value), name)
+        if all(k == v for k, v in names.items()):
+            break
+        values = {n: _rename(v, names) for n, v in values.items() if names[n] == n}
+        result = names[result]
+
+    # count the inline invocations and share the ones found more than once
+    counts: dict[str, int] = {}
+
+    def count(node: dict, inline: bool):
+        if inline and "functionInvocationValue" in node:
+            counts[_key(node)] = counts.get(_key(node), 0) + 1
+        [count(c, True) for c in _children(node)]
+
+    [count(v, False) for v in values.values()]
+    store = _Values(values)
+
+    def visit(node: dict) -> dict:
+        if "functionInvocationValue" in node and counts.get(_key(node), 0) > 1:
+            return {"valueReference": store.add(node)}
+        return _rewrite(node, visit)
+
+    for name, value in values.items():
+        store.values[name] = _rewrite(value, visit)
+    return {"result": result, "values": store.values}
+
+
+def _compact(expression: dict) -> dict:
+    """Drop the unreachable values and name the others from ``"0"`` in the order they are reached."""
+    order = _order(expression)
+    names = {n: str(i) for i, n in enumerate(order)}
+    values = {names[n]: _rename(expression["values"][n], names) for n in order}
+    return {"result": names[expression["result"]], "values": values}
+
+
+# -- inspector -------------------------------------------------------------------
+
+
+_state = threading.local()
+"The depth of the geetools calls recorded in each thread."
+
+
+@_register_extention(ee.geetools)
+class GraphInspector:
+    """An inspector and optimizer of the expression graphs built by geetools.
+
+    The inspector works on the Cloud API expression produced by :py:func:`ee.serializer.encode`: a ``result``
+    name and a dictionary of named ``values`` sharing the identical subgraphs. It reports the size of the request,
+    the number of nodes and the depth of the graph once expanded as a tree, the number of subgraphs repeated in
+    this tree and the bytes used by the literal values.
+
+    Used as a context manager, it records the statistics of the objects returned by every geetools accessor method
+    called by the user (the calls made internally by another geetools method are attributed to the outer one).
+    :py:meth:`report` summarizes them per method.
+
+    The :py:meth:`optimize` pass hoists the loop-invariant function invocations out of the ``map`` and ``iterate``
+    bodies and deduplicates the repeated subgraphs. :py:meth:`compute` sends the optimized expression.
+
+    Examples:
+        .. code-block:: python
+
+            import ee, geetools
+
+            ee.Initialize()
+
+            collection = ee.ImageCollection("COPERNICUS/S2_SR_HARMONIZED").filterDate("2020-01-01", "2020-01-05")
+            with ee.geetools.GraphInspector() as inspector:
+                image = collection.geetools.reduceInterval("mean")
+            print(inspector.report())
+            print(inspector.inspect(image))
+    """
+
+    calls: list[dict]
+    "The statistics of each geetools method called in the context."
+
+    def __init__(self):
+        """Initialize the inspector."""
+        self.calls = []
+        self._lock = threading.Lock()
+        self._patched: list[tuple[type, str, Any]] = []
+
+    def __enter__(self):
+        """Record the graphs returned by the geetools accessor methods."""
+        for klass, name, attribute in self._methods():
+            if isinstance(attribute, (classmethod, staticmethod)):
+                wrapped = type(attribute)(self._record(klass, name, attribute.__func__))
+            else:
+                wrapped = self._record(klass, name, attribute)
+            self._patched.append((klass, name, attribute))
+            setattr(klass, name, wrapped)
+        return self
+
+    def __exit__(self, *args):
+        """Restore the geetools accessor methods."""
+        for klass, name, attribute in self._patched:
+            setattr(klass, name, attribute)
+        self._patched = []
+
+    def encode(self, obj: ee.ComputedObject) -> dict:
+        """Encode an object as the Cloud API expression sent to the server.
+
+        Parameters:
+            obj: The Earth Engine object to encode.
+
+        Returns:
+            The expression with its ``result`` name and its named ``values``.
+        """
+        return ee.serializer.encode(obj, for_cloud_api=True)
+
+    def inspect(self, obj: ee.ComputedObject | dict) -> dict[str, int]:
+        """Compute the size statistics of the graph of an object.
+
+        Parameters:
+            obj: The Earth Engine object or an already encoded expression.
+
+        Returns:
+            The statistics listed in :py:data:`STATISTICS`: ``bytes`` of the request, number of named ``values``,
+            number of ``nodes`` sent, number of ``treeNodes`` and ``depth`` of the expanded tree, number of
+            ``duplicates`` subgraphs used more than once in this tree and ``literalBytes`` of the constants.
+        """
+        return _statistics(obj if isinstance(obj, dict) else self.encode(obj))
+
+    def optimize(self, obj: ee.ComputedObject | dict) -> dict:
+        """Optimize the graph of an object before sending it.
+
+        The loop-invariant function invocations of the function bodies are hoisted to named values, evaluated once
+        per request instead of once per element. The identical values are merged and the invocations repeated
+        inline are shared. The values are finally renamed in a canonical order.
+
+        Parameters:
+            obj: The Earth Engine object or an already encoded expression.
+
+        Returns:
+            The optimized Cloud API expression.
+        """
+        expression = obj if isinstance(obj, dict) else self.encode(obj)
+        return _compact(_deduplicate(_hoist(expression)))
+
+    def compute(self, obj: ee.ComputedObject | dict) -> Any:
+        """Evaluate an object on the server sending its optimized graph.
+
+        The expression is sent to the same ``compute`` endpoint as :py:meth:`ee.ComputedObject.getInfo`, through
+        the geetools executor.
+
+        Parameters:
+            obj: The Earth Engine object or an already encoded expression.
+
+        Returns:
+            The same value as ``obj.getInfo()``.
+
+        Warning:
+            This function is a client-side function.
+        """
+        body = {"expression": self.optimize(obj)}
+
+        def compute() -> Any:
+            projects = ee.data._get_cloud_projects().value()
+            request = projects.compute(body=body, project=ee.data._get_projects_path(), prettyPrint=False)
+            return ee.data._execute_cloud_call(request)["result"]
+
+        return executor.execute(compute)
+
+    def report(self) -> pd.DataFrame:
+        """Summarize the statistics of the recorded calls per geetools method.
+
+        Returns:
+            A table indexed by method with the number of ``calls``, the sum of the statistics of their outputs, the
+            maximum ``depth`` and the number of nodes ``added`` to the graph of the object they were called on.
+        """
+        columns = ["method", "calls", "added", *STATISTICS]
+        if not self.calls:
+            return pd.DataFrame(columns=columns).set_index("method")
+        table = pd.DataFrame(self.calls).assign(calls=1)
+        aggregations = {c: "sum" for c in columns[1:]} | {"depth": "max"}
+        return table.groupby("method", sort=False).agg(aggregations)
+
+    def _methods(self) -> list[tuple[type, str, Any]]:
+        """List the public methods of the geetools accessors registered on the Earth Engine classes."""
+        methods = []
+        for klass in vars(ee).values():
+            accessor = (
+                getattr(vars(klass).get("geetools"), "accessor", None) if isinstance(klass, type) else None
+            )
+            for name, attribute in vars(accessor or object).items():
+                if accessor is None or name.startswith("_"):
+                    continue
+                elif callable(attribute) or isinstance(attribute, (classmethod, staticmethod)):
+                    methods.append((accessor, name, attribute))
+        return methods
+
+    def _record(self, accessor: type, name: str, method: Callable) -> Callable:
+        """Wrap an accessor method to record the statistics of its output."""
+        label = f"{accessor.__name__.removesuffix('Accessor')}.{name}"
+
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            _state.depth = getattr(_state, "depth", 0) + 1
+            try:
+                output = method(*args, **kwargs)
+            finally:
+                _state.depth -= 1
+            if _state.depth == 0 and isinstance(output, ee.ComputedObject):
+                statistics = self.inspect(output)
+                source = getattr(args[0], "_obj", None) if args else None
+                before = self.inspect(source)["nodes"] if isinstance(source, ee.ComputedObject) else 0
+                with self._lock:
+                    self.calls.append({"method": label, "added": statistics["nodes"] - before, **statistics})
+            return output
+
+        return wrapper
@@ -1,6 +1,9 @@
 """Toolbox for the :py:class:`ee.Image` class."""
 from __future__ import annotations
 
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Optional
 
 import ee
@@ -12,6 +15,7 @@ import ee_extra.Spectral.core
 import ee_extra.STAC.core
 import geopandas as gpd
 import numpy as np
+import pandas as pd
 import requests
 import xarray
 from matplotlib import pyplot as plt
@@ -21,13 +25,17 @@ from pyproj import CRS, Transformer
 from xee.ext import REQUEST_BYTE_LIMIT
 
 from .accessors import register_class_accessor
-from .utils import area_units_to_m2, format_class_info, plot_data
+from .ee_executor import executor
+from .ee_profiler import Profiler
+from .utils import area_units_to_m2, format_class_info, grid_extent, plot_data
 
 
 @register_class_accessor(ee.Image, "geetools")
 class ImageAccessor:
     """Toolbox for the :py:class:`ee.Image` class."""
 
+    __slots__ = ("_obj",)
+
     def __init__(self, obj: ee.Image):
         """Initialize the Image class."""
         self._obj = obj
@@ -302,6 +310,8 @@ class ImageAccessor:
         size: int | ee.Number = 1,
         band: str | ee.String = "",
         geometry: ee.Geometry | None = None,
+        shape: str = "square",
+        chunkSize: int = 5000,
     ) -> ee.FeatureCollection:
         """Convert an image to a grid of polygons.
 
@@ -309,16 +319,22 @@ class ImageAccessor:
         Each cell will be a polygon. Note that for images that have multiple scale depending on the band,
         we will use the first one or the one stated in the parameters.
 
+        The cells are aligned on the pixel edges of the band in its native projection. Only the range of the
+        grid is computed locally, the cells are generated on the server from their column and row index, in
+        chunks of ``chunkSize`` cells, so the size of the request does not depend on the size of the grid.
+
         Parameters:
             size: The size of the grid. It will be size * pixelSize x size * pixelSize cells.
-            band: The band to burn into the grid.
+            band: The band to use as reference for the projection of the grid.
             geometry: The geometry to use as reference for the grid. If None, the image footprint will be used.
+            shape: The shape of the cells, one of ``"square"`` or ``"hexagon"``. For hexagons, ``size * pixelSize`` is the distance between 2 neighbouring cell centers.
+            chunkSize: The maximum number of cells generated in a single :py:class:`ee.List`.
 
         Returns:
             The grid as a :py:class:`FeatureCollection`.
 
-        Note:
-            The method has a known bug when the projection of the image is different from 3857. As we use a buffer, the grid cells can slightly overlap. Feel free to open an Issue and contribute if you feel it needs improvements.
+        Warning:
+            This function is a client-side function.
 
         Examples:
             .. code-block:: python
@@ -333,29 +349,93 @@ class ImageAccessor:
                 grid = image.geetools.toGrid(1, 'B2', buffer)
                 print(grid.getInfo())
         """
+        if shape not in ["square", "hexagon"]:
+            raise ValueError(f"shape must be one of ['square', 'hexagon'], got {shape}")
+
+        # gather all the information needed to build the grid in a single call
         band = ee.String(band) if band else self._obj.bandNames().get(0)
         projection = self._obj.select(band).projection()
-        size = projection.nominalScale().multiply(ee.Number(size).toInt())
+        geometry = geometry or self._obj.geometry()
+        crs = ee.Projection(projection.crs())
+        bounds = geometry.bounds(1, crs).coordinates()
+        info = ee.Dictionary({"proj": projection, "bounds": bounds, "size": ee.Number(size)})
+        info = executor.execute(info.getInfo)
+
+        # compute the range of the grid locally in the native projection of the image
+        sx, _, x0, _, sy, y0 = info["proj"]["transform"]
+        coords = np.array(info["bounds"][0])
+        bounds = (*coords.min(axis=0), *coords.max(axis=0))
+        dx, dy = abs(sx * info["size"]), abs(sy * info["size"])
+        col0, row0, cols, rows = grid_extent(bounds, (x0, y0), (dx, dy), shape)
+
+        # the anchor of a cell is its lower left corner for squares and its center for hexagons
+        if shape == "square":
+            shift, offsets = 0, [[0, 0], [dx, 0], [dx, dy], [0, dy], [0, 0]]
+        else:
+            radius, dy, shift = dx / np.sqrt(3), dx * np.sqrt(3) / 2, 0.5
+            angles = np.radians(np.arange(30, 390 + 1, 60))
+            offsets = (radius * np.stack([np.cos(angles), np.sin(angles)], axis=-1)).tolist()
+
+        def cell(i):
+            i = ee.Number(i)
+            row = i.divide(cols).floor().add(row0)
+            col = i.mod(cols).add(col0).add(row.mod(2).abs().multiply(shift))
+            x, y = col.multiply(dx).add(x0), row.multiply(dy).add(y0)
+            ring = [[x.add(ox), y.add(oy)] for ox, oy in offsets]
+            return ee.Feature(ee.Geometry.Polygon([ring], crs, False))
+
+        # generate the cells by chunks of indices on the server
+        chunks = [[i, min(i + chunkSize, cols * rows) - 1] for i in range(0, cols * rows, chunkSize)]
+        fcs = ee.List(chunks).map(
+            lambda c: ee.FeatureCollection(ee.List.sequence(ee.List(c).get(0), ee.List(c).get(1)).map(cell))
+        )
 
-        # extract the centers at the correct resolution
-        lonLat = ee.Image.pixelLonLat().reproject(projection)
-        coords = lonLat.reduceRegion(ee.Reducer.toList(), geometry, size)
+        return ee.FeatureCollection(fcs).flatten().filterBounds(geometry)
 
-        # extract them as lists
-        lat, lon = ee.List(coords.get("latitude")), ee.List(coords.get("longitude"))
+    def toGridAsset(
+        self,
+        assetId: str,
+        size: int | ee.Number = 1,
+        band: str | ee.String = "",
+        geometry: ee.Geometry | None = None,
+        shape: str = "square",
+        description: str = "",
+        chunkSize: int = 5000,
+    ) -> ee.batch.Task:
+        """Export the grid of an image to an asset.
 
-        # we can now map them user their index to point -> buffer -> square
-        index = ee.List.sequence(0, lat.size().subtract(2))
-        squares = index.map(
-            lambda i: (
-                ee.Geometry.Point([lon.get(i), lat.get(i)]).buffer(size.divide(2)).bounds(0.01, projection)
-            )
-        )
+        Large grids are expensive to rebuild every time they are used. This method builds the grid with
+        :py:meth:`toGrid <geetools.ImageAccessor.toGrid>` and exports it as a table asset so it can be reused
+        in other computations. The task is not started.
+
+        Parameters:
+            assetId: The destination asset id.
+            size: The size of the grid. It will be size * pixelSize x size * pixelSize cells.
+            band: The band to use as reference for the projection of the grid.
+            geometry: The geometry to use as reference for the grid. If None, the image footprint will be used.
+            shape: The shape of the cells, one of ``"square"`` or ``"hexagon"``.
+            description: The description of the task. If not set, the name of the asset will be used.
+            chunkSize: The maximum number of cells generated in a single :py:class:`ee.List`.
+
+        Returns:
+            The export task.
+
+        Examples:
+            .. code-block:: python
 
-        # make the grid
-        features = ee.List(squares).map(lambda g: ee.Feature(ee.Geometry(g)))
+                import ee, geetools
 
-        return ee.FeatureCollection(features)
+                ee.Initialize()
+
+                src = 'COPERNICUS/S2_SR_HARMONIZED/20200101T100319_20200101T100321_T32TQM'
+                image = ee.Image(src)
+                buffer = ee.Geometry.Point([12.4534, 41.9033]).buffer(100)
+                task = image.geetools.toGridAsset("projects/my-project/assets/grid", 1, 'B2', buffer)
+                task.start()
+        """
+        grid = self.toGrid(size, band, geometry, shape, chunkSize)
+        description = description or assetId.split("/")[-1]
+        return ee.batch.Export.table.toAsset(collection=grid, description=description, assetId=assetId)
 
     def clipOnCollection(
         self, fc: ee.FeatureCollection, keepProperties: int | ee.Number = 1
@@ -1060,7 +1140,7 @@ class ImageAccessor:
                 ee.ImageCollection('COPERNICUS/S2_SR').first().geetools.getSTAC()
         """
         # extract the Asset id from the imagecollection
-        assetId = self._obj.get("system:id").getInfo()
+        assetId = executor.execute(self._obj.get("system:id").getInfo)
 
         # search for the project in the GEE catalog and extract the project catalog URL
         project = assetId.split("/")[0]
@@ -1657,7 +1737,7 @@ class ImageAccessor:
 
         # compute the extend of the image so the unit displayed for x and y are matching the required crs
         proj = Transformer.from_crs(CRS("EPSG:4326"), CRS(crs), always_xy=True)
-        region_bounds = region.bounds().coordinates().get(0).getInfo()
+        region_bounds = executor.execute(region.bounds().coordinates().get(0).getInfo)
         min_x, min_y = proj.transform(*region_bounds[0])
         max_x, max_y = proj.transform(*region_bounds[2])
 
@@ -1677,7 +1757,7 @@ class ImageAccessor:
         # add the feature collection if provided
         # we need to extract the geometries and plot them
         if fc is not None:
-            gdf = gpd.GeoDataFrame.from_features(fc.getInfo()["features"])
+            gdf = gpd.GeoDataFrame.from_features(executor.execute(fc.getInfo)["features"])
             gdf = gdf.set_crs("EPSG:4326").to_crs(crs)
             gdf.boundary.plot(ax=ax, color=color)
 
@@ -1988,6 +2068,150 @@ class ImageAccessor:
 
         return ee.Dictionary.fromLists(features, values)
 
+    def byRegionsChunked(
+        self,
+        regions: ee.FeatureCollection,
+        reducer: str | ee.Reducer = "mean",
+        bands: list[str] | None = None,
+        regionId: str = "system:index",
+        labels: list[str] | None = None,
+        scale: int = 10000,
+        crs: str | None = None,
+        crsTransform: list | None = None,
+        tileScale: float = 1,
+        chunkSize: int = 1000,
+        chunkArea: float | None = None,
+        maxWorkers: int = 4,
+        profiler: Profiler | None = None,
+    ) -> pd.DataFrame:
+        """Compute a reducer in each region of the image for each band, one chunk of regions at a time.
+
+        :py:meth:`byRegions <geetools.ImageAccessor.byRegions>` and :py:meth:`byBands <geetools.ImageAccessor.byBands>`
+        reduce all the regions in a single request which fails for large collections. This method splits the regions
+        in chunks of ``chunkSize`` features (or ``chunkArea`` square meters if set), evaluates them concurrently and
+        concatenates the results in a :py:class:`pandas.DataFrame` with one row per region and one column per band.
+        Use ``.T`` to get the same layout as :py:meth:`byBands <geetools.ImageAccessor.byBands>`.
+
+        The chunks are evaluated through the geetools :py:class:`Executor <geetools.Executor>`: throttled chunks are
+        retried with a backoff and chunks running out of memory are computed again with a doubled ``tileScale``.
+
+        Parameters:
+            regions: The regions to compute the reducer in.
+            reducer: The name of the reducer or a reducer object to use. Default is ``"mean"``.
+            bands: The bands to compute the reducer on. Default to all bands.
+            regionId: The property used to label region. Defaults to ``"system:index"``.
+            labels: The labels to use for the output columns. Default to the band names.
+            scale: The scale to use for the computation. Default is 10000m.
+            crs: The projection to work in. If unspecified, the projection of the image's first band is used. If specified in addition to scale, rescaled to the specified scale.
+            crsTransform: The list of CRS transform values. This is a row-major ordering of the 3x2 transform matrix. This option is mutually exclusive with 'scale', and replaces any transform already set on the projection.
+            tileScale: The initial tileScale used for each chunk.
+            chunkSize: The maximum number of regions in a chunk.
+            chunkArea: The maximum total area of the regions in a chunk in square meters. If None, only ``chunkSize`` is used.
+            maxWorkers: The number of chunks evaluated at the same time.
+            profiler: A running :py:class:`Profiler <geetools.Profiler>` (entered with a ``with`` statement) to record the progress and the timing of each chunk in its ``timings`` attribute.
+
+        Returns:
+            A DataFrame indexed by the region ids with the reduced value of each band as columns.
+
+        Warning:
+            This function is a client-side function.
+
+        See Also:
+            - :docstring:`ee.Image.geetools.byRegions`
+            - :docstring:`ee.Image.geetools.byBands`
+
+        Examples:
+            .. code-block:: python
+
+                import ee, geetools
+
+                ee.Initialize()
+
+                ecoregions = ee.FeatureCollection("projects/google/charts_feature_example").select(["label", "value","warm"])
+                normClim = ee.ImageCollection('OREGONSTATE/PRISM/Norm91m').toBands()
+                with ee.geetools.Profiler() as p:
+                    df = normClim.geetools.byRegionsChunked(ecoregions, "mean", scale=10000, chunkSize=3, profiler=p)
+                print(df)
+                print(p.timings)
+        """
+        if profiler is not None and profiler.timings is None:
+            raise ValueError("The profiler must be entered with a 'with' statement to record the chunks.")
+
+        # gather the number of regions, their areas and the labels in a single call
+        eeBands = ee.List(bands) if bands is not None else self._obj.bandNames()
+        eeLabels = ee.List(labels) if labels is not None else eeBands
+        areaName = "__geetools_area__"
+        info = {"size": regions.size(), "labels": eeLabels}
+        if chunkArea is not None:
+            withArea = regions.map(lambda f: f.set(areaName, f.geometry().area(1)))
+            info["areas"] = withArea.aggregate_array(areaName)
+        info = executor.execute(ee.Dictionary(info).getInfo)
+        columns = info["labels"]
+        areas = info.get("areas", [0] * info["size"])
+
+        # group the regions by position in chunks respecting both the count and the area limits, as
+        # (offset, count) pairs so that duplicated ids never put the same region in several chunks
+        chunks: list[list[int]] = [[0, 0]]
+        total = 0.0
+        for area in areas:
+            full = chunks[-1][1] >= chunkSize or (chunkArea is not None and total + area > chunkArea)
+            if full and chunks[-1][1] > 0:
+                chunks.append([sum(chunks[-1]), 0])
+                total = 0.0
+            chunks[-1][1] += 1
+            total += area
+        chunks = [c for c in chunks if c[1] > 0]
+
+        red = getattr(ee.Reducer, reducer)() if isinstance(reducer, str) else reducer
+        image = self._obj.select(eeBands).rename(eeLabels)
+        selectors = columns if regionId == "system:index" else [*columns, regionId]
+        lock = threading.Lock()
+
+        # the profile hook of ee.profilePrinting is thread-local, it is installed in the workers so that the
+        # profile of the caller records the requests of every chunk
+        hook = ee.data._thread_locals.profile_hook
+
+        def reduce(index: int, chunk: list) -> list:
+            start, attempts = time.perf_counter(), []
+
+            def compute(tileScale: float) -> list:
+                attempts.append(tileScale)
+                offset, count = chunk
+                fc = image.reduceRegions(
+                    collection=ee.FeatureCollection(regions.toList(count, offset)),
+                    reducer=red,
+                    scale=scale,
+                    crs=crs,
+                    crsTransform=crsTransform,
+                    tileScale=tileScale,
+                )
+                return fc.select(selectors, None, False).getInfo()["features"]
+
+            with ee.data.profiling(hook):
+                features = executor.execute(compute, tileScale=tileScale)
+            if profiler is not None:
+                with lock:
+                    profiler.timings.append(
+                        {
+                            "chunk": index,
+                            "size": chunk[1],
+                            "tileScale": attempts[-1],
+                            "attempts": len(attempts),
+                            "seconds": time.perf_counter() - start,
+                        }
+                    )
+            return features
+
+        with ThreadPoolExecutor(max_workers=maxWorkers) as pool:
+            results = pool.map(reduce, range(len(chunks)), chunks)
+            features = [f for chunk in results for f in chunk]
+
+        # build the table, missing values (e.g. masked regions) are set to NaN
+        index = [f["id"] if regionId == "system:index" else f["properties"][regionId] for f in features]
+        rows = [{c: f["properties"].get(c) for c in columns} for f in features]
+        rows = [{c: np.nan if v is None else v for c, v in r.items()} for r in rows]
+        return pd.DataFrame(rows, index=pd.Index(index, name=regionId), columns=columns)
+
     def plot_by_regions(
         self,
         type: str,
@@ -2049,28 +2273,31 @@ class ImageAccessor:
                 normClim.geetools.plot_by_regions(ecoregions, ee.Reducer.mean(), scale=10000)
         """
         # get the data from the server
-        data = self.byBands(
-            regions=regions,
-            reducer=reducer,
-            bands=bands,
-            regionId=regionId,
-            labels=labels,
-            scale=scale,
-            crs=crs,
-            crsTransform=crsTransform,
+        data = executor.execute(
+            lambda tileScale: self.byBands(
+                regions=regions,
+                reducer=reducer,
+                bands=bands,
+                regionId=regionId,
+                labels=labels,
+                scale=scale,
+                crs=crs,
+                crsTransform=crsTransform,
+                tileScale=tileScale,
+            ).getInfo(),
             tileScale=tileScale,
-        ).getInfo()
+        )
 
         # get all the id values, they must be string so we are forced to cast them manually
         # the default casting is broken from Python side: https://issuetracker.google.com/issues/329106322
         features = regions.aggregate_array(regionId)
         isString = lambda i: ee.Algorithms.ObjectType(i).compareTo("String").eq(0)  # noqa: E731
         features = features.map(lambda i: ee.Algorithms.If(isString(i), i, ee.Number(i).format()))
-        features = features.getInfo()
+        features = executor.execute(features.getInfo)
 
         # extract the labels from the parameters
         eeBands = ee.List(bands) if bands is not None else self._obj.bandNames()
-        labels = labels if labels is not None else eeBands.getInfo()
+        labels = labels if labels is not None else executor.execute(eeBands.getInfo)
 
         # reorder the data according to the labels id set by the user
         data = {b: {f: data[b][f] for f in features} for b in labels}
@@ -2140,28 +2367,31 @@ class ImageAccessor:
                 normClim.geetools.plot_by_bands(ecoregions, ee.Reducer.mean(), scale=10000)
         """
         # get the data from the server
-        data = self.byRegions(
-            regions=regions,
-            reducer=reducer,
-            bands=bands,
-            regionId=regionId,
-            labels=labels,
-            scale=scale,
-            crs=crs,
-            crsTransform=crsTransform,
+        data = executor.execute(
+            lambda tileScale: self.byRegions(
+                regions=regions,
+                reducer=reducer,
+                bands=bands,
+                regionId=regionId,
+                labels=labels,
+                scale=scale,
+                crs=crs,
+                crsTransform=crsTransform,
+                tileScale=tileScale,
+            ).getInfo(),
             tileScale=tileScale,
-        ).getInfo()
+        )
 
         # get all the id values, they must be string so we are forced to cast them manually
         # the default casting is broken from Python side: https://issuetracker.google.com/issues/329106322
         features = regions.aggregate_array(regionId)
         isString = lambda i: ee.Algorithms.ObjectType(i).compareTo("String").eq(0)  # noqa: E731
         features = features.map(lambda i: ee.Algorithms.If(isString(i), i, ee.Number(i).format()))
-        features = features.getInfo()
+        features = executor.execute(features.getInfo)
 
         # extract the labels from the parameters
         eeBands = ee.List(bands) if bands is not None else self._obj.bandNames()
-        labels = labels if labels is not None else eeBands.getInfo()
+        labels = labels if labels is not None else executor.execute(eeBands.getInfo)
 
         # reorder the data according to the labels id set by the user
         data = {f: {b: data[f][b] for b in labels} for f in features}
@@ -2228,7 +2458,7 @@ class ImageAccessor:
         # extract the bands from the image
         eeBands = ee.List(bands) if bands is not None else self._obj.bandNames()
         eeLabels = ee.List(labels).flatten() if labels is not None else eeBands
-        new_labels: list[str] = eeLabels.getInfo()
+        new_labels: list[str] = executor.execute(eeLabels.getInfo)
         new_colors: list[str] = colors if colors is not None else plt.get_cmap("tab10").colors
 
         # retrieve the region from the parameters
@@ -2248,17 +2478,20 @@ class ImageAccessor:
             "tileScale": tileScale,
         }
 
-        # compute the min and max values of the bands so w can scale the bins of the histogram
-        min = image.reduceRegion(**{"reducer": ee.Reducer.min(), **params})
-        min = min.values().reduce(ee.Reducer.min())
+        def histogram(**params) -> dict:
+            # compute the min and max values of the bands so w can scale the bins of the histogram
+            min = image.reduceRegion(**{"reducer": ee.Reducer.min(), **params})
+            min = min.values().reduce(ee.Reducer.min())
+
+            max = image.reduceRegion(**{"reducer": ee.Reducer.max(), **params})
+            max = max.values().reduce(ee.Reducer.max())
 
-        max = image.reduceRegion(**{"reducer": ee.Reducer.max(), **params})
-        max = max.values().reduce(ee.Reducer.max())
+            # compute the histogram. The result is a dictionary with each band as key and the histogram
+            # as values. The histograp is a list of [start of bin, value] pairs
+            reducer = ee.Reducer.fixedHistogram(min, max, bins)
+            return image.reduceRegion(**{"reducer": reducer, **params}).getInfo()
 
-        # compute the histogram. The result is a dictionary with each band as key and the histogram
-        # as values. The histograp is a list of [start of bin, value] pairs
-        reducer = ee.Reducer.fixedHistogram(min, max, bins)
-        raw_data = image.reduceRegion(**{"reducer": reducer, **params}).getInfo()
+        raw_data = executor.execute(histogram, **params)
 
         # massage raw data to reshape them as usable source for an Axes plot
         # first extract the x coordinates of the plot as a list of bins borders
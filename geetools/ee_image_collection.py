@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import uuid
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime as dt
 from typing import Any, Iterable
 
@@ -14,6 +15,7 @@ import ee_extra.QA.clouds
 import ee_extra.QA.pipelines
 import ee_extra.Spectral.core
 import ee_extra.STAC.core
+import pandas as pd
 import requests
 import xarray
 from ee import apifunction
@@ -22,7 +24,8 @@ from xarray import Dataset
 from xee.ext import REQUEST_BYTE_LIMIT
 
 from .accessors import register_class_accessor
-from .utils import plot_data
+from .ee_executor import executor
+from .utils import ClientCache, plot_data
 
 PY_DATE_FORMAT = "%Y-%m-%dT%H-%M-%S"
 "The python format to use to parse dates coming from GEE."
@@ -30,14 +33,92 @@ PY_DATE_FORMAT = "%Y-%m-%dT%H-%M-%S"
 EE_DATE_FORMAT = "YYYY-MM-dd'T'HH-mm-ss"
 "The javascript format to use to burn date object in GEE."
 
+_INDEX_CACHE = ClientCache()
+"Client-side memoization of the ``system:index`` values of the collections, keyed by the hash of the collection graph."
+
+_SIGNATURE_CACHE = ClientCache()
+"Client-side memoization of the distinct band names of the collections, keyed by the hash of the collection graph and property."
+
+
+class ILocIndexer:
+    """Positional access to the images of an :py:class:`ee.ImageCollection`.
+
+    The indexer can be called with an integer (``ic.geetools.iloc(0)``) or indexed with an integer or a slice
+    (``ic.geetools.iloc[2:5]``). Integers and slices with a positive step only read the requested window of
+    the collection. Slices with a negative step need the ``system:index`` values fetched beforehand with
+    :py:meth:`index <geetools.ImageCollectionAccessor.index>`, the indexer never fetches them itself. When
+    these values are known and unique, single images are retrieved with a filter on their ``system:index``.
+    """
+
+    def __init__(self, obj: ee.ImageCollection, ids: list[str] | None = None):
+        """Initialize the indexer.
+
+        Parameters:
+            obj: The collection to index.
+            ids: The ``system:index`` values of the collection if they are already known client-side.
+        """
+        self._obj, self._ids = obj, ids
+        self._unique = ids is not None and len(set(ids)) == len(ids)
+
+    def __call__(self, index: int | ee.Number) -> ee.Image:
+        """Get the image at the specified index."""
+        return self[index]
+
+    def __getitem__(self, key: int | ee.Number | slice) -> ee.Image | ee.ImageCollection:
+        """Get the image at the specified index or the collection of the images in the specified slice."""
+        if isinstance(key, slice):
+            return self._slice(key)
+
+        if isinstance(key, int) and self._unique:
+            return ee.Image(self._obj.filter(ee.Filter.eq("system:index", self._ids[key])).first())
+        if isinstance(key, int):
+            offset = ee.Number(key) if key >= 0 else self._obj.size().add(key)
+        else:
+            key = ee.Number(key)
+            offset = ee.Number(ee.Algorithms.If(key.lt(0), self._obj.size().add(key), key))
+        return ee.Image(self._obj.toList(1, offset).get(0))
+
+    def _slice(self, key: slice) -> ee.ImageCollection:
+        """Get the collection of the images in the specified slice."""
+        step = 1 if key.step is None else key.step
+        if step == 0:
+            raise ValueError("slice step cannot be zero")
+
+        # positive steps read the window of the collection in its own order
+        if step > 0:
+            size = self._obj.size()
+            start = ee.Number(key.start or 0)
+            stop = ee.Number(size if key.stop is None else key.stop)
+            start = start.add(size).max(0) if (key.start or 0) < 0 else start.min(size)
+            stop = stop.add(size).max(0) if key.stop is not None and key.stop < 0 else stop.min(size)
+            count = stop.subtract(start).max(0)
+            images = ee.List(ee.Algorithms.If(count.gt(0), self._obj.toList(count, start), []))
+            return ee.ImageCollection(images.slice(0, None, step) if step > 1 else images)
+
+        # negative steps reverse the order, the images are rebuilt one by one from the known positions
+        if self._ids is None:
+            raise ValueError(
+                "Slices with a negative step need the system:index values of the collection, call "
+                "index() on the collection first."
+            )
+        positions = list(range(*key.indices(len(self._ids))))
+        if self._unique:
+            images = [self._obj.filter(ee.Filter.eq("system:index", self._ids[i])).first() for i in positions]
+        else:
+            collection = self._obj.toList(len(self._ids))
+            images = [collection.get(i) for i in positions]
+        return ee.ImageCollection(ee.List(images))
+
 
 @register_class_accessor(ee.ImageCollection, "geetools")
 class ImageCollectionAccessor:
     """Toolbox for the :py:class:`ee.ImageCollection` class."""
 
+    __slots__ = ("_index", "_obj")
+
     def __init__(self, obj: ee.ImageCollection):
         """Instantiate the class."""
-        self._obj = obj
+        self._obj, self._index = obj, None
 
     # -- ee-extra wrapper ------------------------------------------------------
     def maskClouds(
@@ -351,7 +432,7 @@ class ImageCollectionAccessor:
                 ee.ImageCollection('COPERNICUS/S2_SR').geetools.getSTAC()
         """
         # extract the Asset id from the imagecollection
-        assetId = self._obj.get("system:id").getInfo()
+        assetId = executor.execute(self._obj.get("system:id").getInfo)
 
         # search for the project in the GEE catalog and extract the project catalog URL
         project = assetId.split("/")[0]
@@ -554,14 +635,18 @@ class ImageCollectionAccessor:
         masks = self._obj.map(lambda i: i.mask())
         return ee.Image(masks.sum().gt(0))
 
-    def iloc(self, index: int) -> ee.Image:
+    @property
+    def iloc(self) -> ILocIndexer:
         """Get Image from the :py:class:`ee.ImageCollection` by index.
 
-        Args:
-            index: Index of the image to get.
+        The indexer accepts an integer to get a single :py:class:`ee.Image` or a slice to get an
+        :py:class:`ee.ImageCollection`. Only the requested window of the collection is read on the server.
+        Slices with a negative step need the ``system:index`` values fetched beforehand with
+        :py:meth:`index <geetools.ImageCollectionAccessor.index>` on a collection with the same graph, they are
+        never fetched implicitly.
 
         Returns:
-            :py:class:`ee.Image` at the specified index.
+            The positional indexer of the collection.
 
         Examples:
             .. code-block:: python
@@ -575,16 +660,65 @@ class ImageCollectionAccessor:
                 geom = ee.Geometry.Point(-122.196, 41.411);
                 ic2018 = ic.filterBounds(geom).filterDate('2019-07-01', '2019-10-01')
                 ic2018.geetools.iloc(0).getInfo()
+                ic2018.geetools.iloc[2:5].size().getInfo()
         """
-        return ee.Image(self._obj.toList(self._obj.size()).get(index))
+        ids = self._index if self._index is not None else _INDEX_CACHE.get(ClientCache.key(self._obj))
+        return ILocIndexer(self._obj, ids)
+
+    def index(self) -> list[str]:
+        """Get the ``system:index`` values of the images of the collection.
+
+        The values are fetched only once per collection and kept in memory so that the next positional
+        access with :py:attr:`iloc <geetools.ImageCollectionAccessor.iloc>` are simple filters on the server.
+
+        Returns:
+            The list of the ``system:index`` values in the order of the collection.
+
+        Warning:
+            This function is a client-side function.
+
+        Examples:
+            .. code-block:: python
+
+                import ee, geetools
+
+                ee.Initialize()
+
+                ic = ee.ImageCollection('COPERNICUS/S2_SR');
 
-    def integral(self, band: str, time: str = "system:time_start", unit: str = "") -> ee.Image:
+                geom = ee.Geometry.Point(-122.196, 41.411);
+                ic2018 = ic.filterBounds(geom).filterDate('2019-07-01', '2019-10-01')
+                print(ic2018.geetools.index())
+        """
+        if self._index is None:
+            key = ClientCache.key(self._obj)
+            if _INDEX_CACHE.get(key) is None:
+                ids = self._obj.aggregate_array("system:index")
+                _INDEX_CACHE.set(key, executor.execute(ids.getInfo))
+            self._index = _INDEX_CACHE.get(key)
+        return self._index
+
+    def integral(
+        self, band: str, time: str = "system:time_start", unit: str = "", ignoreMasked: bool = False
+    ) -> ee.Image:
         """Compute the integral of a band over time or a specified property.
 
+        The integral is approximated with the trapezoidal rule written as a weighted sum: each image is weighted
+        by half the time gap between its previous and next neighbours. The weights are computed in a single
+        step from the timestamps of the collection so the images are then reduced in parallel with a single
+        ``map`` and ``sum``.
+
+        The images without a ``time`` property are dropped. By default a pixel masked in any image is masked in
+        the integral. With ``ignoreMasked`` the masked pixels are skipped instead: the weights of the valid
+        observations of each pixel are rescaled so that they cover the full period of the collection (i.e. the
+        time-weighted mean of the valid values multiplied by the period length). Both are identical when no pixel
+        is masked.
+
         Args:
             band: the name of the band to integrate.
             time: the name of the property to use as time. It must be a date property of the images.
-            unit: the time unit use to compute the integral. It can be one of the following: ``year``, ``month``, ``day``, ``hour``, ``minute``, ``second``. If non is set, the time will be normalized on the integral length.
+            unit: the time unit use to compute the integral. It can be one of the following: ``year``, ``month``, ``week``, ``day``, ``hour``, ``minute``, ``second``. Months and years follow the calendar so they don't have a fixed length. If non is set, the time will be normalized on the integral length.
+            ignoreMasked: whether to integrate the valid observations of the pixels masked in some images.
 
         Returns:
             An :py:class:`ee.Image` object with the integrated band for each pixel.
@@ -603,48 +737,59 @@ class ImageCollectionAccessor:
                 integral = collection.geetools.integral("B1")
                 print(integral.getInfo())
         """
-        # compute the intervals along the x axis
+        units = ["year", "month", "week", "day", "hour", "minute", "second", ""]
+        if unit not in units:
+            raise ValueError(f"unit must be one of {units}, got {unit}")
+
+        # compute the position of each image along the x axis in the requested unit.
         # the GEE time is stored as a milliseconds timestamp. If the time unit is not set,
         # the integral is normalized on the total time length of the time series
-        minTime = self._obj.aggregate_min(time)
-        maxTime = self._obj.aggregate_max(time)
-        intervals = {
-            "year": ee.Number(1000 * 60 * 60 * 24 * 365),  # 1 year in milliseconds
-            "month": ee.Number(1000 * 60 * 60 * 24 * 30),  # 1 month in milliseconds
-            "day": ee.Number(1000 * 60 * 60 * 24),  # 1 day in milliseconds
-            "hour": ee.Number(1000 * 60 * 60),  # 1 hour in milliseconds
-            "minute": ee.Number(1000 * 60),  # 1 minute in milliseconds
-            "second": ee.Number(1000),  # 1 second in milliseconds
-            "": ee.Number(maxTime).subtract(ee.Number(minTime)),
-        }
-        interval = intervals[unit]
-
-        # initialize the sum with a 0 value initial item
-        # all the properties of the first image of the collection are copied
+        ic = self._obj.filter(ee.Filter.notNull([time])).sort(time)
+        times = ic.aggregate_array(time)
+        start, end = ee.Date(times.get(0)), ee.Date(times.get(-1))
+        if unit == "":
+            length = end.difference(start, "second")
+            positions = times.map(lambda t: ee.Date(t).difference(start, "second").divide(length))
+        else:
+            positions = times.map(lambda t: ee.Date(t).difference(start, unit))
+
+        # the weight of each point is half the distance between its neighbours (only one for the extremities)
+        previous = ee.List([positions.get(0)]).cat(positions.slice(0, -1))
+        following = positions.slice(1).add(positions.get(-1))
+        weights = following.zip(previous).map(
+            lambda p: ee.Number(ee.List(p).get(0)).subtract(ee.List(p).get(1)).divide(2)
+        )
+        total = ee.Number(positions.get(-1)).subtract(positions.get(0))
+
+        # compute the weighted values and the weights of the valid pixels in one single map, the weights
+        # are paired with the images by position as the times were aggregated in the same order
+        def weightImage(pair):
+            image, weight = ee.Image(ee.List(pair).get(0)), ee.Number(ee.List(pair).get(1))
+            value = image.select(band)
+            weightBand = ee.Image.constant(weight).updateMask(value.mask()).rename("weight")
+            return value.multiply(weight).rename("integral").addBands(weightBand.toFloat())
+
+        weighted = ee.ImageCollection(ic.toList(ic.size()).zip(weights).map(weightImage))
+        sums = weighted.sum()
+        integral = sums.select("integral").divide(sums.select("weight")).multiply(total)
+        if ignoreMasked is False:
+            valid = weighted.select("weight").count().eq(ic.size())
+            integral = integral.updateMask(valid)
+
+        # for single image collections or collections with a unique date the integral is 0
+        integral = ee.Image(ee.Algorithms.If(total.eq(0), ee.Image.constant(0), integral))
         first = self._obj.first()
-        zero = ee.Image.constant(0).copyProperties(first, first.propertyNames())
-        s = ee.Image(zero).rename("integral").set("last", zero)
-
-        # compute the approximation of the integral using the trapezoidal method
-        # each local interval is approximated by the corresponding trapez and the
-        # sum is updated
-        def computeIntegral(image, integral):
-            image = ee.Image(image).select(band)
-            integral = ee.Image(integral)
-            last = ee.Image(integral.get("last"))
-            locMinTime = ee.Number(last.get(time))
-            locMaxTime = ee.Number(image.get(time))
-            locInterval = locMaxTime.subtract(locMinTime).divide(interval)
-            locIntegral = last.add(image).multiply(locInterval).divide(2)
-            return integral.add(locIntegral).set("last", image)
-
-        return ee.Image(self._obj.iterate(computeIntegral, s))
+
+        return ee.Image(integral.rename("integral").copyProperties(first, first.propertyNames()))
 
     def outliers(
         self,
         bands: list[str] | ee.List | None = None,
         sigma: float | int | ee.Number = 2,
         drop: bool = False,
+        method: str = "stdDev",
+        sample: int | None = None,
+        bounds: ee.Image | str | None = None,
     ) -> ee.ImageCollection:
         """Compute the outlier for each pixel in the specified bands.
 
@@ -667,12 +812,17 @@ class ImageCollectionAccessor:
 
         Optionally users can discard this band by setting ``drop`` to ``True`` and the outlier will simply be masked from each image. This is useful when the outlier band is not needed and the user wants to save space.
 
+        The statistics are computed in a single pass over the collection. More robust fences can be used with the ``method`` parameter, see :py:meth:`outlierBounds <geetools.ImageCollectionAccessor.outlierBounds>`. For large collections, the bounds can be computed once, exported as an asset and reused with the ``bounds`` parameter.
+
         idea from: https://www.kdnuggets.com/2017/02/removing-outliers-standard-deviation-python.html
 
         Args:
             bands: The bands to evaluate for outliers. If empty, all bands are evaluated.
             sigma: The number of standard deviations to use to compute the outlier.
             drop: Whether to drop the outlier band from the images.
+            method: The statistic used to compute the fences, one of ``"stdDev"``, ``"mad"`` or ``"iqr"``.
+            sample: The number of randomly selected images used to compute the statistics. If None, all the images are used.
+            bounds: A precomputed image of bounds or its asset id as produced by :py:meth:`outlierBounds <geetools.ImageCollectionAccessor.outlierBounds>`. If set, ``sigma``, ``method`` and ``sample`` are ignored.
 
         Returns:
             A :py:class:`ee.ImageCollection` with the outlier band added to each image or masked if ``drop`` is ``True``.
@@ -696,29 +846,100 @@ class ImageCollectionAccessor:
         statBands = ee.List(bands) if bands is not None else initBands
         outBands = statBands.map(lambda b: ee.String(b).cat("_outlier"))
 
-        # compute the mean and std dev for each band
-        statCollection = self._obj.select(statBands)
-        mean = statCollection.mean()
-        stdDev = statCollection.reduce(ee.Reducer.stdDev())
-        minValues = mean.subtract(stdDev.multiply(sigma))
-        maxValues = mean.add(stdDev.multiply(sigma))
+        # compute or load the fences of each band
+        if bounds is None:
+            bounds = self.outlierBounds(statBands, sigma, method, sample)
+        bounds = ee.Image(bounds)
+        minValues = bounds.select(statBands.map(lambda b: ee.String(b).cat("_min"))).rename(statBands)
+        maxValues = bounds.select(statBands.map(lambda b: ee.String(b).cat("_max"))).rename(statBands)
 
-        # compute the outlier band for each image
+        # compute the outlier band for each image and mask them if requested in the same map
         def computeOutlierBands(i):
-            outImage = i.select(statBands)
-            outImage = outImage.gt(maxValues).Or(outImage.lt(minValues))
-            return i.addBands(outImage.rename(outBands))
+            values = i.select(statBands)
+            outImage = values.gt(maxValues).Or(values.lt(minValues)).rename(outBands)
+            if drop is True:
+                return i.addBands(values.updateMask(outImage.Not()), overwrite=True).select(initBands)
+            return i.addBands(outImage)
+
+        return ee.ImageCollection(self._obj.map(computeOutlierBands))
+
+    def outlierBounds(
+        self,
+        bands: list[str] | ee.List | None = None,
+        sigma: float | int | ee.Number = 2,
+        method: str = "stdDev",
+        sample: int | None = None,
+    ) -> ee.Image:
+        """Compute the pixelwise fences outside of which a value is considered as an outlier.
 
-        ic = self._obj.map(computeOutlierBands)
+        The fences are computed with one of the following methods:
 
-        # drop the outlier band and mask each image if requested
-        def maskOutliers(i):
-            maskedBands = i.select(statBands).updateMask(i.select(outBands).Not())
-            return i.addBands(maskedBands, overwrite=True).select(initBands)
+        - ``"stdDev"``: ``mean ± sigma * stdDev``, the mean and standard deviation are computed in a single reducer pass.
+        - ``"mad"``: ``median ± sigma * 1.4826 * MAD`` where MAD is the median absolute deviation to the median. It is robust to the outliers themselves.
+        - ``"iqr"``: ``Q1 - sigma * IQR`` and ``Q3 + sigma * IQR`` where IQR is the interquartile range (Tukey fences, usually with ``sigma=1.5``).
 
-        ic = ic if drop is False else ic.map(maskOutliers)
+        The bounds image can be exported as an asset to be reused in :py:meth:`outliers <geetools.ImageCollectionAccessor.outliers>`
+        without computing the statistics again.
 
-        return ee.ImageCollection(ic)
+        Args:
+            bands: The bands to evaluate for outliers. If empty, all bands are evaluated.
+            sigma: The multiplier of the dispersion statistic.
+            method: The statistic used to compute the fences, one of ``"stdDev"``, ``"mad"`` or ``"iqr"``.
+            sample: The number of randomly selected images used to compute the statistics. If None, all the images are used.
+
+        Returns:
+            An image with 2 bands for each evaluated band: ``<band>_min`` and ``<band>_max``.
+
+        Examples:
+            .. code-block:: python
+
+                import ee, geetools
+
+                collection = (
+                    ee.ImageCollection("LANDSAT/LC08/C01/T1_TOA")
+                    .filterBounds(ee.Geometry.Point(-122.262, 37.8719))
+                    .filterDate("2014-01-01", "2014-12-31")
+                )
+
+                bounds = collection.geetools.outlierBounds(["B1", "B2"], 3, "mad", sample=50)
+                task = ee.batch.Export.image.toAsset(bounds, assetId="projects/my-project/assets/bounds", scale=30)
+                task.start()
+
+                # once the task is finished
+                outliers = collection.geetools.outliers(["B1", "B2"], bounds="projects/my-project/assets/bounds")
+        """
+        if method not in ["stdDev", "mad", "iqr"]:
+            raise ValueError(f"method must be one of ['stdDev', 'mad', 'iqr'], got {method}")
+
+        statBands = ee.List(bands) if bands is not None else self._obj.first().bandNames()
+        statCollection = self._obj.select(statBands)
+        if sample is not None:
+            randomName = "__geetools_random__"
+            statCollection = ee.ImageCollection(statCollection.randomColumn(randomName).limit(sample, randomName))
+        sigma = ee.Number(sigma)
+
+        # compute the center and the spread of each band, the reducer output names are
+        # suffixes of the band names
+        suffixed = lambda suffix: statBands.map(lambda b: ee.String(b).cat(suffix))  # noqa: E731
+        if method == "stdDev":
+            reducer = ee.Reducer.mean().combine(ee.Reducer.stdDev(), sharedInputs=True)
+            stats = statCollection.reduce(reducer)
+            center = stats.select(suffixed("_mean")).rename(statBands)
+            spread = stats.select(suffixed("_stdDev")).rename(statBands).multiply(sigma)
+            minValues, maxValues = center.subtract(spread), center.add(spread)
+        elif method == "mad":
+            median = statCollection.median().rename(statBands)
+            deviations = statCollection.map(lambda i: i.subtract(median).abs())
+            spread = deviations.median().rename(statBands).multiply(sigma.multiply(1.4826))
+            minValues, maxValues = median.subtract(spread), median.add(spread)
+        else:
+            stats = statCollection.reduce(ee.Reducer.percentile([25, 75]))
+            q1 = stats.select(suffixed("_p25")).rename(statBands)
+            q3 = stats.select(suffixed("_p75")).rename(statBands)
+            spread = q3.subtract(q1).multiply(sigma)
+            minValues, maxValues = q1.subtract(spread), q3.add(spread)
+
+        return minValues.rename(suffixed("_min")).addBands(maxValues.rename(suffixed("_max")))
 
     def to_xarray(
         self,
@@ -822,13 +1043,21 @@ class ImageCollectionAccessor:
         bandNames: list[str] | ee.List,
         filter: str,
         bandNamesProperty: str | ee.String = "system:band_names",
+        signatures: bool = False,
     ) -> ee.ImageCollection:
         """Filter the :py:class:`ee.ImageCollection` by band names using the provided filter.
 
+        When ``signatures`` is set, the distinct band signatures of the collection are fetched once with
+        :py:meth:`bandSignatures` and screened on the client. The images are then kept with a single ``inList``
+        filter on their signature instead of a list comparison per image and band. If every signature matches,
+        the collection is not filtered at all. Both modes return the same images with the same properties, the
+        ``bandNamesProperty`` being removed.
+
         Args:
             bandNames: List of band names to filter.
             filter: Type of filter to apply. To keep images that contains all the specified bands use ``"ALL"``. To get the images including at least one of the specified band use ``"ANY"``.
             bandNamesProperty: the name of the property that contains the band names. Defaults to GEE native default: 'system:band_name'.
+            signatures: Whether to screen the cached band signatures of the collection on the client. This makes the method a client-side method.
 
         Returns:
             A filtered :py:class:`ee.ImageCollection`
@@ -847,6 +1076,9 @@ class ImageCollectionAccessor:
                 filtered = collection.geetools.containsBandNames(["B1", "B2"], "ALL")
                 print(filtered.getInfo())
         """
+        if signatures is True:
+            return self._containsBandSignatures(bandNames, filter, bandNamesProperty)
+
         # cast parameters
         filter = {"ALL": "Filter.and", "ANY": "Filter.or"}[filter]
         bandNames = ee.List(bandNames)
@@ -857,23 +1089,97 @@ class ImageCollectionAccessor:
         filterList = bandNames.map(lambda b: ee.Filter.listContains(bandNamesProperty, b))
         filterCombination = apifunction.ApiFunction.call_(filter, ee.List(filterList))
 
-        # apply this filter and remove the temporary property. Exclude parameter is additive so
-        # we do a blank multiplication to remove all the properties beforehand
+        # apply this filter and remove the band names property
         ic = ee.ImageCollection(self._obj.filter(filterCombination))
-        ic = ic.map(lambda i: ee.Image(i.multiply(1).copyProperties(i, exclude=[bandNamesProperty])))
 
+        return self._removeBandNames(ic, [bandNamesProperty])
+
+    def _containsBandSignatures(
+        self, bandNames: list[str] | ee.List, filter: str, bandNamesProperty: str | ee.String
+    ) -> ee.ImageCollection:
+        """Filter the collection by band names by screening its cached band signatures on the client.
+
+        Args:
+            bandNames: List of band names to filter.
+            filter: Type of filter to apply, ``"ALL"`` or ``"ANY"``.
+            bandNamesProperty: the name of the property that contains the band names.
+
+        Returns:
+            A filtered :py:class:`ee.ImageCollection`
+        """
+        match = {"ALL": all, "ANY": any}[filter]
+        if isinstance(bandNames, ee.List):
+            bandNames = executor.execute(bandNames.getInfo)
+
+        # screen the distinct signatures on the client
+        allSignatures = self.bandSignatures(bandNamesProperty)
+        keep = [s for s in allSignatures if match(b in s for b in bandNames)]
+        if len(keep) == len(allSignatures):
+            return self._removeBandNames(self._obj, [bandNamesProperty])
+
+        # tag every image with its signature and keep the matching ones with a single filter
+        signatureName = "__geetools_signature__"
+        ic = self._obj.map(lambda i: i.set(signatureName, ee.List(i.get(bandNamesProperty)).join(",")))
+        ic = ic.filter(ee.Filter.inList(signatureName, [",".join(s) for s in keep]))
+
+        return self._removeBandNames(ic, [bandNamesProperty, signatureName])
+
+    @staticmethod
+    def _removeBandNames(ic: ee.ImageCollection, properties: list) -> ee.ImageCollection:
+        """Remove the band names property and the temporary properties of the filtered images.
+
+        The exclude parameter of ``copyProperties`` is additive so a blank multiplication removes all the
+        properties beforehand.
+        """
+        ic = ic.map(lambda i: ee.Image(i.multiply(1).copyProperties(i, exclude=properties)))
         return ee.ImageCollection(ic)
 
+    def bandSignatures(self, bandNamesProperty: str | ee.String = "system:band_names") -> list[list[str]]:
+        """Get the distinct band names of the images of the collection.
+
+        A multi-sensor collection has one signature per sensor. The signatures are fetched with a single
+        metadata aggregation and kept in memory so that the next calls to
+        :py:meth:`containsBandNames <geetools.ImageCollectionAccessor.containsBandNames>` with ``signatures=True``
+        don't need any request to screen the collection.
+
+        Args:
+            bandNamesProperty: the name of the property that contains the band names. Defaults to GEE native default: 'system:band_name'.
+
+        Returns:
+            The distinct lists of band names of the collection.
+
+        Warning:
+            This function is a client-side function.
+
+        Examples:
+            .. code-block:: python
+
+                import ee, geetools
+
+                ee.Initialize()
+
+                l8 = ee.ImageCollection("LANDSAT/LC08/C02/T1_TOA").filterDate("2020-01-01", "2020-01-02")
+                s2 = ee.ImageCollection("COPERNICUS/S2_HARMONIZED").filterDate("2020-01-01", "2020-01-02")
+                print(l8.merge(s2).geetools.bandSignatures())
+        """
+        key = ClientCache.key(self._obj, bandNamesProperty)
+        if _SIGNATURE_CACHE.get(key) is None:
+            signatures = self._obj.aggregate_array(bandNamesProperty).distinct()
+            _SIGNATURE_CACHE.set(key, executor.execute(signatures.getInfo))
+        return _SIGNATURE_CACHE.get(key)
+
     def containsAllBands(
         self,
         bandNames: list[str] | ee.List,
         bandNamesProperty: str | ee.String = "system:band_names",
+        signatures: bool = False,
     ) -> ee.ImageCollection:
         """Filter the :py:class:`ee.ImageCollection` keeping only the images with all the provided bands.
 
         Args:
             bandNames: List of band names to filter.
             bandNamesProperty: the name of the property that contains the band names. Defaults to GEE native default: 'system:band_name'.
+            signatures: Whether to screen the cached band signatures of the collection on the client. This makes the method a client-side method.
 
         Returns:
             A filtered :py:class:`ee.ImageCollection`.
@@ -894,18 +1200,20 @@ class ImageCollectionAccessor:
                 filtered = collection.geetools.containsAllBands(["B1", "B2"])
                 print(filtered.getInfo())
         """
-        return self.containsBandNames(bandNames, "ALL", bandNamesProperty)
+        return self.containsBandNames(bandNames, "ALL", bandNamesProperty, signatures)
 
     def containsAnyBands(
         self,
         bandNames: list[str] | ee.List,
         bandNamesProperty: str | ee.String = "system:band_names",
+        signatures: bool = False,
     ) -> ee.ImageCollection:
         """Filter the :py:class:`ee.ImageCollection` keeping only the images with any of the provided bands.
 
         Args:
             bandNames: List of band names to filter.
             bandNamesProperty: the name of the property that contains the band names. Defaults to GEE native default: 'system:band_name'.
+            signatures: Whether to screen the cached band signatures of the collection on the client. This makes the method a client-side method.
 
         Returns:
             A filtered :py:class:`ee.ImageCollection`
@@ -926,7 +1234,7 @@ class ImageCollectionAccessor:
                 filtered = collection.geetools.containsAnyBands(["B1", "B2"])
                 print(filtered.getInfo())
         """
-        return self.containsBandNames(bandNames, "ANY", bandNamesProperty)
+        return self.containsBandNames(bandNames, "ANY", bandNamesProperty, signatures)
 
     def aggregateArray(self, properties: list[str] | ee.List | None = None) -> ee.Dictionary:
         """Aggregate the :py:class:`ee.ImageCollection` selected properties into a dictionary.
@@ -988,35 +1296,55 @@ class ImageCollectionAccessor:
                 split = collection.geetools.groupInterval("month", 1)
                 print(split.getInfo())
         """
-        sizeName = "__geetools_generated_size__"  # set generated properties name
-
-        # create an ic variable to avoid calling self._obj multiple times
-        # and extract the property names to copy
-        ic = self._obj
-        toCopy = ic.first().propertyNames()
-
-        # transform the interval into a duration in milliseconds
-        # I can use the DateRangeAccessor as it's imported earlier in the __init__.py file
-        # I don't know if it should be properly imported here, let's see with user feedback
-        start, end = ic.aggregate_min("system:time_start"), ic.aggregate_max("system:time_start")
-        DateRangeList = ee.DateRange(start, end).geetools.split(duration, unit)
-        imageCollectionList = DateRangeList.map(
-            lambda dr: ic.filterDate(ee.DateRange(dr).start(), ee.DateRange(dr).end())
-        )
+        # each group is a sub-collection with the properties of the original collection
+        toCollection = lambda images: ee.ImageCollection.fromImages(images)  # noqa: E731
+        groups = self._groupByInterval(unit, duration).map(toCollection)
+        groups = groups.map(lambda ic: ee.ImageCollection(ic).copyProperties(self._obj))
+
+        return ee.List(groups)
+
+    def _groupByInterval(self, unit: str, duration: int) -> ee.List:
+        """Group the images of the collection by interval in a single pass.
+
+        The interval index of every image is computed in a single ``map``. The distinct indices are then turned
+        into time ranges and joined to the images with a single ``ee.Join.saveAll`` so that only the non-empty
+        intervals are created.
+
+        Args:
+            unit: The unit of time to split the collection.
+            duration: The duration of each split.
 
-        def add_size(ic):
-            ic = ee.ImageCollection(ic)
-            return ic.set({sizeName: ic.size()})
+        Returns:
+            A list of lists of images sorted by interval and by ``"system:time_start"`` within each interval.
+        """
+        keyName, matchesName = "__geetools_interval__", "__geetools_images__"
+
+        # ee.Date.difference is calendar aware so that months and years have their real length
+        start = ee.Date(self._obj.aggregate_min("system:time_start"))
+
+        def tag(image):
+            delta = ee.Date(image.get("system:time_start")).difference(start, unit)
+            return image.set(keyName, delta.divide(duration).floor())
+
+        keys = self._obj.map(tag).aggregate_array(keyName).distinct()
+
+        # build the time range of each interval and join the original images to it. The next interval of
+        # each key is added to be safe with the rounding of calendar units, the join drops the empty ones.
+        keys = keys.cat(keys.map(lambda k: ee.Number(k).add(1))).distinct().sort()
 
-        def delete_size_property(ic):
-            ic = ee.ImageCollection(ic)
-            return ee.ImageCollection(ic.copyProperties(ic, properties=toCopy))
+        def toRange(key):
+            rangeStart = start.advance(ee.Number(key).multiply(duration), unit)
+            rangeEnd = rangeStart.advance(duration, unit)
+            return ee.Feature(None, {"start": rangeStart.millis(), "end": rangeEnd.millis()})
 
-        imageCollectionList = (
-            imageCollectionList.map(add_size).filter(ee.Filter.gt(sizeName, 0)).map(delete_size_property)
+        ranges = ee.FeatureCollection(keys.map(toRange))
+        rangeFilter = ee.Filter.And(
+            ee.Filter.lessThanOrEquals(leftField="start", rightField="system:time_start"),
+            ee.Filter.greaterThan(leftField="end", rightField="system:time_start"),
         )
+        join = ee.Join.saveAll(matchesName, "system:time_start", True)
 
-        return ee.List(imageCollectionList)
+        return join.apply(ranges, self._obj, rangeFilter).aggregate_array(matchesName)
 
     def reduceInterval(
         self,
@@ -1057,9 +1385,9 @@ class ImageCollectionAccessor:
                 reduced = collection.geetools.reduceInterval("mean", "month", 1)
                 print(reduced.getInfo())
         """
-        # create a list of image collections to be reduced
-        # Every subcollection is sorted in case one use the "first" reducer
-        imageCollectionList = self.groupInterval(unit, duration)
+        # create a list of image lists to be reduced, directly from the grouping join.
+        # Every group is sorted in case one use the "first" reducer
+        imageCollectionList = self._groupByInterval(unit, duration)
 
         # create a reducer from user parameters
         red = getattr(ee.Reducer, reducer)() if isinstance(reducer, str) else reducer
@@ -1075,7 +1403,7 @@ class ImageCollectionAccessor:
         # muli-output reducer for obvious reasons. We need to change this back to the original band names
         # suffixed with the reducer output names to avoid non-regression issue we added the
         # "keep_original_names" parameter that will be removed in downstream version
-        if keep_original_names is True and red.getOutputs().length().getInfo() == 1:
+        if keep_original_names is True and executor.execute(red.getOutputs().length().getInfo) == 1:
             msg = (
                 "The `keep_original_names` parameter will be removed in future versions\n"
                 " and band names will not be renamed anymore. To keep the old behaviour, rename manually\n"
@@ -1085,8 +1413,8 @@ class ImageCollectionAccessor:
             warnings.warn(msg, category=DeprecationWarning, stacklevel=2)
             bandNames = self._obj.first().bandNames()
 
-        def reduce(ic):
-            ic = ee.ImageCollection(ic)
+        def reduce(images):
+            ic = ee.ImageCollection.fromImages(images)
             start = ic.aggregate_min("system:time_start")
             end = ic.aggregate_max("system:time_end")
             firstImg = ic.first()
@@ -1102,12 +1430,20 @@ class ImageCollectionAccessor:
 
         return ee.ImageCollection(ic)
 
-    def closestDate(self) -> ee.ImageCollection:
+    def closestDate(
+        self, count: int | None = None, window: float | None = None, unit: str = "day"
+    ) -> ee.ImageCollection:
         """Fill masked pixels with the first valid pixel in the stack of images.
 
         The method will for every image, fill all the pixels with the latest non masked pixel in the stack of images.
         It requires the image to have a valid ``"system:time_start"`` property.
-        As the imageCollection will need to be sorted limit the analysis to a reasonable number of image by filtering your data beforehand.
+        The lookback can be limited to a number of images or to a time window to keep the cost linear with the size
+        of the collection, see :py:meth:`fillGaps <geetools.ImageCollectionAccessor.fillGaps>`.
+
+        Parameters:
+            count: The maximum number of previous images used to fill a pixel. If None, all the previous images are used.
+            window: The maximum time difference between an image and the images used to fill it. If None, all the previous images are used.
+            unit: The unit of the ``window`` parameter, one of ``week``, ``day``, ``hour``, ``minute``, ``second``.
 
         Returns:
             An :py:class:`ee.ImageCollection` with all pixels unmasked in every image.
@@ -1125,26 +1461,138 @@ class ImageCollectionAccessor:
                     .filterDate("2014-01-01", "2014-12-31")
                 )
 
-                filled = collection.geetools.fillWithFirst()
+                filled = collection.geetools.closestDate()
                 print(filled.getInfo())
         """
-        # retrieve all the time starts as an ordered list to iterate
-        timeList = self._obj.aggregate_array("system:time_start").sort()
+        return self.fillGaps("forward", count, window, unit)
 
-        # for each time start find all the images thata are before and use the mosaic reducer
-        # to only keep the first one with a non masked pixel
-        def fill(date):
-            return self._obj.filter(ee.Filter.lte("system:time_start", date)).mosaic()
+    def fillGaps(
+        self,
+        method: str = "forward",
+        count: int | None = None,
+        window: float | None = None,
+        unit: str = "day",
+    ) -> ee.ImageCollection:
+        """Fill the masked pixels of each image using its neighbours in time.
 
-        imageList = timeList.map(fill)
+        The collection is sorted by ``"system:time_start"`` and each image is joined to its neighbours in a
+        window bounded by a number of images (``count``) and/or a time difference (``window``). The cost of the
+        method is thus proportional to the size of the collection times the size of the window. Two methods are available:
 
-        return ee.ImageCollection(imageList)
+        - ``"forward"``: each masked pixel is filled with the latest valid pixel of the previous images.
+        - ``"linear"``: each masked pixel is linearly interpolated in time between the latest valid pixel of the previous images and the earliest valid pixel of the following ones. Pixels without a valid neighbour on each side remain masked.
 
-    def medoid(self) -> ee.Image:
+        Parameters:
+            method: The filling method, one of ``"forward"`` or ``"linear"``.
+            count: The maximum number of images on each side used to fill a pixel. If None, the number of images is not limited.
+            window: The maximum time difference between an image and the images used to fill it. If None, the time difference is not limited.
+            unit: The unit of the ``window`` parameter, one of ``week``, ``day``, ``hour``, ``minute``, ``second``.
+
+        Returns:
+            The :py:class:`ee.ImageCollection` with the filled images. The properties of the images are kept.
+
+        Examples:
+            .. code-block:: python
+
+                import ee, geetools
+
+                ee.Initialize()
+
+                collection = (
+                    ee.ImageCollection("LANDSAT/LC08/C01/T1_TOA")
+                    .filterBounds(ee.Geometry.Point(-122.262, 37.8719))
+                    .filterDate("2014-01-01", "2014-12-31")
+                )
+
+                filled = collection.geetools.fillGaps("linear", count=3, window=30)
+                print(filled.getInfo())
+        """
+        if method not in ["forward", "linear"]:
+            raise ValueError(f"method must be one of ['forward', 'linear'], got {method}")
+        units = {"week": 7 * 86400000, "day": 86400000, "hour": 3600000, "minute": 60000, "second": 1000}
+        if unit not in units:
+            raise ValueError(f"unit must be one of {list(units)}, got {unit}")
+
+        time, position = "system:time_start", "__geetools_position__"
+        previousName, followingName = "__geetools_previous__", "__geetools_following__"
+
+        # set the position of each image in the sorted collection to limit the window by count. The images
+        # are numbered from the list of the sorted collection as their ids are not always unique
+        images = self._obj.sort(time).toList(self._obj.size())
+        positions = ee.List.sequence(0, images.size().subtract(1))
+        ic = ee.ImageCollection(positions.map(lambda p: ee.Image(images.get(p)).set(position, p)))
+
+        # build the filters selecting the neighbours of each image
+        bounds = []
+        if count is not None:
+            bounds.append(ee.Filter.maxDifference(count, leftField=position, rightField=position))
+        if window is not None:
+            bounds.append(ee.Filter.maxDifference(window * units[unit], leftField=time, rightField=time))
+        before = ee.Filter.greaterThan(leftField=position, rightField=position)
+        after = ee.Filter.lessThan(leftField=position, rightField=position)
+
+        # the neighbours are sorted so that the closest one in time is always the last one i.e.
+        # the one on top of the mosaic
+        join = ee.Join.saveAll(previousName, time, True, outer=True)
+        ic = join.apply(ic, ic, ee.Filter.And(before, *bounds))
+        if method == "linear":
+            join = ee.Join.saveAll(followingName, time, False, outer=True)
+            ic = join.apply(ic, ic, ee.Filter.And(after, *bounds))
+
+        # images without neighbours are kept by the outer join but don't have the property
+        def neighbours(image, name):
+            hasNeighbours = image.propertyNames().contains(name)
+            return ee.List(ee.Algorithms.If(hasNeighbours, image.get(name), ee.List([])))
+
+        # the time of each valid pixel, with the same bands and masks as the image
+        def toTime(image):
+            image = ee.Image(image)
+            return image.toDouble().multiply(0).add(ee.Number(image.get(time)))
+
+        def forwardFill(image):
+            previous = ee.ImageCollection.fromImages(neighbours(image, previousName))
+            filled = image.unmask(previous.mosaic(), False)
+            return ee.Image(filled).geetools.removeProperties([previousName, position])
+
+        def linearFill(image):
+            previous = neighbours(image, previousName)
+            following = neighbours(image, followingName)
+            previousValue = ee.ImageCollection.fromImages(previous).mosaic()
+            previousTime = ee.ImageCollection.fromImages(previous.map(toTime)).mosaic()
+            followingValue = ee.ImageCollection.fromImages(following).mosaic()
+            followingTime = ee.ImageCollection.fromImages(following.map(toTime)).mosaic()
+            ratio = ee.Image.constant(image.get(time)).subtract(previousTime)
+            ratio = ratio.divide(followingTime.subtract(previousTime))
+            interpolated = followingValue.subtract(previousValue).multiply(ratio).add(previousValue)
+            filled = image.unmask(interpolated, False)
+            return ee.Image(filled).geetools.removeProperties([previousName, followingName, position])
+
+        fill = forwardFill if method == "forward" else linearFill
+        return ee.ImageCollection(ic).map(fill)
+
+    def medoid(self, method: str = "exact") -> ee.Image:
         """Compute the medoid of the :py:class:`ee.ImageCollection`.
 
         The medoid is the image that has the smallest sum of distances to all other images in the collection.
-        The distance is computed using the Euclidean distance between the pixels of the images.
+        The distance is the Euclidean distance between the pixels of the images, each band being normalized
+        by its range in the collection.
+
+        - ``"exact"``: the historical method, kept unchanged for backward compatibility. Every image is
+          compared to every other one and the normalized images are mosaicked on their sum of distances, so
+          the normalized values of the image with the largest sum are returned.
+        - ``"pairwise"``: every image is compared to every other one and the original values of the image
+          with the smallest sum of distances are returned.
+        - ``"mean"``: the image closest to the pixelwise mean of the collection. The sum of the squared
+          distances of an image to all the others grows with its distance to the mean, so it is the exact
+          medoid for the squared distance and a close approximation for the Euclidean one.
+        - ``"median"``: the image closest to the pixelwise median, less sensitive to outliers.
+
+        The cost of ``"exact"`` and ``"pairwise"`` grows with the square of the collection size, the two
+        others are linear. Except for ``"exact"``, the pixels of the selected image are returned with their
+        original values.
+
+        Parameters:
+            method: The method to use, one of ``"exact"``, ``"pairwise"``, ``"mean"`` or ``"median"``.
 
         Returns:
             An Image that is the medoid of the :py:class:`ee.ImageCollection`.
@@ -1165,6 +1613,10 @@ class ImageCollectionAccessor:
                 medoid = collection.geetools.medoid()
                 print(medoid.getInfo())
         """
+        methods = ["exact", "pairwise", "mean", "median"]
+        if method not in methods:
+            raise ValueError(f"method must be one of {methods}, got {method}")
+
         # create a random name for the sum of distances band to avoid conflicts
         sumOfDistancesName = uuid.uuid4().hex
 
@@ -1187,36 +1639,71 @@ class ImageCollectionAccessor:
 
         normalized = self._obj.map(normalizeBands)
 
-        # compute the distance between each image and all the others
-        def computeSumDistance(image):
-            def computeDistance(other):
-                return image.subtract(other).pow(2).reduce(ee.Reducer.sum()).sqrt()
+        # the exact method keeps its historical output: the normalized images are mosaicked on their
+        # positive sum of distances
+        if method == "exact":
+
+            def computeSumDistance(image):
+                def computeDistance(other):
+                    return image.subtract(other).pow(2).reduce(ee.Reducer.sum()).sqrt()
+
+                sumDistances = normalized.map(computeDistance).reduce(ee.Reducer.sum())
+                return image.addBands(sumDistances.rename(sumOfDistancesName))
 
-            sumDistances = normalized.map(computeDistance).reduce(ee.Reducer.sum())
-            return image.addBands(sumDistances.rename(sumOfDistancesName))
+            medoid = normalized.map(computeSumDistance).qualityMosaic(sumOfDistancesName)
+            return ee.Image(medoid).select(bandNames)
 
-        sumDistance = normalized.map(computeSumDistance)
+        # in linear mode, each image is only compared to the pixelwise center of the collection
+        if method in ["mean", "median"]:
+            center = normalized.reduce(getattr(ee.Reducer, method)()).rename(bandNames)
 
-        # use the computed sum of distances as a sorting band for a quality mossaic
-        # to get the image with the smallest sum of distances
-        medoid = sumDistance.qualityMosaic(sumOfDistancesName)
+            def computeDistance(image):
+                return normalizeBands(image).subtract(center).pow(2).reduce(ee.Reducer.sum()).sqrt()
+
+        # in pairwise mode, each image is compared to all the others
+        else:
+
+            def computeDistance(image):
+                image = normalizeBands(image)
+                distances = normalized.map(
+                    lambda other: image.subtract(other).pow(2).reduce(ee.Reducer.sum()).sqrt()
+                )
+                return distances.reduce(ee.Reducer.sum())
+
+        # qualityMosaic keeps the highest value so the distance of the original images is negated
+        # to select the pixels of the image with the smallest one
+        def addDistance(image):
+            return image.addBands(computeDistance(image).multiply(-1).rename(sumOfDistancesName))
+
+        medoid = self._obj.map(addDistance).qualityMosaic(sumOfDistancesName)
 
         return ee.Image(medoid).select(bandNames)
 
     def sortMany(
-        self, properties: ee.List | list, ascending: ee.List | list | None = None
+        self,
+        properties: ee.List | list,
+        ascending: ee.List | list | None = None,
+        method: str = "chain",
     ) -> ee.ImageCollection:
         """Sort an ImageCollection using more than 1 property.
 
         The properties are set in the order of priority. The first property is the most important one,
         in case of a tie, the second property is used to break the tie, and so on.
 
+        The ``"chain"`` method sorts the collection once per property, starting from the last one. With the
+        ``"key"`` method, the rank of every value among the distinct values of its property is read from a
+        dictionary and the zero-padded ranks are concatenated into a single string key in a single ``map``. The
+        collection is then sorted once on this key. Numbers, dates and strings are supported alike and a
+        descending order is obtained by reversing the rank. Images missing a property are placed after all the
+        others for this property, whatever the order.
+
         Warning:
             This method will raise an error if the 2 parameter are not the same size.
 
         Args:
             properties: the list of properties to sort by.
             ascending: the list of order. If not passed all properties will be sorted ascending
+            method: The sorting method, one of ``"chain"`` (default) or ``"key"``.
 
         Examples:
             .. jupyter-execute::
@@ -1241,15 +1728,46 @@ class ImageCollectionAccessor:
                     print(f"Forecast Time: {item['forecast_time']}, Creation Time: {item['creation_time']}")
         """
         # sanity checks
+        if method not in ["key", "chain"]:
+            raise ValueError(f"method must be one of ['key', 'chain'], got {method}")
         props = ee.List(properties)
         asc = ee.List(ascending or props.map(lambda _: True))
+        propertiesIndex = ee.List.sequence(0, props.size().subtract(1))
 
         # Compute the sort chain in reverse order so that the first key is the primary one and so on.
-        ic = self._obj
-        propertiesIndex = ee.List.sequence(0, props.size().subtract(1)).reverse()
-        ic = propertiesIndex.iterate(lambda i, c: ee.ImageCollection(c).sort(props.get(i), asc.get(i)), ic)
+        if method == "chain":
+            ic = self._obj
+            ic = propertiesIndex.reverse().iterate(
+                lambda i, c: ee.ImageCollection(c).sort(props.get(i), asc.get(i)), ic
+            )
+            return ee.ImageCollection(ic)
 
-        return ee.ImageCollection(ic)
+        # the distinct sorted values of each property are ranked once in a dictionary keyed by their string
+        # representation. The rank of an image value is then padded to a fixed width so that the lexicographic
+        # order of the keys respects the priorities. Missing values get the rank after the last one.
+        keyName = "__geetools_sort_key__"
+
+        def toRanks(p):
+            values = self._obj.aggregate_array(p).distinct().sort()
+            keys = values.map(lambda v: ee.Algorithms.String(v))
+            return ee.Dictionary.fromLists(keys, ee.List.sequence(0, values.size().subtract(1)))
+
+        ranksList = props.map(toRanks)
+
+        def tag(image):
+            def rank(i):
+                ranks = ee.Dictionary(ranksList.get(i))
+                size, value = ranks.size(), image.get(props.get(i))
+                r = ranks.getNumber(ee.Algorithms.String(value))
+                r = ee.Number(ee.Algorithms.If(asc.get(i), r, size.subtract(1).subtract(r)))
+                r = ee.Number(ee.Algorithms.If(ee.Algorithms.IsEqual(value, None), size, r))
+                return r.format("%012d")
+
+            return image.set(keyName, ee.List(propertiesIndex.map(rank)).join(""))
+
+        ic = self._obj.map(tag).sort(keyName)
+
+        return ic.map(lambda i: ee.Image(i).geetools.removeProperties([keyName]))
 
     def datesByBands(
         self,
@@ -1432,6 +1950,142 @@ class ImageCollectionAccessor:
 
         return ee.Dictionary.fromLists(keys, values)
 
+    def _groupByDoy(
+        self,
+        reducer: ee.Reducer,
+        dateProperty: str = "system:time_start",
+        byYear: bool = False,
+        seasonStart: int | ee.Number = 0,
+        seasonEnd: int | ee.Number = 366,
+    ) -> ee.ImageCollection:
+        """Reduce the images of the collection that occur on the same day of year in a single pass.
+
+        The day of year and the year of every image are computed in a single ``map``. The distinct keys are then
+        joined to the images with a single ``ee.Join.saveAll`` and each group is reduced into one image. Nothing
+        is created for the days without images.
+
+        Args:
+            reducer: The reducer used to aggregate the images of the same group.
+            dateProperty: The property to use as date for each image.
+            byYear: Whether to group the images by year and day of year instead of day of year only.
+            seasonStart: The first day of year to keep.
+            seasonEnd: The last day of year to keep.
+
+        Returns:
+            One image per group, sorted by year and day of year, with the integer ``"__geetools_doy__"`` and
+            ``"__geetools_year__"`` properties.
+        """
+        doyName, yearName, keyName = "__geetools_doy__", "__geetools_year__", "__geetools_key__"
+        matchesName = "__geetools_images__"
+
+        def tag(image):
+            date = ee.Date(image.get(dateProperty))
+            doy, year = date.getRelative("day", "year"), date.get("year")
+            key = ee.Number(year).multiply(1000).add(doy) if byYear else doy
+            return image.set({doyName: doy, yearName: year, keyName: key})
+
+        ic = self._obj.map(tag).filter(ee.Filter.rangeContains(doyName, seasonStart, seasonEnd))
+
+        keys = ic.aggregate_array(keyName).distinct().sort()
+        groups = ee.FeatureCollection(keys.map(lambda k: ee.Feature(None, {keyName: k})))
+        keyFilter = ee.Filter.equals(leftField=keyName, rightField=keyName)
+        groups = ee.Join.saveAll(matchesName, dateProperty).apply(groups, ic, keyFilter)
+
+        # the year of the day of year groups is the one of their first image
+        def reduce(group):
+            images = ee.List(group.get(matchesName))
+            first = ee.Image(images.get(0))
+            image = ee.ImageCollection.fromImages(images).reduce(reducer).rename(first.bandNames())
+            return image.copyProperties(first, [doyName, yearName])
+
+        return ee.ImageCollection(groups.map(reduce))
+
+    def datesChunked(
+        self,
+        by: str = "bands",
+        chunkSize: int = 500,
+        maxWorkers: int = 4,
+        long: bool = False,
+        tileScale: float = 1,
+        **kwargs,
+    ) -> dict | pd.DataFrame:
+        """Reduce the data for each image in the collection one chunk of dates at a time.
+
+        :py:meth:`datesByBands` and :py:meth:`datesByRegions` stack every date of the collection as a band of a
+        single image which fails on long time series. This method splits the collection in chunks of ``chunkSize``
+        images, evaluates them concurrently and merges the partial dictionaries in the same format.
+
+        The chunks are evaluated through the geetools :py:class:`Executor <geetools.Executor>`: throttled chunks are
+        retried with a backoff and chunks running out of memory are computed again with a doubled ``tileScale``.
+
+        Warning:
+            This function is a client-side function.
+
+        Parameters:
+            by: The method used to reduce the data. One of ``"bands"`` or ``"regions"`` for :py:meth:`datesByBands` and :py:meth:`datesByRegions`.
+            chunkSize: The maximum number of images in a chunk.
+            maxWorkers: The number of chunks evaluated at the same time.
+            long: Whether to return a long format table instead of a dictionary.
+            tileScale: The initial tileScale used for each chunk.
+            **kwargs: The parameters of the selected method.
+
+        Returns:
+            The dictionary of the selected method or, if ``long`` is set, a table with one row per label (band or region) and date, with the ``"label"``, ``"date"`` and ``"value"`` columns.
+
+        See Also:
+            - :docstring:`ee.ImageCollection.geetools.plot_dates_by_bands`
+            - :docstring:`ee.ImageCollection.geetools.plot_dates_by_regions`
+
+        Examples:
+            .. code-block:: python
+
+                import ee, geetools
+
+                ee.Initialize()
+
+                collection = (
+                    ee.ImageCollection("MODIS/061/MOD13A1")
+                    .filter(ee.Filter.date("2000-01-01", "2020-01-01"))
+                    .select(["NDVI", "EVI"])
+                )
+                region = ee.Geometry.Point(-122.262, 37.8719).buffer(10000)
+
+                table = collection.geetools.datesChunked("bands", 100, region=region, scale=500, long=True)
+                collection.geetools.plot_dates_by_bands(region, data=table)
+        """
+        methods = {"bands": "datesByBands", "regions": "datesByRegions"}
+        if by not in methods:
+            raise ValueError(f"by must be one of {list(methods)}, got {by}")
+
+        size = executor.execute(self._obj.size().getInfo)
+
+        def reduce(start: int) -> dict:
+            chunk = getattr(self.iloc[start : start + chunkSize].geetools, methods[by])
+            return executor.execute(
+                lambda tileScale: chunk(**kwargs, tileScale=tileScale).getInfo(),
+                tileScale=tileScale,
+            )
+
+        with ThreadPoolExecutor(max_workers=maxWorkers) as pool:
+            results = list(pool.map(reduce, range(0, size, chunkSize)))
+
+        # merge the partial dictionaries in the order of the collection
+        data: dict[str, dict] = {}
+        for result in results:
+            for label, values in result.items():
+                data.setdefault(label, {}).update(values)
+
+        if not long:
+            return data
+
+        rows = [
+            (label, dt.strptime(date, PY_DATE_FORMAT), value)
+            for label, values in data.items()
+            for date, value in values.items()
+        ]
+
+        return pd.DataFrame(rows, columns=["label", "date", "value"])
+
     def doyByBands(
         self,
         region: ee.Geometry,
@@ -1489,61 +2143,38 @@ class ImageCollectionAccessor:
         bands = ee.List(bands) if bands is not None else self._obj.first().bandNames()
         labels = ee.List(labels) if labels is not None else bands
 
-        # recast band names as labels in the source collection
-        ic = self._obj.select(bands).map(lambda i: i.rename(labels))
-
-        # create 2 metadata name as random string to avoid any risk of conflicts
-        doy_metadata, size_metadata = uuid.uuid4().hex, uuid.uuid4().hex
-
-        # add the day of year as metadata to each image
-        def doy_tag(i: ee.Image) -> ee.Image:
-            doy = ee.Date(i.get(dateProperty)).getRelative("day", "year")
-            return i.set(doy_metadata, doy)
-
-        ic = self._obj.map(doy_tag)
-
-        # create a list of :py:class:`ee.ImageCollection` where every images of the same day are grouped together
-        dayList = ee.List.sequence(0, 366)
-
-        def filter_doy(d: ee.Number) -> ee.ImageCollection:
-            c = ic.filter(ee.Filter.eq(doy_metadata, d))
-            c = c.set(size_metadata, c.size())
-            return c.set(doy_metadata, d)
-
-        icList = dayList.map(filter_doy)
-
-        # reduce every sub ImageCollection in the list into images (it's the temporal reduction)
-        # and aggregate the result as a single ImageCollection
+        # group the images of the same day together and reduce them in time (it's the temporal reduction)
         timeRed = getattr(ee.Reducer, timeReducer)() if isinstance(timeReducer, str) else timeReducer
+        ic = self._obj.select(bands, labels).geetools._groupByDoy(timeRed, dateProperty)
 
-        def timeReduce(c: ee.ImageCollection) -> ee.image:
-            c = ee.ImageCollection(c)
-            i = c.reduce(timeRed).rename(labels)
-            i = i.set(size_metadata, c.get(size_metadata))
-            return i.set(doy_metadata, c.get(doy_metadata))
+        # stack all the days in a single image with one "<label>_<doy>" band per label and day so that all
+        # the bands and days are spatially reduced at once
+        doyList = ic.aggregate_array("__geetools_doy__").map(lambda d: ee.Number(d).int().format())
 
-        ic = ee.ImageCollection(icList.map(timeReduce)).filter(ee.Filter.gt(size_metadata, 0))
+        def names(label: ee.String) -> ee.List:
+            return doyList.map(lambda d: ee.String(label).cat("_").cat(d))
 
-        # spatially reduce the generated imagecollection over the region for each band
-        doyList = ic.aggregate_array(doy_metadata).map(lambda d: ee.Number(d).int().format())
+        bandNames = doyList.map(lambda d: labels.map(lambda l: ee.String(l).cat("_").cat(d))).flatten()
+        image = ic.toBands().rename(bandNames)
         spatialRed = (
             getattr(ee.Reducer, spatialReducer)() if isinstance(spatialReducer, str) else spatialReducer
         )
+        reduced = image.reduceRegion(
+            reducer=spatialRed,
+            geometry=region,
+            scale=scale,
+            crs=crs,
+            crsTransform=crsTransform,
+            bestEffort=bestEffort,
+            maxPixels=maxPixels,
+            tileScale=tileScale,
+        )
 
-        def spatialReduce(label: ee.String) -> ee.Dictionary:
-            image = ic.select([label]).toBands().rename(doyList)
-            return image.reduceRegion(
-                reducer=spatialRed,
-                geometry=region,
-                scale=scale,
-                crs=crs,
-                crsTransform=crsTransform,
-                bestEffort=bestEffort,
-                maxPixels=maxPixels,
-                tileScale=tileScale,
-            )
+        # split the result back into one dictionary per label
+        def split(label: ee.String) -> ee.Dictionary:
+            return reduced.select(names(label)).rename(names(label), doyList)
 
-        return ee.Dictionary.fromLists(labels, ee.List(labels).map(spatialReduce))
+        return ee.Dictionary.fromLists(labels, labels.map(split))
 
     def doyByRegions(
         self,
@@ -1594,40 +2225,12 @@ class ImageCollectionAccessor:
             - :docstring:`ee.ImageCollection.geetools.plot_doy_by_seasons`
             - :docstring:`ee.ImageCollection.geetools.plot_doy_by_years`
         """
-        # create 2 metadata name as random string to avoid any risk of conflicts
-        doy_metadata, size_metadata = uuid.uuid4().hex, uuid.uuid4().hex
-
-        # add the day of year as metadata to each image
-        def doy_tag(i: ee.Image) -> ee.Image:
-            doy = ee.Date(i.get(dateProperty)).getRelative("day", "year")
-            return i.set(doy_metadata, doy)
-
-        ic = self._obj.select([band]).map(doy_tag)
-
-        # create a list of ImageCollection where every images of the same day are grouped together
-        dayList = ee.List.sequence(0, 366)
-
-        def filter_doy(d: ee.Number) -> ee.ImageCollection:
-            c = ic.filter(ee.Filter.eq(doy_metadata, d))
-            c = c.set(size_metadata, c.size())
-            return c.set(doy_metadata, d)
-
-        icList = dayList.map(filter_doy)
-
-        # reduce every sub ImageCollection in the list into images (it's the temporal reduction)
-        # and aggregate the result as a single ImageCollection
+        # group the images of the same day together and reduce them in time (it's the temporal reduction)
         timeRed = getattr(ee.Reducer, timeReducer)() if isinstance(timeReducer, str) else timeReducer
-
-        def timeReduce(c: ee.ImageCollection) -> ee.image:
-            c = ee.ImageCollection(c)
-            i = c.reduce(timeRed).rename([band])
-            i = i.set(size_metadata, c.get(size_metadata))
-            return i.set(doy_metadata, c.get(doy_metadata))
-
-        ic = ee.ImageCollection(icList.map(timeReduce)).filter(ee.Filter.gt(size_metadata, 0))
+        ic = self._obj.select([band]).geetools._groupByDoy(timeRed, dateProperty)
 
         # reduce the data for each region
-        doyList = ic.aggregate_array(doy_metadata).map(lambda d: ee.Number(d).int().format())
+        doyList = ic.aggregate_array("__geetools_doy__").map(lambda d: ee.Number(d).int().format())
         spatialRed = (
             getattr(ee.Reducer, spatialReducer)() if isinstance(spatialReducer, str) else spatialReducer
         )
@@ -1734,45 +2337,45 @@ class ImageCollectionAccessor:
                 )
                 reduced.getInfo()
         """
-        # force cast the start and end of season as ee.Number
-        seasonStart, seasonEnd = ee.Number(seasonStart), ee.Number(seasonEnd)
-
-        # add a doy metadata to the images
-        doy_metadata, year_metadata = uuid.uuid4().hex, uuid.uuid4().hex
+        # group the images of each day of the season by year, the images of the same day are averaged
+        ic = self._obj.select([band]).geetools._groupByDoy(
+            ee.Reducer.mean(), dateProperty, True, ee.Number(seasonStart), ee.Number(seasonEnd)
+        )
 
-        def date_tag(i: ee.Image) -> ee.Image:
-            date = ee.Date(i.get(dateProperty))
-            doy = date.getRelative("day", "year")
-            year = date.get("year")
-            return i.set(doy_metadata, doy).set(year_metadata, year)
+        # stack all the years and days in a single image with one "<year>_<doy>" band per day so that all
+        # the years are spatially reduced at once
+        def name(image: ee.Image) -> ee.Image:
+            year = ee.Number(image.get("__geetools_year__")).int().format()
+            doy = ee.Number(image.get("__geetools_doy__")).int().format()
+            return image.set("__geetools_name__", year.cat("_").cat(doy), "__geetools_label__", doy)
 
-        ic = self._obj.select([band]).map(date_tag)
+        ic = ic.map(name)
+        red = getattr(ee.Reducer, reducer)() if isinstance(reducer, str) else reducer
+        reduced = (
+            ic.toBands()
+            .rename(ic.aggregate_array("__geetools_name__"))
+            .reduceRegion(
+                reducer=red,
+                geometry=region,
+                scale=scale,
+                crs=crs,
+                crsTransform=crsTransform,
+                bestEffort=bestEffort,
+                maxPixels=maxPixels,
+                tileScale=tileScale,
+            )
+        )
 
-        # create a List of image collection where every images from the same year are grouped together
-        yearList = ic.aggregate_array(year_metadata).distinct().sort()
+        # split the result back into one dictionary per year
+        yearList = ic.aggregate_array("__geetools_year__").distinct().sort()
         yearKeys = yearList.map(lambda y: ee.Number(y).int().format())
-        red = getattr(ee.Reducer, reducer)() if isinstance(reducer, str) else reducer
 
-        def reduce(year: ee.Number) -> ee.Dictionary:
-            c = ic.filter(ee.Filter.eq(year_metadata, year))
-            c = c.filter(ee.Filter.rangeContains(doy_metadata, seasonStart, seasonEnd))
-            doyList = c.aggregate_array(doy_metadata).map(lambda d: ee.Number(d).int().format())
-            return (
-                c.toBands()
-                .rename(doyList)
-                .reduceRegion(
-                    reducer=red,
-                    geometry=region,
-                    scale=scale,
-                    crs=crs,
-                    crsTransform=crsTransform,
-                    bestEffort=bestEffort,
-                    maxPixels=maxPixels,
-                    tileScale=tileScale,
-                )
-            )
+        def split(year: ee.Number) -> ee.Dictionary:
+            c = ic.filter(ee.Filter.eq("__geetools_year__", year))
+            names = c.aggregate_array("__geetools_name__")
+            return reduced.select(names).rename(names, c.aggregate_array("__geetools_label__"))
 
-        return ee.Dictionary.fromLists(yearKeys, yearList.map(reduce))
+        return ee.Dictionary.fromLists(yearKeys, yearList.map(split))
 
     def doyByYears(
         self,
@@ -1869,6 +2472,68 @@ class ImageCollectionAccessor:
             tileScale=tileScale,
         )
 
+    def doyTable(self, by: str = "bands", tileScale: float = 1, **kwargs) -> pd.DataFrame:
+        """Compute the statistics of every day of year in a single request and gather them in a tidy table.
+
+        The table can be given to the ``plot_doy_*`` methods to draw them again without any new computation.
+
+        Warning:
+            This function is a client-side function.
+
+        Parameters:
+            by: The method used to aggregate the data. One of ``"bands"``, ``"regions"``, ``"seasons"`` or ``"years"`` for :py:meth:`doyByBands`, :py:meth:`doyByRegions`, :py:meth:`doyBySeasons` and :py:meth:`doyByYears`.
+            tileScale: A scaling factor between 0.1 and 16 used to adjust aggregation tile size; setting a larger tileScale (e.g., 2 or 4) uses smaller tiles and may enable computations that run out of memory with the default.
+            **kwargs: The parameters of the selected method.
+
+        Returns:
+            A table with one row per label (band, region or year) and day of year, with the ``"label"``, ``"doy"`` and ``"value"`` columns.
+
+        See Also:
+            - :docstring:`ee.ImageCollection.geetools.plot_doy_by_bands`
+            - :docstring:`ee.ImageCollection.geetools.plot_doy_by_regions`
+            - :docstring:`ee.ImageCollection.geetools.plot_doy_by_seasons`
+            - :docstring:`ee.ImageCollection.geetools.plot_doy_by_years`
+
+        Examples:
+            .. code-block:: python
+
+                import ee, geetools
+
+                ee.Initialize()
+
+                collection = (
+                    ee.ImageCollection("MODIS/061/MOD13A1")
+                    .filter(ee.Filter.date("2010-01-01", "2020-01-01"))
+                    .select(["NDVI", "EVI"])
+                )
+                region = ee.Geometry.Point(-122.262, 37.8719).buffer(10000)
+
+                table = collection.geetools.doyTable("bands", region=region, scale=500)
+                collection.geetools.plot_doy_by_bands(region, data=table)
+        """
+        methods = {
+            "bands": self.doyByBands,
+            "regions": self.doyByRegions,
+            "seasons": self.doyBySeasons,
+            "years": self.doyByYears,
+        }
+        if by not in methods:
+            raise ValueError(f"by must be one of {list(methods)}, got {by}")
+
+        raw_data = executor.execute(
+            lambda tileScale: methods[by](**kwargs, tileScale=tileScale).getInfo(),
+            tileScale=tileScale,
+        )
+
+        # flatten the nested dictionary into one row per label and day of year sorted by day
+        rows = [
+            (label, int(doy), value)
+            for label, values in raw_data.items()
+            for doy, value in sorted(values.items(), key=lambda item: int(item[0]))
+        ]
+
+        return pd.DataFrame(rows, columns=["label", "doy", "value"])
+
     def plot_dates_by_bands(
         self,
         region: ee.Geometry,
@@ -1884,6 +2549,7 @@ class ImageCollectionAccessor:
         bestEffort: bool = False,
         maxPixels: int | None = 10**7,
         tileScale: float = 1,
+        data: pd.DataFrame | None = None,
     ) -> Axes:
         """Plot the reduced data for each image in the collection by bands on a specific region.
 
@@ -1903,6 +2569,7 @@ class ImageCollectionAccessor:
             bestEffort: If the polygon would contain too many pixels at the given scale, compute and use a larger scale which would allow the operation to succeed.
             maxPixels: The maximum number of pixels to reduce. Defaults to 1e7.
             tileScale: A scaling factor between 0.1 and 16 used to adjust aggregation tile size; setting a larger tileScale (e.g., 2 or 4) uses smaller tiles and may enable computations that run out of memory with the default.
+            data: The long format table computed by :py:meth:`datesChunked <geetools.ImageCollectionAccessor.datesChunked>` to plot instead of computing it again.
 
         Returns:
             A matplotlib axes with the reduced values for each band and each date.
@@ -1933,29 +2600,27 @@ class ImageCollectionAccessor:
                 region = ee.Geometry.Point(-122.262, 37.8719).buffer(10000)
                 collection.geetools.plot_dates_by_bands(region, "mean", 10000, "system:time_start")
         """
-        # get the reduced data
-        raw_data = self.datesByBands(
-            region=region,
-            reducer=reducer,
-            dateProperty=dateProperty,
-            bands=bands,
-            labels=labels,
-            scale=scale,
-            crs=crs,
-            crsTransform=crsTransform,
-            bestEffort=bestEffort,
-            maxPixels=maxPixels,
-            tileScale=tileScale,
-        ).getInfo()
-
-        # transform all the dates int datetime objects
-        def to_date(dict):
-            return {dt.strptime(d, PY_DATE_FORMAT): v for d, v in dict.items()}
-
-        data = {l: to_date(dict) for l, dict in raw_data.items()}
+        # compute the dates by chunks unless the table is provided
+        if data is None:
+            data = self.datesChunked(
+                by="bands",
+                long=True,
+                region=region,
+                reducer=reducer,
+                dateProperty=dateProperty,
+                bands=bands,
+                labels=labels,
+                scale=scale,
+                crs=crs,
+                crsTransform=crsTransform,
+                bestEffort=bestEffort,
+                maxPixels=maxPixels,
+                tileScale=tileScale,
+            )
 
         # create the plot
-        ax = plot_data("date", data, "Date", colors, ax)
+        values = {l: dict(zip(g.date, g.value)) for l, g in data.groupby("label", sort=False)}
+        ax = plot_data("date", values, "Date", colors, ax)
 
         return ax
 
@@ -1972,6 +2637,7 @@ class ImageCollectionAccessor:
         crs: str | None = None,
         crsTransform: list | None = None,
         tileScale: float = 1,
+        data: pd.DataFrame | None = None,
     ) -> Axes:
         """Plot the reduced data for each image in the collection by regions for a single band.
 
@@ -1989,6 +2655,7 @@ class ImageCollectionAccessor:
             crs: The projection to work in. If unspecified, the projection of the image's first band is used. If specified in addition to scale, rescaled to the specified scale.
             crsTransform: The list of CRS transform values. This is a row-major ordering of the 3x2 transform matrix. This option is mutually exclusive with 'scale', and replaces any transform already set on the projection.
             tileScale: A scaling factor between 0.1 and 16 used to adjust aggregation tile size; setting a larger tileScale (e.g., 2 or 4) uses smaller tiles and may enable computations that run out of memory with the default.
+            data: The long format table computed by :py:meth:`datesChunked <geetools.ImageCollectionAccessor.datesChunked>` to plot instead of computing it again.
 
         Returns:
             A matplotlib axes with the reduced values for each region and each date.
@@ -2022,27 +2689,25 @@ class ImageCollectionAccessor:
 
                 collection.geetools.plot_dates_by_regions("B1", regions, "name", "mean", 10000, "system:time_start")
         """
-        # get the reduced data
-        raw_data = self.datesByRegions(
-            band=band,
-            regions=regions,
-            label=label,
-            reducer=reducer,
-            dateProperty=dateProperty,
-            scale=scale,
-            crs=crs,
-            crsTransform=crsTransform,
-            tileScale=tileScale,
-        ).getInfo()
-
-        # transform all the dates int datetime objects
-        def to_date(dict):
-            return {dt.strptime(d, PY_DATE_FORMAT): v for d, v in dict.items()}
-
-        data = {l: to_date(dict) for l, dict in raw_data.items()}
+        # compute the dates by chunks unless the table is provided
+        if data is None:
+            data = self.datesChunked(
+                by="regions",
+                long=True,
+                band=band,
+                regions=regions,
+                label=label,
+                reducer=reducer,
+                dateProperty=dateProperty,
+                scale=scale,
+                crs=crs,
+                crsTransform=crsTransform,
+                tileScale=tileScale,
+            )
 
         # create the plot
-        ax = plot_data("date", data, "Date", colors, ax)
+        values = {l: dict(zip(g.date, g.value)) for l, g in data.groupby("label", sort=False)}
+        ax = plot_data("date", values, "Date", colors, ax)
 
         return ax
 
@@ -2062,6 +2727,7 @@ class ImageCollectionAccessor:
         bestEffort: bool = False,
         maxPixels: int | None = 10**7,
         tileScale: float = 1,
+        data: pd.DataFrame | None = None,
     ) -> Axes:
         """Plot the reduced data for each image in the collection by bands on a specific region.
 
@@ -2082,6 +2748,7 @@ class ImageCollectionAccessor:
             bestEffort: If the polygon would contain too many pixels at the given scale, compute and use a larger scale which would allow the operation to succeed.
             maxPixels: The maximum number of pixels to reduce. Defaults to 1e7.
             tileScale: A scaling factor between 0.1 and 16 used to adjust aggregation tile size; setting a larger tileScale (e.g., 2 or 4) uses smaller tiles and may enable computations that run out of memory with the default.
+            data: The table computed by :py:meth:`doyTable <geetools.ImageCollectionAccessor.doyTable>` to plot instead of computing it again.
 
         Returns:
             A matplotlib axes with the reduced values for each band and each day.
@@ -2111,30 +2778,27 @@ class ImageCollectionAccessor:
                 region = ee.Geometry.Point(-122.262, 37.8719).buffer(10000)
                 collection.geetools.plot_doy_by_bands(region, "mean", "mean", 10000, "system:time_start")
         """
-        # get the reduced data
-        raw_data = self.doyByBands(
-            region=region,
-            spatialReducer=spatialReducer,
-            timeReducer=timeReducer,
-            dateProperty=dateProperty,
-            bands=bands,
-            labels=labels,
-            scale=scale,
-            crs=crs,
-            crsTransform=crsTransform,
-            bestEffort=bestEffort,
-            maxPixels=maxPixels,
-            tileScale=tileScale,
-        ).getInfo()
-
-        # transform all the dates strings into int object and reorder the dictionary
-        def to_int(d):
-            return {int(k): v for k, v in d.items()}
-
-        data = {l: dict(sorted(to_int(raw_data[l]).items())) for l in raw_data}
+        # compute all the days of year in a single request unless the table is provided
+        if data is None:
+            data = self.doyTable(
+                by="bands",
+                region=region,
+                spatialReducer=spatialReducer,
+                timeReducer=timeReducer,
+                dateProperty=dateProperty,
+                bands=bands,
+                labels=labels,
+                scale=scale,
+                crs=crs,
+                crsTransform=crsTransform,
+                bestEffort=bestEffort,
+                maxPixels=maxPixels,
+                tileScale=tileScale,
+            )
 
         # create the plot
-        ax = plot_data("doy", data, "Day of Year", colors, ax)
+        values = {l: dict(zip(g.doy, g.value)) for l, g in data.groupby("label", sort=False)}
+        ax = plot_data("doy", values, "Day of Year", colors, ax)
 
         return ax
 
@@ -2152,6 +2816,7 @@ class ImageCollectionAccessor:
         crs: str | None = None,
         crsTransform: list | None = None,
         tileScale: float = 1,
+        data: pd.DataFrame | None = None,
     ) -> Axes:
         """Plot the reduced data for each image in the collection by regions for a single band.
 
@@ -2170,6 +2835,7 @@ class ImageCollectionAccessor:
             crs: The projection to work in. If unspecified, the projection of the image's first band is used. If specified in addition to scale, rescaled to the specified scale.
             crsTransform: The list of CRS transform values. This is a row-major ordering of the 3x2 transform matrix. This option is mutually exclusive with 'scale', and replaces any transform already set on the projection.
             tileScale: A scaling factor between 0.1 and 16 used to adjust aggregation tile size; setting a larger tileScale (e.g., 2 or 4) uses smaller tiles and may enable computations that run out of memory with the default.
+            data: The table computed by :py:meth:`doyTable <geetools.ImageCollectionAccessor.doyTable>` to plot instead of computing it again.
 
         Returns:
             A matplotlib axes with the reduced values for each region and each day.
@@ -2203,28 +2869,25 @@ class ImageCollectionAccessor:
 
                 collection.geetools.plot_doy_by_regions("B1", regions, "name", "mean", "mean", 10000, "system:time_start")
         """
-        # get the reduced data
-        raw_data = self.doyByRegions(
-            band=band,
-            regions=regions,
-            label=label,
-            spatialReducer=spatialReducer,
-            timeReducer=timeReducer,
-            dateProperty=dateProperty,
-            scale=scale,
-            crs=crs,
-            crsTransform=crsTransform,
-            tileScale=tileScale,
-        ).getInfo()
-
-        # transform all the dates strings into int object and reorder the dictionary
-        def to_int(d):
-            return {int(k): v for k, v in d.items()}
-
-        data = {l: dict(sorted(to_int(raw_data[l]).items())) for l in raw_data}
+        # compute all the days of year in a single request unless the table is provided
+        if data is None:
+            data = self.doyTable(
+                by="regions",
+                band=band,
+                regions=regions,
+                label=label,
+                spatialReducer=spatialReducer,
+                timeReducer=timeReducer,
+                dateProperty=dateProperty,
+                scale=scale,
+                crs=crs,
+                crsTransform=crsTransform,
+                tileScale=tileScale,
+            )
 
         # create the plot
-        ax = plot_data("doy", data, "Day of Year", colors, ax)
+        values = {l: dict(zip(g.doy, g.value)) for l, g in data.groupby("label", sort=False)}
+        ax = plot_data("doy", values, "Day of Year", colors, ax)
 
         return ax
 
@@ -2244,6 +2907,7 @@ class ImageCollectionAccessor:
         bestEffort: bool = False,
         maxPixels: int | None = 10**7,
         tileScale: float = 1,
+        data: pd.DataFrame | None = None,
     ) -> Axes:
         """Plot the reduced data for each image in the collection by years for a single band.
 
@@ -2265,6 +2929,7 @@ class ImageCollectionAccessor:
             bestEffort: If the polygon would contain too many pixels at the given scale, compute and use a larger scale which would allow the operation to succeed.
             maxPixels: The maximum number of pixels to reduce. Defaults to 1e7.
             tileScale: A scaling factor between 0.1 and 16 used to adjust aggregation tile size; setting a larger tileScale (e.g., 2 or 4) uses smaller tiles and may enable computations that run out of memory with the default.
+            data: The table computed by :py:meth:`doyTable <geetools.ImageCollectionAccessor.doyTable>` to plot instead of computing it again.
 
         Returns:
             A matplotlib axes with the reduced values for each year and each day.
@@ -2310,30 +2975,27 @@ class ImageCollectionAccessor:
                     scale = 10000
                 )
         """
-        # get the reduced data
-        raw_data = self.doyBySeasons(
-            band=band,
-            region=region,
-            seasonStart=seasonStart,
-            seasonEnd=seasonEnd,
-            reducer=reducer,
-            dateProperty=dateProperty,
-            scale=scale,
-            crs=crs,
-            crsTransform=crsTransform,
-            bestEffort=bestEffort,
-            maxPixels=maxPixels,
-            tileScale=tileScale,
-        ).getInfo()
-
-        # transform all the dates strings into int object and reorder the dictionary
-        def to_int(d):
-            return {int(k): v for k, v in d.items()}
-
-        data = {l: dict(sorted(to_int(raw_data[l]).items())) for l in raw_data}
+        # compute all the days of year in a single request unless the table is provided
+        if data is None:
+            data = self.doyTable(
+                by="seasons",
+                band=band,
+                region=region,
+                seasonStart=seasonStart,
+                seasonEnd=seasonEnd,
+                reducer=reducer,
+                dateProperty=dateProperty,
+                scale=scale,
+                crs=crs,
+                crsTransform=crsTransform,
+                bestEffort=bestEffort,
+                maxPixels=maxPixels,
+                tileScale=tileScale,
+            )
 
         # create the plot
-        ax = plot_data("doy", data, "Day of Year", colors, ax)
+        values = {l: dict(zip(g.doy, g.value)) for l, g in data.groupby("label", sort=False)}
+        ax = plot_data("doy", values, "Day of Year", colors, ax)
 
         return ax
 
@@ -2351,6 +3013,7 @@ class ImageCollectionAccessor:
         bestEffort: bool = False,
         maxPixels: int | None = 10**7,
         tileScale: float = 1,
+        data: pd.DataFrame | None = None,
     ) -> Axes:
         """Plot the reduced data for each image in the collection by years for a single band.
 
@@ -2369,6 +3032,7 @@ class ImageCollectionAccessor:
             bestEffort: If the polygon would contain too many pixels at the given scale, compute and use a larger scale which would allow the operation to succeed.
             maxPixels: The maximum number of pixels to reduce. Defaults to 1e7.
             tileScale: A scaling factor between 0.1 and 16 used to adjust aggregation tile size; setting a larger tileScale (e.g., 2 or 4) uses smaller tiles and may enable computations that run out of memory with the default.
+            data: The table computed by :py:meth:`doyTable <geetools.ImageCollectionAccessor.doyTable>` to plot instead of computing it again.
 
         Returns:
             A matplotlib axes with the reduced values for each year and each day.
@@ -2427,6 +3091,7 @@ class ImageCollectionAccessor:
             bestEffort=bestEffort,
             maxPixels=maxPixels,
             tileScale=tileScale,
+            data=data,
         )
 
     def reduceRegion(
@@ -5,11 +5,22 @@ import ee
 
 from .accessors import register_class_accessor
 
+KEY_PROPERTY = "__geetools_join_key__"
+"The temporary property storing the composite key of a multi-field join."
+
+KEY_SEPARATOR = "\u001f"
+"The separator of the values of a composite key, a control character unlikely to be found in the values."
+
+MATCH_PROPERTY = "__geetools_join_match__"
+"The temporary property storing the first match of a join."
+
 
 @register_class_accessor(ee.Join, "geetools")
 class JoinAccessor:
     """Toolbox for the :py:class:`ee.Join` class."""
 
+    __slots__ = ("_obj",)
+
     def __init__(self, obj: ee.Join):
         """Initialize the Join class."""
         self._obj = obj
@@ -18,18 +29,27 @@ class JoinAccessor:
     def byProperty(
         primary: ee.FeatureCollection,
         secondary: ee.FeatureCollection,
-        field: str | ee.String,
+        field: str | ee.String | list[str],
         outer: bool = False,
+        how: str = "first",
     ) -> ee.FeatureCollection:
-        """Join 2 collections by a given property field.
+        """Join 2 collections by one or several property fields.
 
-        It assumes ids are unique so uses :py:meth:`ee.Join.saveFirst`.
+        The properties of the matching secondary feature are copied to the primary feature, overwriting the
+        properties sharing the same name. When several fields are used, their values are encoded once in a
+        composite key so that the collections are joined in a single pass whatever the number of fields.
 
         Args:
             primary: The first collection.
             secondary: The second collection.
-            field: The field to join by.
-            outer: Whether to keep non-matching features.
+            field: The field to join by or a list of fields forming a composite key. The values of a composite
+                key are compared as strings, integer-valued numbers being written without decimals (``2020``
+                and ``2020.0`` match). A feature with a missing value in its composite key never matches.
+            outer: Whether to keep the primary features without any match (left join).
+            how: ``"first"`` to keep only the first match of each primary feature (:py:meth:`ee.Join.saveFirst`)
+                or ``"all"`` to return one feature per matching pair (many-to-many join). The features of a
+                many-to-many join keep the id and the order of their primary feature, the unmatched features of
+                an outer join staying at their position.
 
         Returns:
             The joined collection.
@@ -53,16 +73,77 @@ class JoinAccessor:
                 # join them together in the same featureCollection
                 joined = ee.Join.geetools.byProperty(fc1, fc2, 'id')
                 joined.getInfo()
+
+            .. jupyter-execute::
+
+                import ee, geetools
+                from geetools.utils import initialize_documentation
+
+                initialize_documentation()
+
+                # join yearly measures on a (site, year) composite key, keeping every match
+                point = ee.Geometry.Point([0,0])
+                sites = ee.FeatureCollection([
+                    ee.Feature(point, {'site': 'a', 'year': 2020, 'ndvi': 0.5}),
+                    ee.Feature(point, {'site': 'a', 'year': 2021, 'ndvi': 0.6}),
+                ])
+                visits = ee.FeatureCollection([
+                    ee.Feature(None, {'site': 'a', 'year': 2020, 'visit': 1}),
+                    ee.Feature(None, {'site': 'a', 'year': 2020, 'visit': 2}),
+                ])
+                joined = ee.Join.geetools.byProperty(sites, visits, ['site', 'year'], outer=True, how='all')
+                joined.aggregate_array('visit').getInfo()
         """
-        field = ee.String(field)
+        if how not in ["first", "all"]:
+            raise ValueError(f"how should be 'first' or 'all', not {how!r}")
         primary, secondary = ee.FeatureCollection(primary), ee.FeatureCollection(secondary)
-        Filter = ee.Filter.equals(leftField=field, rightField=field)
-        join = ee.Join.saveFirst(matchKey="match", outer=outer)
-        joined = join.apply(primary, secondary, Filter)
-
-        def cleanJoin(feat):
-            primaryProp = feat.propertyNames().remove("match")
-            secondaryProp = ee.Feature(feat.get("match")).toDictionary()
-            return feat.select(primaryProp).setMulti(secondaryProp)
 
-        return ee.FeatureCollection(joined.map(cleanJoin))
+        # encode the composite keys once in each collection to join them with a single equality
+        fields = list(field) if isinstance(field, (list, tuple)) else [field]
+        if len(fields) > 1:
+            numbers = ee.List(["Integer", "Long", "Float"])
+
+            def encode(value):
+                number = ee.Number(value)
+                integer = ee.Algorithms.If(number.eq(number.round()), number.toLong(), number)
+                isNumber = numbers.contains(ee.Algorithms.ObjectType(value))
+                return ee.Algorithms.String(ee.Algorithms.If(isNumber, integer, value))
+
+            def addKey(feat):
+                isNull = ee.List([ee.Algorithms.IsEqual(feat.get(f), None) for f in fields]).contains(True)
+                key = ee.List([encode(feat.get(f)) for f in fields]).join(KEY_SEPARATOR)
+                keyed = feat.set(KEY_PROPERTY, key)
+                return ee.Feature(ee.Algorithms.If(isNull, feat, keyed))
+
+            primary, secondary, fields = primary.map(addKey), secondary.map(addKey), [KEY_PROPERTY]
+        Filter = ee.Filter.equals(leftField=fields[0], rightField=fields[0])
+
+        # the temporary properties are dropped with a single regex selection instead of listing the
+        # property names of every feature
+        selectors = [f"^(?!({KEY_PROPERTY}|{MATCH_PROPERTY})$).*"]
+
+        if how == "first":
+            joined = ee.Join.saveFirst(matchKey=MATCH_PROPERTY, outer=outer).apply(primary, secondary, Filter)
+
+            def copyFirst(feat):
+                merged = ee.Feature(feat.copyProperties(ee.Feature(feat.get(MATCH_PROPERTY))))
+                if outer is True:
+                    matched = feat.propertyNames().contains(MATCH_PROPERTY)
+                    merged = ee.Feature(ee.Algorithms.If(matched, merged, feat))
+                return merged.select(selectors)
+
+            return ee.FeatureCollection(joined.map(copyFirst))
+
+        # every primary feature is expanded into one feature per match and the collections are flattened so
+        # the features keep the id and the order of the primary collection
+        joined = ee.Join.saveAll(matchesKey=MATCH_PROPERTY, outer=outer).apply(primary, secondary, Filter)
+
+        def copyAll(feat):
+            matched = feat.propertyNames().contains(MATCH_PROPERTY)
+            matches = ee.List(ee.Algorithms.If(matched, feat.get(MATCH_PROPERTY), []))
+            pairs = matches.map(lambda m: ee.Feature(feat.copyProperties(ee.Feature(m))).select(selectors))
+            if outer is True:
+                pairs = ee.Algorithms.If(matches.size().gt(0), pairs, [feat.select(selectors)])
+            return ee.FeatureCollection(ee.List(pairs))
+
+        return ee.FeatureCollection(joined.map(copyAll)).flatten()
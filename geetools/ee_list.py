@@ -4,16 +4,20 @@ from __future__ import annotations
 import ee
 
 from .accessors import register_class_accessor
+from .ee_evaluator import Evaluator, foldable
 
 
 @register_class_accessor(ee.List, "geetools")
 class ListAccessor:
     """Toolbox for the :py:class:`ee.List` class."""
 
+    __slots__ = ("_obj",)
+
     def __init__(self, obj: ee.List):
         """Initialize the List class."""
         self._obj = obj
 
+    @foldable
     def product(self, other: list | ee.List) -> ee.List:
         """Compute the cartesian product of 2 list.
 
@@ -43,6 +47,7 @@ class ListAccessor:
         product = l1.map(lambda e: l2.map(lambda f: ee.Algorithms.String(e).cat(ee.Algorithms.String(f))))
         return product.flatten()
 
+    @foldable
     def complement(self, other: list | ee.List) -> ee.List:
         """Compute the complement of the current list and the ``other`` list.
 
@@ -70,6 +75,7 @@ class ListAccessor:
         l1, l2 = ee.List(self._obj), ee.List(other)
         return l1.removeAll(l2).cat(l2.removeAll(l1))
 
+    @foldable
     def intersection(self, other: list | ee.List) -> ee.List:
         """Compute the intersection of the current list and the ``other`` list.
 
@@ -97,6 +103,7 @@ class ListAccessor:
         l1, l2 = ee.List(self._obj), ee.List(other)
         return l1.removeAll(l1.removeAll(l2))
 
+    @foldable
     def union(self, other: list | ee.List) -> ee.List:
         """Compute the union of the current list and the ``other`` list.
 
@@ -125,6 +132,7 @@ class ListAccessor:
         return l1.cat(l2).distinct()
 
     # this method is simply a del but the name is protected in the GEE context
+    @foldable
     def delete(self, index: int | ee.Number) -> ee.List:
         """Delete an element from a list.
 
@@ -149,6 +157,7 @@ class ListAccessor:
         return self._obj.slice(0, index).cat(self._obj.slice(index.add(1)))
 
     @classmethod
+    @foldable
     def sequence(
         cls,
         ini: int | ee.Number,
@@ -182,9 +191,19 @@ class ListAccessor:
         step = ee.Number(step).toInt().max(1)
         return ee.List.sequence(ini, end, step).add(end.toFloat()).distinct()
 
+    @foldable
     def replaceMany(self, replace: dict | ee.Dictionary) -> ee.List:
         """Replace many values in a list.
 
+        Each element is looked up in the dictionary with a single ``map``: the replacements are applied
+        simultaneously and a replaced value is never replaced again. If the list and the dictionary are built only
+        from literal values, the replacement is done on the client and a literal ``ee.List`` is returned.
+
+        Note:
+            Previous versions applied the replacements one after the other: with ``{"a": "c", "c": "bar"}``,
+            ``"a"`` was replaced by ``"bar"``, it is now replaced by ``"c"``. Chain several calls to reproduce
+            this behavior.
+
         Parameters:
             replace: the dictionary with the values to replace. the keys are the values to replace and the values are the new values.
 
@@ -205,9 +224,13 @@ class ListAccessor:
                 l.getInfo()
         """
         replace = ee.Dictionary(replace)
-        keys = replace.keys()
-        list = keys.iterate(lambda k, p: ee.List(p).replace(k, replace.get(k)), self._obj)
-        return ee.List(list)  # to avoid returning a ComputedObject
+
+        def replace_element(e):
+            isString = ee.String(ee.Algorithms.ObjectType(e)).compareTo("String").Not()
+            return ee.Algorithms.If(isString, replace.get(e, e), e)
+
+        # use the client-side fast path if the list and the dictionary are literals
+        return Evaluator().fold(self._obj.map(replace_element))
 
     def join(self, separator: str | ee.String = ", ") -> ee.String:
         """Format a list to a string.
@@ -263,6 +286,7 @@ class ListAccessor:
 
         return self._obj.map(getString)
 
+    @foldable
     def zip(self) -> ee.List:
         """Zip a list of lists.
 
@@ -286,6 +310,7 @@ class ListAccessor:
         indices = ee.List.sequence(0, ee.List(self._obj.get(0)).size().subtract(1))
         return indices.map(lambda i: self._obj.map(lambda j: ee.List(j).get(i)))
 
+    @foldable
     def chunked(self, parts: int | ee.Number) -> ee.List:
         """Break a :py:class:`ee.List` into lists of length `parts`.
 
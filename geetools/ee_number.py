@@ -10,6 +10,8 @@ from .accessors import register_class_accessor
 class NumberAccessor:
     """toolbox for the :py:class:`ee.Number` class."""
 
+    __slots__ = ("_obj",)
+
     def __init__(self, obj: ee.Number):
         """Initialize the Number class."""
         self._obj = obj
@@ -37,8 +37,12 @@ class Profiler:
     profile: dict | None = None
     "The profile data as a dictionary."
 
+    timings: list[dict] | None = None
+    "The progress and timing of each step recorded by the geetools client-side drivers."
+
     def __enter__(self):
         """Enter the context manager."""
+        self.timings = []
         self._output_capture = io.StringIO()
         self._profile_context = ee.profilePrinting(destination=self._output_capture)
         self._profile_context.__enter__()
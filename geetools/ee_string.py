@@ -4,12 +4,15 @@ from __future__ import annotations
 import ee
 
 from .accessors import register_class_accessor
+from .ee_evaluator import Evaluator, foldable
 
 
 @register_class_accessor(ee.String, "geetools")
 class StringAccessor:
     """Toolbox for the :py:class:`ee.String` class."""
 
+    __slots__ = ("_obj",)
+
     def __init__(self, obj: ee.String):
         """Initialize the String class."""
         self._obj = obj
@@ -36,10 +39,14 @@ class StringAccessor:
         """
         return self._obj.compareTo(ee.String(other)).Not()
 
+    @foldable
     def format(self, template: dict | ee.Dictionary) -> ee.String:
         """Format a string with a dictionary.
 
         Replace the keys in the string using the values provided in the dictionary. Follow the same pattern: value format as Python string.format method.
+        The placeholders are formatted independently with a single ``map`` and joined with the rest of the string.
+        If the string and the dictionary are built only from literal values, the string is formatted on the client
+        and returned as a literal ``ee.String``.
 
         Numbers and Dates can be formatted using formatters:
          - ee.Number
@@ -74,27 +81,28 @@ class StringAccessor:
                 s.getInfo()
         """
         template = ee.Dictionary(template)
-        template.keys().zip(template.values())
-
-        toFormat = self._obj.match("\\{([^\\}]+)\\}", "g")
-
-        def replace_format(string, init):
-            clean = ee.String(string).slice(1, -1)
-            parts = clean.split("%")
-            keys = ee.List.sequence(1, parts.size()).map(lambda k: ee.Number(k).toInt().format())
-            rel = ee.Dictionary.fromLists(keys, parts)
-            key = ee.String(rel.get("1"))
-            value = template.get(key, "")
-            format = ee.String(rel.get("2", ""))
+
+        # split the string around the placeholders. A trailing character protects the last text from the
+        # removal of the trailing empty strings by split.
+        regex = "\\{[^\\}]+\\}"
+        placeholders = self._obj.match(regex, "g")
+        texts = self._obj.cat(".").split(regex)
+        last = ee.String(texts.get(-1)).slice(0, -1)
+
+        def format_placeholder(placeholder):
+            parts = ee.String(placeholder).slice(1, -1).split("%")
+            value = template.get(parts.get(0), "")
+            format = ee.String(parts.slice(1).join("%"))
             is_date = format.match("^t.+").size().gt(0)
-            is_number = parts.size().eq(2).And(is_date.Not())
-            formatted = ee.String(
-                ee.Algorithms.If(
-                    is_number,
-                    ee.Number(value).format(ee.String("%").cat(format)),
-                    ee.Algorithms.If(is_date, ee.Date(value).format(format.slice(1)), value),
-                )
+            is_number = parts.size().gt(1).And(is_date.Not())
+            return ee.Algorithms.If(
+                is_number,
+                ee.Number(value).format(ee.String("%").cat(format)),
+                ee.Algorithms.If(is_date, ee.Date(value).format(format.slice(1)), value),
             )
-            return ee.String(init).replace(string, formatted)
 
-        return ee.String(toFormat.iterate(replace_format, self._obj))
+        formatted = texts.slice(0, -1).zip(placeholders.map(format_placeholder)).flatten()
+        string = ee.String(formatted.add(last).join(""))
+
+        # use the client-side fast path if the string and the template are literals
+        return Evaluator().fold(string)
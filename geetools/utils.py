@@ -1,9 +1,13 @@
 """Utils methods for file and asset manipulation in the context of batch processing."""
 from __future__ import annotations
 
+import hashlib
+import math
 import os
 import re
+from collections import OrderedDict
 from datetime import datetime as dt
+from typing import Any, ClassVar
 
 import ee
 import httplib2
@@ -305,3 +309,101 @@ def area_units_to_m2(area_units: str) -> float:
         raise ValueError(f"Area units '{area_units}' not supported. Use one of {list(areas.keys())}")
 
     return areas.get(area_units, 1)
+
+
+def grid_extent(
+    bounds: tuple[float, float, float, float],
+    origin: tuple[float, float],
+    step: tuple[float, float],
+    shape: str = "square",
+) -> tuple[int, int, int, int]:
+    """Compute the range of the cells of a regular grid covering a bounding box.
+
+    The grid is aligned on the provided origin (usually the one of a projection transform) so that
+    the cell edges match the pixel edges of the image. The cell ``(col, row)`` has its anchor at
+    ``origin + (col, row) * step``: the lower left corner of a square or the center of a hexagon. Hexagon rows
+    are ``step[0] * sqrt(3) / 2`` apart and every odd row is shifted by half a cell.
+
+    Args:
+        bounds: The bounding box to cover as ``(xmin, ymin, xmax, ymax)`` in the grid coordinates.
+        origin: The coordinates of a cell corner used to align the grid.
+        step: The size of the cells along the x and y axis. For hexagons, ``step[0]`` is the distance between 2 neighbouring cell centers and ``step[1]`` is ignored.
+        shape: The shape of the cells, one of ``"square"`` or ``"hexagon"``.
+
+    Returns:
+        The index of the first column, of the first row and the number of columns and rows covering the box.
+    """
+    xmin, ymin, xmax, ymax = bounds
+    x0, y0 = origin
+    dx, dy = abs(step[0]), abs(step[1])
+
+    if shape == "square":
+        margin = 0
+    elif shape == "hexagon":
+        # one more cell on each side for the shifted rows and the tips of the hexagons
+        margin, dy = 1, dx * math.sqrt(3) / 2
+    else:
+        raise ValueError(f"shape must be one of ['square', 'hexagon'], got {shape}")
+
+    col0, row0 = math.floor((xmin - x0) / dx) - margin, math.floor((ymin - y0) / dy) - margin
+    col1, row1 = math.ceil((xmax - x0) / dx) + margin, math.ceil((ymax - y0) / dy) + margin
+    return col0, row0, max(col1 - col0, 0), max(row1 - row0, 0)
+
+
+class ClientCache:
+    """A bounded memoization of client-side results keyed by the graph of Earth Engine objects.
+
+    The graphs are hashed so the cache does not keep their serialized form in memory. When the cache is full,
+    the least recently used entry is dropped. The results of asset-backed objects can become stale when the
+    asset is updated, use :py:func:`clear_cache` to drop them.
+
+    Args:
+        maxsize: The maximum number of entries kept in the cache.
+    """
+
+    instances: ClassVar[list[ClientCache]] = []
+    "All the caches created by geetools, emptied by :py:func:`clear_cache`."
+
+    def __init__(self, maxsize: int = 128):
+        """Create an empty cache and register it."""
+        self.maxsize = maxsize
+        self._entries: OrderedDict[str, Any] = OrderedDict()
+        ClientCache.instances.append(self)
+
+    def __len__(self) -> int:
+        """The number of entries of the cache."""
+        return len(self._entries)
+
+    @staticmethod
+    def key(*objects: Any) -> str:
+        """The hash of the graph of one or more Earth Engine objects or literals."""
+        return hashlib.blake2b(ee.serializer.toJSON(list(objects)).encode(), digest_size=16).hexdigest()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get the value of a key, marking it as the most recently used one."""
+        if key not in self._entries:
+            return default
+        self._entries.move_to_end(key)
+        return self._entries[key]
+
+    def set(self, key: str, value: Any) -> Any:
+        """Store a value, dropping the least recently used entries when the cache is full."""
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return value
+
+    def clear(self):
+        """Drop all the entries of the cache."""
+        self._entries.clear()
+
+
+def clear_cache():
+    """Drop the client-side results memoized by geetools.
+
+    The schemas of the feature collections, the ``system:index`` values and the band signatures of the image
+    collections are fetched once and kept in memory. Clear them when the underlying assets have changed.
+    """
+    for cache in ClientCache.instances:
+        cache.clear()
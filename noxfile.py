@@ -43,6 +43,13 @@ def test(session):
     )
 
 
+@nox.session(reuse_venv=True)
+def benchmark(session):
+    """Run the benchmarks against the fake backend and save the results in the .benchmarks folder."""
+    session.install(".[benchmark]")
+    session.run("pytest", "benchmarks", "--color=yes", "--benchmark-autosave", *session.posargs)
+
+
 @nox.session(reuse_venv=True, name="dead-fixtures")
 def dead_fixtures(session):
     """Check for dead fixtures within the tests."""
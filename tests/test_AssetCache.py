@@ -0,0 +1,118 @@
+"""Test the ee_cache module."""
+import ee
+import pytest
+
+import geetools  # noqa: F401
+
+
+def pipeline(value: int = 1) -> ee.Image:
+    """An image standing for an expensive computation."""
+    return ee.Image(value).multiply(2).rename("foo")
+
+
+def collection(size: int = 2) -> ee.ImageCollection:
+    """An image collection standing for an expensive computation."""
+    return ee.ImageCollection([pipeline(i).set("system:index", str(i)) for i in range(size)])
+
+
+class TestKey:
+    """Test the ``key`` method."""
+
+    def test_same_graph(self, cache):
+        assert cache.key(pipeline()) == cache.key(pipeline())
+
+    def test_different_graph(self, cache):
+        assert cache.key(pipeline(1)) != cache.key(pipeline(2))
+
+    def test_export_parameters(self, cache):
+        region = ee.Geometry.Point([0, 0]).buffer(100)
+        key = cache.key(pipeline(), region=region, scale=30, crs="epsg:4326")
+        assert key == cache.key(pipeline(), region=region, scale=30.0, crs="EPSG:4326", fileFormat="foo")
+        assert key != cache.key(pipeline(), region=region, scale=10, crs="EPSG:4326")
+        assert key != cache.key(pipeline(), region=region.buffer(10), scale=30, crs="EPSG:4326")
+        assert cache.key(pipeline()) == cache.key(pipeline(), crs=None)
+
+
+class TestMaterialize:
+    """Test the ``materialize`` method."""
+
+    def test_miss(self, backend, cache):
+        image = pipeline()
+        assert cache.materialize(image, "pipeline", scale=30) is image
+        assert cache.metrics == {"hits": 0, "misses": 1, "evicted": 0}
+        assert backend.calls["exportImage"] == 1
+
+    def test_running_export(self, backend, cache):
+        cache.materialize(pipeline(), scale=30)
+        cache.materialize(pipeline(), scale=30)
+        assert backend.calls["exportImage"] == 1
+
+    def test_hit(self, backend, cache):
+        cache.materialize(pipeline(), scale=30)
+        backend.run()
+        cached = ee.geetools.AssetCache(cache.folder).materialize(pipeline(), scale=30)
+        asset = cache.folder / cache.key(pipeline(), scale=30)
+        assert ee.serializer.encode(cached) == ee.serializer.encode(ee.Image(asset.as_posix()))
+        assert "geetools_lastUsed" in backend.assets[asset.as_posix()]["properties"]
+
+    def test_wait(self, backend, cache):
+        cache.sleep = lambda delay: backend.run()
+        cached = cache.materialize(pipeline(), wait=True, scale=30)
+        asset = cache.folder / cache.key(pipeline(), scale=30)
+        assert ee.serializer.encode(cached) == ee.serializer.encode(ee.Image(asset.as_posix()))
+
+    def test_collection(self, backend, cache):
+        indices = iter(["0", "1"])
+        backend.results.update(
+            {"AggregateFeatureCollection.array": ["0", "1"], "Element.get": lambda obj: next(indices)}
+        )
+        cache.materialize(collection(), scale=30)
+        asset = cache.folder / cache.key(collection(), scale=30)
+        properties = backend.assets[asset.as_posix()]["properties"]
+        assert properties["geetools_size"] == 2
+        assert properties["geetools_parameters"] == '{"scale":30.0}'
+        assert cache.materialize(collection(), scale=30).func is not None
+        backend.run()
+        cached = cache.materialize(collection(), scale=30)
+        assert ee.serializer.encode(cached) == ee.serializer.encode(ee.ImageCollection(asset.as_posix()))
+
+    def test_not_an_image(self, cache):
+        with pytest.raises(TypeError):
+            cache.materialize(ee.Number(1))
+
+
+class TestEvict:
+    """Test the ``evict`` method."""
+
+    def test_least_recently_used(self, backend, cache):
+        backend.add(cache.folder.as_posix(), "FOLDER")
+        for i, (size, lastUsed) in enumerate([(100, 3), (100, 1), (100, 2)]):
+            name = (cache.folder / f"{i:024x}").as_posix()
+            backend.add(name, sizeBytes=str(size), properties={"geetools_lastUsed": lastUsed})
+        evicted = cache.evict(150)
+        assert evicted == [cache.folder / f"{1:024x}", cache.folder / f"{2:024x}"]
+        assert list(cache.report().index) == [f"{0:024x}"]
+        assert cache.metrics["evicted"] == 2
+
+    def test_foreign_assets(self, backend, cache):
+        backend.add(cache.folder.as_posix(), "FOLDER")
+        backend.add((cache.folder / "foo").as_posix(), sizeBytes="100")
+        assert cache.evict(0) == []
+
+    def test_no_limit(self, cache):
+        with pytest.raises(ValueError):
+            cache.evict()
+
+
+@pytest.fixture
+def backend():
+    """An active fake backend."""
+    with ee.geetools.FakeBackend(seed=0) as backend:
+        backend.add(backend.root, "FOLDER")
+        yield backend
+
+
+@pytest.fixture
+def cache(backend):
+    """An empty cache in the fake backend."""
+    return ee.geetools.AssetCache(f"{backend.root}/cache", sleep=lambda delay: None)
@@ -1,8 +1,12 @@
 """Test the ComputedObject class methods."""
 
+import json
+
 import ee
 import pytest
 
+from geetools import ee_archive
+
 
 class TestIsinstance:
     """Test the isInstance method."""
@@ -50,3 +54,19 @@ class TestOpen:
     def test_open_not_correct_suffix(self):
         with pytest.raises(ValueError):
             ee.Number.open("file.toto")
+
+    def test_open_legacy(self, tmp_path):
+        (file := tmp_path / "test.gee").write_text(json.dumps(ee.serializer.encode(ee.Number(1.1))))
+        assert ee.serializer.encode(ee.Number.open(file)) == ee.serializer.encode(ee.Number(1.1))
+
+    def test_open_compressed(self, tmp_path):
+        (object := ee.List([1, 2]).add(3)).save((file := tmp_path / "test.gee"), compression="none")
+        assert file.read_bytes().startswith(ee_archive.MAGIC)
+        assert ee.serializer.encode(ee.List.open(file)) == ee.serializer.encode(object)
+
+    def test_open_many_graphs(self, tmp_path):
+        with ee.geetools.GraphArchive((file := tmp_path / "test.gee"), "w") as archive:
+            archive.add("foo", ee.Number(1)).add("bar", ee.Number(2))
+        assert ee.serializer.encode(ee.Number.open(file, "bar")) == ee.serializer.encode(ee.Number(2))
+        with pytest.raises(ValueError):
+            ee.Number.open(file)
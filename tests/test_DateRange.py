@@ -1,4 +1,6 @@
 """Test the ``DateRange`` class."""
+import json
+
 import ee
 import pytest
 
@@ -22,6 +24,23 @@ class TestSplit:
         assert first.format("YYYY-MM-dd").getInfo() == "2020-01-01"
         assert last.format("YYYY-MM-dd").getInfo() == "2020-01-31"
 
+    def test_calendar_months(self):
+        list = ee.DateRange("2020-01-31", "2021-01-01").geetools.split(1, "month")
+        starts = list.map(lambda r: ee.DateRange(r).start().format("YYYY-MM-dd"))
+        assert starts.slice(0, 3).getInfo() == ["2020-01-31", "2020-02-29", "2020-03-31"]
+        assert list.size().getInfo() == 12
+
+    def test_literal_boundaries(self):
+        list = ee.DateRange("2020-01-01", "2021-01-01").geetools.split(1, "month")
+        assert "List.sequence" not in json.dumps(ee.serializer.encode(list))
+
+    def test_server_side(self):
+        list = ee.Date("2020-06-15").getRange("year").geetools.split(1, "month")
+        first = ee.DateRange(list.get(1)).start()
+        assert "List.sequence" in json.dumps(ee.serializer.encode(list))
+        assert list.size().getInfo() == 12
+        assert first.format("YYYY-MM-dd").getInfo() == "2020-02-01"
+
 
 class TestCheckUnit:
     """Test the ``check_unit`` method exception."""
@@ -1,5 +1,7 @@
 """Test the Dictionary class methods."""
 import ee
+import pandas as pd
+import pytest
 
 import geetools  # noqa: F401
 
@@ -54,3 +56,41 @@ class TestToTable:
         )
         res = ee_dict.geetools.toTable("dict")
         data_regression.check(res.getInfo())
+
+
+class TestToDataFrame:
+    """Test the ``toDataFrame`` method."""
+
+    def test_value(self):
+        table = ee.Dictionary({"foo": 1, "bar": 2}).geetools.toDataFrame()
+        assert table.index.name == "system:index"
+        assert table.to_dict() == {"value": {"bar": 2, "foo": 1}}
+        assert list(table.index) == ["bar", "foo"]
+
+    def test_list(self):
+        table = ee.Dictionary({"a": [1, 2], "b": [3]}).geetools.toDataFrame("list")
+        assert list(table.columns) == ["value_0", "value_1"]
+        assert table.loc["b", "value_0"] == 3
+        assert pd.isna(table.loc["b", "value_1"])
+
+    def test_dict(self):
+        data = {
+            "Argentina": {"ADM0_CODE": 12, "Shape_Area": 278.289196625},
+            "Armenia": {"ADM0_CODE": 13, "Shape_Area": 3.13783139285},
+        }
+        table = ee.Dictionary(data).geetools.toDataFrame("dict")
+        assert table.to_dict("index") == data
+
+    def test_arrow(self):
+        table = ee.Dictionary({"a": [1, 2], "b": [3, 4]}).geetools.toDataFrame("list", "arrow")
+        assert table.column_names == ["system:index", "value_0", "value_1"]
+        assert table.to_pydict()["value_1"] == [2, 4]
+
+    def test_computed_values(self):
+        d = ee.Dictionary.fromLists(["b", "a"], [ee.Number(1).add(1), 2])
+        table = d.geetools.toDataFrame()
+        assert table.to_dict() == {"value": {"a": 2, "b": 2}}
+
+    def test_wrong_value_type(self):
+        with pytest.raises(ValueError):
+            ee.Dictionary({"a": 1}).geetools.toDataFrame("array")
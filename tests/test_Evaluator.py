@@ -0,0 +1,106 @@
+"""Test the ee_evaluator module."""
+from pathlib import Path
+
+import ee
+import pytest
+import yaml
+
+import geetools  # noqa: F401
+
+
+def recorded(name: str):
+    """Load a server result recorded by the List regression tests."""
+    return yaml.safe_load((Path(__file__).parent / "test_List" / f"{name}.yml").read_text())
+
+
+class TestEvaluate:
+    """Test the ``evaluate`` method against the recorded server results."""
+
+    def test_product(self, evaluator):
+        product = ee.List(["a", "b", "c"]).geetools.product(ee.List([1, 2]))
+        assert evaluator.evaluate(product) == recorded("test_product_with_different_type")
+
+    def test_union(self, evaluator):
+        union = ee.List(["a", "b", "c"]).geetools.union(ee.List([1, 2]))
+        assert evaluator.evaluate(union) == recorded("test_union_without_dupplicates")
+
+    def test_intersection(self, evaluator):
+        intersection = ee.List(["a", "b", "c"]).geetools.intersection(["a", "b", "c"])
+        assert evaluator.evaluate(intersection) == recorded("test_intersection_with_same_type")
+
+    def test_chunked(self, evaluator):
+        chunked = ee.List([1, 2, 3, 4, 5, 6, 7, 8, 9]).geetools.chunked(4)
+        assert evaluator.evaluate(chunked) == recorded("test_chunked_odd")
+
+    def test_replace_many(self, evaluator):
+        replaced = ee.List(["a", "b", "c"]).geetools.replaceMany({"a": "foo", "c": "bar"})
+        assert evaluator.evaluate(replaced) == recorded("test_replace_many")
+
+    def test_sequence(self, evaluator):
+        assert evaluator.evaluate(ee.List.geetools.sequence(1, 10, 3)) == [1, 4, 7, 10]
+        assert evaluator.evaluate(ee.List.geetools.sequence(1, 10, 0)) == list(range(1, 11))
+
+    def test_dictionary(self, evaluator):
+        d = ee.Dictionary.geetools.fromPairs([["foo", 1], ["bar", 2]])
+        assert evaluator.evaluate(d) == {"foo": 1, "bar": 2}
+        assert evaluator.evaluate(d.geetools.getMany(["foo"])) == [1]
+        assert list(evaluator.evaluate(d.geetools.sort())) == ["bar", "foo"]
+
+    def test_format(self, evaluator):
+        string = ee.String("{greeting} pi={number%.2f} start={start%tyyyy-MM-dd} end={end%tdd MMM yyyy}")
+        params = {"greeting": "Hello", "number": 3.1415, "start": 1577836800000, "end": "2021-01-01"}
+        formatted = string.geetools.format(params)
+        assert evaluator.evaluate(formatted) == "Hello pi=3.14 start=2020-01-01 end=01 Jan 2021"
+
+    def test_from_doy(self, evaluator):
+        assert evaluator.evaluate(ee.Date.geetools.fromDOY(1, 2020).format("YYYY-MM-DD")) == "2020-01-01"
+        assert evaluator.evaluate(ee.Date.geetools.fromDOY(1, 3).format("YYYY-MM-DD")) == "0003-01-01"
+
+    def test_split(self, evaluator):
+        ranges = ee.DateRange("2020-01-01", "2020-01-31").geetools.split(1, "day")
+        assert evaluator.evaluate(ranges.size()) == 30
+        assert evaluator.evaluate(ee.DateRange(ranges.get(-1)).end().format("YYYY-MM-dd")) == "2020-01-31"
+
+    def test_no_request(self, evaluator, monkeypatch):
+        monkeypatch.setattr(ee.data, "computeValue", lambda *args: pytest.fail("server called"))
+        evaluator.evaluate(ee.List([1, 2]).geetools.union([3]))
+        assert evaluator.metrics == {"folded": 1, "fallback": 0}
+
+    def test_fallback(self, evaluator, monkeypatch):
+        monkeypatch.setattr(ee.data, "computeValue", lambda *args: "server")
+        sizes = ee.ImageCollection("COPERNICUS/S2_SR_HARMONIZED").aggregate_array("foo")
+        assert evaluator.evaluate(ee.List(sizes).geetools.union([3])) == "server"
+        assert evaluator.metrics == {"folded": 0, "fallback": 1}
+
+
+class TestFold:
+    """Test the folding of the geetools methods in the ``Evaluator`` context."""
+
+    def test_literal(self, evaluator):
+        with evaluator:
+            chunked = ee.List([1, 2, 3, 4, 5]).geetools.chunked(2)
+        assert isinstance(chunked, ee.List)
+        assert chunked.func is None
+        assert evaluator.evaluate(chunked) == [[1, 2], [3, 4, 5]]
+
+    def test_date(self, evaluator):
+        with evaluator:
+            date = ee.Date.geetools.fromDOY(61, 2020)
+        assert ee.serializer.encode(date) == ee.serializer.encode(ee.Date(1583020800000))
+
+    def test_server_data(self, evaluator):
+        with evaluator:
+            union = ee.List(ee.ImageCollection("COPERNICUS/S2_SR_HARMONIZED").aggregate_array("foo"))
+            union = union.geetools.union([1])
+        assert union.func is not None
+        assert evaluator.metrics["fallback"] == 1
+
+    def test_disabled(self):
+        chunked = ee.List([1, 2, 3, 4, 5]).geetools.chunked(2)
+        assert chunked.func is not None
+
+
+@pytest.fixture
+def evaluator():
+    """A new evaluator."""
+    return ee.geetools.Evaluator()
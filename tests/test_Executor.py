@@ -0,0 +1,110 @@
+"""Test the ee_executor module."""
+import ee
+import pytest
+
+import geetools  # noqa: F401
+
+
+class FaultyBackend:
+    """A fake Earth Engine backend raising the provided errors before answering."""
+
+    def __init__(self, *errors: str):
+        """Initialize the backend with the errors to raise."""
+        self.errors, self.calls = list(errors), []
+
+    def __call__(self, **kwargs):
+        self.calls.append(kwargs)
+        if self.errors:
+            raise ee.EEException(self.errors.pop(0))
+        return "result"
+
+
+class HttpError(Exception):
+    """A fake ``googleapiclient`` HTTP error exposing the status of its response."""
+
+    def __init__(self, status: int):
+        """Initialize the error with the status of the response."""
+        super().__init__(f"status {status}")
+        self.resp = type("Response", (), {"status": status})()
+
+
+class TestClassify:
+    """Test the ``classify`` method."""
+
+    def test_throttling(self, executor):
+        assert executor.classify(ee.EEException("Too many concurrent aggregations.")) == "throttling"
+        assert executor.classify(ee.EEException("<HttpError 429 Too Many Requests>")) == "throttling"
+        assert executor.classify(ee.EEException('{"error": {"code": 429}}')) == "throttling"
+
+    def test_throttling_status(self, executor):
+        try:
+            try:
+                raise HttpError(429)
+            except HttpError:
+                raise ee.EEException("Resource has been exhausted.")
+        except ee.EEException as e:
+            assert executor.classify(e) == "throttling"
+
+    def test_memory(self, executor):
+        assert executor.classify(ee.EEException("User memory limit exceeded.")) == "memory"
+
+    def test_fatal(self, executor):
+        assert executor.classify(ee.EEException("Image.load: Image asset 'foo' not found.")) == "fatal"
+        assert executor.classify(ee.EEException("Image asset 'T32TQM_20200429' not found.")) == "fatal"
+        assert executor.classify(ee.EEException("Invalid coordinate 45.429.")) == "fatal"
+
+
+class TestExecute:
+    """Test the ``execute`` method."""
+
+    def test_success(self, executor):
+        assert executor.execute(FaultyBackend()) == "result"
+        assert executor.metrics["calls"] == 1
+        assert executor.metrics["retries"] == 0
+
+    def test_throttling_backoff(self, executor, delays):
+        backend = FaultyBackend("Too many concurrent aggregations.", "Too many requests")
+        assert executor.execute(backend) == "result"
+        assert len(delays) == 2
+        assert 0 <= delays[0] <= 1 and 0 <= delays[1] <= 2
+        assert executor.metrics["throttling"] == 2
+
+    def test_memory_tile_scale(self, executor):
+        backend = FaultyBackend("User memory limit exceeded.", "User memory limit exceeded.")
+        assert executor.execute(backend, tileScale=2) == "result"
+        assert [c["tileScale"] for c in backend.calls] == [2, 4, 8]
+        assert executor.metrics["memory"] == 2
+
+    def test_memory_best_effort(self, executor):
+        backend = FaultyBackend("Too many pixels in the region.")
+        assert executor.execute(backend, bestEffort=False) == "result"
+        assert [c["bestEffort"] for c in backend.calls] == [False, True]
+
+    def test_memory_no_parameter(self, executor):
+        with pytest.raises(ee.EEException):
+            executor.execute(FaultyBackend("User memory limit exceeded."))
+
+    def test_fatal_fails_fast(self, executor, delays):
+        backend = FaultyBackend("Collection.loadTable: Table asset 'foo' not found.")
+        with pytest.raises(ee.EEException):
+            executor.execute(backend)
+        assert len(backend.calls) == 1
+        assert executor.metrics["fatal"] == 1
+
+    def test_max_retries(self, executor):
+        backend = FaultyBackend(*["Too many concurrent aggregations."] * 5)
+        with pytest.raises(ee.EEException):
+            executor.execute(backend)
+        assert len(backend.calls) == 4
+
+
+@pytest.fixture
+def delays():
+    """The delays waited by the executor."""
+    return []
+
+
+@pytest.fixture
+def executor(delays):
+    """An executor recording its delays instead of sleeping."""
+    return ee.geetools.Executor(maxRetries=3, sleep=delays.append, seed=0)
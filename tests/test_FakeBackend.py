@@ -0,0 +1,140 @@
+"""Test the ee_fake_backend module."""
+import ee
+import pytest
+
+import geetools  # noqa: F401
+
+
+class TestAsset:
+    """Test the asset endpoints."""
+
+    def test_mkdir(self, backend):
+        folder = ee.Asset(backend.root) / "folder" / "subfolder"
+        folder.mkdir(parents=True)
+        assert backend.assets[folder.as_posix()]["type"] == "FOLDER"
+        assert folder.is_folder()
+
+    def test_missing_parent(self, backend):
+        with pytest.raises(ee.EEException):
+            ee.data.createAsset({"type": "FOLDER"}, f"{backend.root}/folder/subfolder")
+
+    def test_iterdir(self, backend, tree):
+        assets = tree.iterdir(recursive=True)
+        assert len(assets) == 8
+        assert tree / "folder_1" / "image_2" in assets
+
+    def test_pagination(self, backend, tree):
+        params = {"parent": (tree / "folder_0").as_posix(), "pageSize": 2}
+        page = ee.data.listAssets(params)
+        assert len(page["assets"]) == 2
+        page = ee.data.listAssets({**params, "pageToken": page["nextPageToken"]})
+        assert len(page["assets"]) == 1
+        assert "nextPageToken" not in page
+
+    def test_copy(self, backend, tree):
+        tree.copy(ee.Asset(backend.root) / "copy")
+        assert ee.Asset(backend.root, "copy", "folder_1", "image_2").exists()
+
+    def test_set_properties(self, backend, tree):
+        image = tree / "folder_0" / "image_0"
+        image.setProperties(foo="bar", **{"system:time_start": 0})
+        asset = ee.data.getAsset(image.as_posix())
+        assert asset["properties"] == {"index": 0, "foo": "bar"}
+        assert asset["startTime"] == "1970-01-01T00:00:00Z"
+
+    def test_delete_missing(self, backend):
+        with pytest.raises(ee.EEException):
+            ee.data.deleteAsset(f"{backend.root}/missing")
+
+    def test_legacy_name(self, backend, tree):
+        asset = ee.data.getAsset(f"projects/earthengine-legacy/assets/{tree.as_posix()}")
+        assert asset["name"] == tree.as_posix()
+
+
+class TestComputeValue:
+    """Test the ``computeValue`` endpoint."""
+
+    def test_literal(self, backend):
+        assert ee.List([1, 2]).geetools.union([3]).getInfo() == [1, 2, 3]
+
+    def test_results(self, backend):
+        backend.results["Collection.size"] = 12
+        assert ee.ImageCollection("COPERNICUS/S2_SR_HARMONIZED").size().getInfo() == 12
+
+    def test_callable_results(self, backend):
+        backend.results["Collection.size"] = lambda obj: 5
+        assert ee.FeatureCollection("FAO/GAUL/2015/level0").size().getInfo() == 5
+
+    def test_missing_results(self, backend):
+        with pytest.raises(ee.EEException):
+            ee.ImageCollection("COPERNICUS/S2_SR_HARMONIZED").size().getInfo()
+
+
+class TestExport:
+    """Test the export and operation endpoints."""
+
+    def test_lifecycle(self, backend):
+        task = ee.batch.Export.image.toAsset(ee.Image(1), "image", f"{backend.root}/image", scale=30)
+        task.start()
+        assert task.status()["state"] == "READY"
+        backend.run()
+        assert task.status()["state"] == "COMPLETED"
+        assert ee.Asset(backend.root, "image").is_image()
+
+    def test_cancel(self, backend):
+        task = ee.batch.Export.image.toAsset(ee.Image(1), "image", f"{backend.root}/image", scale=30)
+        task.start()
+        task.cancel()
+        backend.run()
+        assert task.status()["state"] == "CANCELLED"
+        assert not ee.Asset(backend.root, "image").exists()
+
+
+class TestFailures:
+    """Test the injected latency and failures."""
+
+    def test_fail(self, backend):
+        backend.fail("getAsset", "Too many requests", times=2)
+        executor = ee.geetools.Executor(sleep=lambda delay: None)
+        asset = executor.execute(ee.data.getAsset, backend.root, endpoint="metadata")
+        assert asset["type"] == "FOLDER"
+        assert backend.calls["getAsset"] == 3
+
+    def test_failure_rate(self):
+        with ee.geetools.FakeBackend(failureRate=1.0) as backend:
+            with pytest.raises(ee.EEException, match=backend.failureMessage):
+                ee.data.getAsset(backend.root)
+
+    def test_latency(self):
+        delays = []
+        with ee.geetools.FakeBackend(latency={"getAsset": 0.5}, sleep=delays.append) as backend:
+            backend.add(f"{backend.root}/image")
+            ee.data.getAsset(f"{backend.root}/image")
+            ee.data.listAssets({"parent": backend.root})
+        assert delays == [0.5]
+
+    def test_restored(self):
+        getAsset = ee.data.getAsset
+        with ee.geetools.FakeBackend():
+            assert ee.data.getAsset is not getAsset
+        assert ee.data.getAsset is getAsset
+
+
+@pytest.fixture
+def backend():
+    """An active fake backend."""
+    with ee.geetools.FakeBackend(seed=0) as backend:
+        backend.add(backend.root, "FOLDER")
+        yield backend
+
+
+@pytest.fixture
+def tree(backend):
+    """A folder of 2 subfolders containing 3 images each."""
+    root = ee.Asset(backend.root) / "tree"
+    backend.add(root.as_posix(), "FOLDER")
+    for i in range(2):
+        backend.add((root / f"folder_{i}").as_posix(), "FOLDER")
+        for j in range(3):
+            backend.add((root / f"folder_{i}" / f"image_{j}").as_posix(), properties={"index": j})
+    return root
@@ -82,6 +82,55 @@ class TestColumnNames:
         return image.reduceRegions(collection=fc, reducer=ee.Reducer.first(), scale=1000)
 
 
+class TestColumnNamesSample:
+    """Test the ``columnNames`` method with a sampling option."""
+
+    def test_column_names_sample_first(self, fc_instance):
+        columns = fc_instance.geetools.columnNames(sample=1)
+        assert sorted(columns.getInfo()) == ["name", "system:index", "value"]
+
+    def test_column_names_sample_random(self):
+        # each feature has its own column so the number of columns is the number of inspected features
+        fc = ee.FeatureCollection([ee.Feature(None, {f"column_{i}": i}) for i in range(20)])
+        columns = fc.geetools.columnNames(sample=5, method="random").remove("system:index")
+        assert columns.size().getInfo() == 5
+
+    def test_column_names_wrong_method(self, fc_instance):
+        with pytest.raises(ValueError):
+            fc_instance.geetools.columnNames(sample=1, method="toto")
+
+    @pytest.fixture
+    def fc_instance(self):
+        return ee.FeatureCollection(
+            [
+                ee.Feature(ee.Geometry.Point([0, 0]), {"name": "A", "value": 1}),
+                ee.Feature(ee.Geometry.Point([1, 1]), {"name": "B", "value": 2, "extra": "C"}),
+            ]
+        )
+
+
+class TestSchema:
+    """Test the ``schema`` method."""
+
+    def test_schema(self, fc_instance):
+        schema = fc_instance.geetools.schema()
+        assert schema == {"system:index": "String", "name": "String", "value": "Float|Integer"}
+
+    def test_schema_memoized_column_names(self, fc_instance):
+        schema = fc_instance.geetools.schema()
+        columns = fc_instance.geetools.columnNames()
+        assert columns.getInfo() == list(schema.keys())
+
+    @pytest.fixture
+    def fc_instance(self):
+        return ee.FeatureCollection(
+            [
+                ee.Feature(ee.Geometry.Point([0, 0]), {"name": "A", "value": 1}),
+                ee.Feature(ee.Geometry.Point([1, 1]), {"name": "B", "value": 2.5}),
+            ]
+        )
+
+
 class TestMergeGeometries:
     """Test the ``mergeGeometries`` method."""
 
@@ -0,0 +1,113 @@
+"""Test the ee_governor module."""
+import threading
+
+import ee
+import pytest
+
+import geetools  # noqa: F401
+from geetools.ee_governor import TokenBucket
+
+
+class FakeClock:
+    """A simulated clock moving forward only when something sleeps."""
+
+    def __init__(self):
+        """Start the clock at 0."""
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """Return the current simulated time."""
+        return self.now
+
+    def sleep(self, delay: float):
+        """Move the clock forward instead of waiting."""
+        self.now += delay
+
+
+class TestTokenBucket:
+    """Test the ``TokenBucket`` class."""
+
+    def test_burst(self, clock):
+        bucket = TokenBucket(5, clock=clock, sleep=clock.sleep)
+        waited = [bucket.acquire() for _ in range(5)]
+        assert waited == [0] * 5
+        assert clock.now == 0
+
+    def test_rate(self, clock):
+        bucket = TokenBucket(5, clock=clock, sleep=clock.sleep)
+        [bucket.acquire() for _ in range(15)]
+        assert clock.now == pytest.approx(2)
+        assert bucket.waited == pytest.approx(2)
+
+    def test_refill(self, clock):
+        bucket = TokenBucket(2, clock=clock, sleep=clock.sleep)
+        [bucket.acquire() for _ in range(2)]
+        clock.sleep(10)
+        assert bucket.acquire() == 0
+        assert bucket.tokens == 1
+
+
+class TestGovernor:
+    """Test the ``Governor`` class."""
+
+    def test_limits(self, governor):
+        with governor.acquire("compute"), governor.acquire("compute"):
+            report = governor.utilization()
+        assert report["compute"]["inFlight"] == 2
+        assert report["compute"]["concurrency"] == 0.5
+        assert report["metadata"]["rate"] == 20
+
+    def test_utilization_released(self, governor):
+        with governor.acquire("export"):
+            pass
+        report = governor.utilization()["export"]
+        assert report["inFlight"] == 0
+        assert report["requests"] == 1
+
+    def test_rate_limited(self, governor, clock):
+        for _ in range(6):
+            with governor.acquire("compute"):
+                pass
+        assert clock.now == pytest.approx(0.5)
+        assert governor.utilization()["compute"]["waited"] == pytest.approx(0.5)
+
+    def test_concurrency(self, clock):
+        governor = ee.geetools.Governor({"compute": {"rate": 100, "concurrency": 1}}, clock, clock.sleep)
+        started, release = threading.Event(), threading.Event()
+
+        def hold():
+            with governor.acquire("compute"):
+                started.set()
+                release.wait()
+
+        thread = threading.Thread(target=hold)
+        thread.start()
+        started.wait()
+        semaphore = governor._endpoints["compute"]["semaphore"]
+        assert semaphore.acquire(blocking=False) is False
+        release.set()
+        thread.join()
+        assert governor.utilization()["compute"]["inFlight"] == 0
+
+    def test_unknown_endpoint(self, governor):
+        with pytest.raises(ValueError):
+            with governor.acquire("foo"):
+                pass
+
+    def test_executor(self, governor):
+        executor = ee.geetools.Executor(governor=governor)
+        executor.execute(lambda: "result", endpoint="metadata")
+        assert governor.utilization()["metadata"]["requests"] == 1
+
+
+@pytest.fixture
+def clock():
+    """A simulated clock."""
+    return FakeClock()
+
+
+@pytest.fixture
+def governor(clock):
+    """A governor using the simulated clock."""
+    limits = {"compute": {"rate": 4, "concurrency": 4}}
+    return ee.geetools.Governor(limits, clock, clock.sleep)
@@ -0,0 +1,123 @@
+"""Test the ee_archive module."""
+import ee
+import pytest
+
+import geetools  # noqa: F401
+from geetools import ee_archive
+
+
+def region(i: int = 0) -> ee.Geometry:
+    """A large polygon, shifted by ``i`` degrees."""
+    return ee.Geometry.Polygon([[[i + j / 1000, (j % 7) / 10] for j in range(500)]])
+
+
+def encoded(obj: ee.ComputedObject) -> dict:
+    """The Cloud API expression of an object."""
+    return ee.serializer.encode(obj)
+
+
+class TestAdd:
+    """Test the ``add`` method."""
+
+    def test_roundtrip(self, tmp_path):
+        objects = {
+            "foo": ee.List([1, 2]).map(lambda x: ee.Number(x).add(1)),
+            "bar": ee.Image(1).clip(region()),
+        }
+        with ee.geetools.GraphArchive(tmp_path / "test.gee", "w") as archive:
+            [archive.add(name, obj) for name, obj in objects.items()]
+        with ee.geetools.GraphArchive(tmp_path / "test.gee") as archive:
+            assert archive.names() == ["foo", "bar"]
+            assert {name: encoded(obj) for name, obj in archive.items()} == {
+                name: encoded(obj) for name, obj in objects.items()
+            }
+
+    def test_deduplicate(self, tmp_path):
+        with ee.geetools.GraphArchive(tmp_path / "one.gee", "w", "none") as archive:
+            archive.add("0", ee.Image(0).clip(region()))
+        with ee.geetools.GraphArchive(tmp_path / "many.gee", "w", "none") as archive:
+            [archive.add(str(i), ee.Image(i).clip(region())) for i in range(10)]
+        assert (tmp_path / "many.gee").stat().st_size < 2 * (tmp_path / "one.gee").stat().st_size
+
+    def test_compression(self, tmp_path):
+        for compression in ["none", "gzip"]:
+            with ee.geetools.GraphArchive(tmp_path / f"{compression}.gee", "w", compression) as archive:
+                archive.add("0", ee.Image(0).clip(region()))
+        assert (tmp_path / "gzip.gee").stat().st_size < (tmp_path / "none.gee").stat().st_size / 2
+
+    def test_zstd(self, tmp_path):
+        pytest.importorskip("zstandard")
+        with ee.geetools.GraphArchive(tmp_path / "test.gee", "w", "zstd") as archive:
+            archive.add("0", ee.Image(0).clip(region()))
+        with ee.geetools.GraphArchive(tmp_path / "test.gee") as archive:
+            assert archive.compression == "zstd"
+            assert encoded(archive["0"]) == encoded(ee.Image(0).clip(region()))
+
+    def test_duplicated_name(self, tmp_path):
+        with ee.geetools.GraphArchive(tmp_path / "test.gee", "w") as archive:
+            archive.add("foo", ee.Number(1))
+            with pytest.raises(ValueError):
+                archive.add("foo", ee.Number(2))
+
+    def test_append(self, tmp_path):
+        with ee.geetools.GraphArchive(tmp_path / "test.gee", "w") as archive:
+            archive.add("0", ee.Image(0).clip(region()))
+        content = (tmp_path / "test.gee").read_bytes()
+        with ee.geetools.GraphArchive(tmp_path / "test.gee", "a") as archive:
+            archive.add("1", ee.Image(1).clip(region()))
+        with ee.geetools.GraphArchive(tmp_path / "test.gee") as archive:
+            assert archive.names() == ["0", "1"]
+            assert encoded(archive["1"]) == encoded(ee.Image(1).clip(region()))
+        # the previous index and footer are kept in the file and are not counted
+        offset = ee_archive._FOOTER.unpack(content[-ee_archive._FOOTER.size :])[0]
+        size = (tmp_path / "test.gee").stat().st_size - (len(content) - offset)
+        assert size < 1.2 * len(content)
+
+    def test_append_keeps_index(self, tmp_path):
+        with ee.geetools.GraphArchive(tmp_path / "test.gee", "w") as archive:
+            archive.add("0", ee.Image(0).clip(region()))
+        archive = ee.geetools.GraphArchive(tmp_path / "test.gee", "a")
+        archive.add("1", ee.Image(1).clip(region()))
+        with ee.geetools.GraphArchive(tmp_path / "test.gee") as reader:
+            assert reader.names() == ["0"]
+        archive.close()
+        with ee.geetools.GraphArchive(tmp_path / "test.gee") as reader:
+            assert reader.names() == ["0", "1"]
+
+    def test_append_error(self, tmp_path):
+        with ee.geetools.GraphArchive(tmp_path / "test.gee", "w") as archive:
+            archive.add("0", ee.Image(0).clip(region()))
+        content = (tmp_path / "test.gee").read_bytes()
+        with pytest.raises(RuntimeError):
+            with ee.geetools.GraphArchive(tmp_path / "test.gee", "a") as archive:
+                archive.add("1", ee.Image(1).clip(region()))
+                raise RuntimeError("interrupted")
+        assert (tmp_path / "test.gee").read_bytes() == content
+
+    def test_read_only(self, tmp_path):
+        ee.geetools.GraphArchive(tmp_path / "test.gee", "w").close()
+        with ee.geetools.GraphArchive(tmp_path / "test.gee") as archive:
+            with pytest.raises(ValueError):
+                archive.add("foo", ee.Number(1))
+
+
+class TestGet:
+    """Test the ``get`` method."""
+
+    def test_lazy(self, tmp_path):
+        with ee.geetools.GraphArchive(tmp_path / "test.gee", "w") as archive:
+            [archive.add(str(i), ee.Image(i).clip(region(i))) for i in range(5)]
+        with ee.geetools.GraphArchive(tmp_path / "test.gee") as archive:
+            assert encoded(archive["3"]) == encoded(ee.Image(3).clip(region(3)))
+            assert list(archive._cache) == [3]
+
+    def test_missing(self, tmp_path):
+        ee.geetools.GraphArchive(tmp_path / "test.gee", "w").close()
+        with ee.geetools.GraphArchive(tmp_path / "test.gee") as archive:
+            with pytest.raises(KeyError):
+                archive.get("foo")
+
+    def test_not_an_archive(self, tmp_path):
+        (tmp_path / "test.gee").write_text("{}")
+        with pytest.raises(ValueError):
+            ee.geetools.GraphArchive(tmp_path / "test.gee")
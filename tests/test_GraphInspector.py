@@ -0,0 +1,100 @@
+"""Test the ee_graph module."""
+import ee
+import pytest
+
+import geetools  # noqa: F401
+
+
+def invariant_map():
+    """A list mapped with a function using a loop-invariant sum."""
+    return ee.List([1, 2, 3]).map(lambda x: ee.Number(x).add(ee.List([4, 5]).reduce(ee.Reducer.sum())))
+
+
+def invocation(name, **arguments):
+    """A function invocation value node."""
+    return {"functionInvocationValue": {"functionName": name, "arguments": arguments}}
+
+
+class TestInspect:
+    """Test the ``inspect`` method."""
+
+    def test_statistics(self, inspector):
+        statistics = inspector.inspect(invariant_map())
+        assert statistics["values"] == 2
+        assert statistics["nodes"] == 9
+        assert statistics["depth"] == 5
+        assert statistics["duplicates"] == 0
+        assert statistics["literalBytes"] == len("[1, 2, 3]") + len("[4, 5]") + len("false")
+
+    def test_shared_subgraph(self, inspector):
+        number = ee.Number(1).add(2)
+        statistics = inspector.inspect(number.multiply(number))
+        assert statistics["duplicates"] == 1
+        assert statistics["treeNodes"] > statistics["nodes"]
+
+
+class TestOptimize:
+    """Test the ``optimize`` method."""
+
+    def test_hoist(self, inspector):
+        expression = inspector.optimize(invariant_map())
+        assert expression["values"]["1"]["functionInvocationValue"]["arguments"]["right"] == {
+            "valueReference": "2"
+        }
+        assert expression["values"]["2"]["functionInvocationValue"]["functionName"] == "List.reduce"
+
+    def test_argument_not_hoisted(self, inspector):
+        mapped = ee.List([1, 2, 3]).map(lambda x: ee.Number(x).add(1).multiply(2))
+        assert inspector.optimize(mapped) == ee.serializer.encode(mapped)
+
+    def test_deduplicate(self, inspector):
+        repeated = invocation("Number.add", left={"constantValue": 1}, right={"constantValue": 2})
+        expression = {
+            "result": "0",
+            "values": {"0": invocation("Number.multiply", left=repeated, right=repeated)},
+        }
+        optimized = inspector.optimize(expression)
+        arguments = optimized["values"]["0"]["functionInvocationValue"]["arguments"]
+        assert arguments == {"left": {"valueReference": "1"}, "right": {"valueReference": "1"}}
+        assert optimized["values"]["1"] == repeated
+
+    def test_merge_values(self, inspector):
+        repeated = invocation("Number.add", left={"constantValue": 1}, right={"constantValue": 2})
+        arguments = {"left": {"valueReference": "1"}, "right": {"valueReference": "2"}}
+        values = {"0": invocation("Number.multiply", **arguments), "1": repeated, "2": repeated}
+        optimized = inspector.optimize({"result": "0", "values": values})
+        assert len(optimized["values"]) == 2
+
+    def test_same_graph(self, inspector):
+        original = invariant_map()
+        optimized = ee.deserializer.decodeCloudApi(inspector.optimize(original))
+        assert ee.serializer.encode(optimized) == ee.serializer.encode(original)
+
+
+class TestReport:
+    """Test the ``report`` of the recorded geetools calls."""
+
+    def test_report(self, inspector):
+        with inspector:
+            ee.List([1, 2, 3]).geetools.chunked(2)
+            ee.List.geetools.sequence(1, 5)
+            ee.Date.geetools.fromDOY(1, 2020)
+        report = inspector.report()
+        assert list(report.index) == ["List.chunked", "List.sequence", "Date.fromDOY"]
+        assert report.loc["List.sequence", "calls"] == 1
+        assert report.loc["List.chunked", "added"] == report.loc["List.chunked", "nodes"] - 1
+
+    def test_restored(self, inspector):
+        method = vars(type(ee.List([]).geetools))["chunked"]
+        with inspector:
+            assert vars(type(ee.List([]).geetools))["chunked"] is not method
+        assert vars(type(ee.List([]).geetools))["chunked"] is method
+
+    def test_empty(self, inspector):
+        assert inspector.report().empty
+
+
+@pytest.fixture
+def inspector():
+    """A new graph inspector."""
+    return ee.geetools.GraphInspector()
@@ -101,11 +101,53 @@ class TestRemove:
 class TestToGrid:
     """Test the ``toGrid`` method."""
 
-    def test_to_grid(self, s2_sr_vatican_2020, vatican_buffer, ndarrays_regression):
+    def test_to_grid(self, s2_sr_vatican_2020, vatican_buffer):
         grid = s2_sr_vatican_2020.geetools.toGrid(1, "B2", vatican_buffer)
-        grid = [f["geometry"]["coordinates"] for f in grid.getInfo()["features"]]
-        grid = {f"geometry_{i}": np.array(c) for i, c in enumerate(grid)}
-        ndarrays_regression.check(grid)
+        coords = [f["geometry"]["coordinates"][0] for f in grid.getInfo()["features"]]
+        # a 100m buffer is covered by at least pi * 10 * 10 cells of 10m and at most 22 * 22
+        assert 314 <= len(coords) <= 484
+        assert all(len(c) == 5 for c in coords)
+
+    def test_to_grid_covers_geometry(self, s2_sr_vatican_2020, vatican_buffer):
+        grid = s2_sr_vatican_2020.geetools.toGrid(1, "B2", vatican_buffer, chunkSize=50)
+        uncovered = vatican_buffer.difference(grid.geometry(), 0.1).area(0.1)
+        assert uncovered.getInfo() < 1
+
+    def test_to_grid_hexagon(self, s2_sr_vatican_2020, vatican_buffer):
+        grid = s2_sr_vatican_2020.geetools.toGrid(2, "B2", vatican_buffer, shape="hexagon")
+        coords = [f["geometry"]["coordinates"][0] for f in grid.getInfo()["features"]]
+        assert len(coords) > 0
+        assert all(len(c) == 7 for c in coords)
+
+    def test_to_grid_ee_objects(self, s2_sr_vatican_2020, vatican_buffer):
+        grid = s2_sr_vatican_2020.geetools.toGrid(ee.Number(1), ee.String("B2"), vatican_buffer)
+        expected = s2_sr_vatican_2020.geetools.toGrid(1, "B2", vatican_buffer)
+        assert grid.size().getInfo() == expected.size().getInfo()
+
+    def test_to_grid_request_size(self, s2_sr_vatican_2020, vatican_buffer):
+        region = vatican_buffer.buffer(2000)
+        small = ee.serializer.toJSON(s2_sr_vatican_2020.geetools.toGrid(10, "B2", region))
+        large = ee.serializer.toJSON(s2_sr_vatican_2020.geetools.toGrid(1, "B2", region, chunkSize=100000))
+        assert len(large) < len(small) + 100
+
+    def test_to_grid_wrong_shape(self, s2_sr_vatican_2020):
+        with pytest.raises(ValueError):
+            s2_sr_vatican_2020.geetools.toGrid(1, "B2", shape="triangle")
+
+
+class TestToGridAsset:
+    """Test the ``toGridAsset`` method."""
+
+    def test_to_grid_asset(self, s2_sr_vatican_2020, vatican_buffer):
+        task = s2_sr_vatican_2020.geetools.toGridAsset("projects/foo/assets/grid", 1, "B2", vatican_buffer)
+        assert isinstance(task, ee.batch.Task)
+        assert task.config["description"] == "grid"
+
+    def test_to_grid_asset_chunk_size(self, s2_sr_vatican_2020, vatican_buffer):
+        args = ("projects/foo/assets/grid", 1, "B2", vatican_buffer)
+        default = s2_sr_vatican_2020.geetools.toGridAsset(*args)
+        chunked = s2_sr_vatican_2020.geetools.toGridAsset(*args, chunkSize=50)
+        assert default.config != chunked.config
 
 
 class TestClipOnCollection:
@@ -885,6 +927,65 @@ class TestPlotByBands:
         return ee.ImageCollection("OREGONSTATE/PRISM/Norm91m").toBands()
 
 
+class TestByRegionsChunked:
+    """Test the ``byRegionsChunked`` method."""
+
+    def test_by_regions_chunked(self):
+        kwargs = {"regions": self.ecoregions, "regionId": "label", "bands": self.bands, "scale": 5000}
+        expected = self.image.geetools.byRegions(**kwargs).getInfo()
+        with ee.geetools.Profiler() as p:
+            df = self.image.geetools.byRegionsChunked(**kwargs, chunkSize=2, profiler=p)
+        assert sorted(df.index) == sorted(expected)
+        for label, values in expected.items():
+            for band, value in values.items():
+                assert isclose(df.loc[label, band], value)
+        assert sorted(t["chunk"] for t in p.timings) == [0, 1]
+
+    def test_by_regions_chunked_area(self):
+        df = self.image.geetools.byRegionsChunked(
+            self.ecoregions, bands=self.bands, scale=5000, chunkArea=1, maxWorkers=1
+        )
+        assert len(df) == 3
+        assert list(df.columns) == self.bands
+
+    def test_by_regions_chunked_duplicated_ids(self):
+        regions = self.ecoregions.merge(self.ecoregions)
+        df = self.image.geetools.byRegionsChunked(regions, regionId="label", bands=self.bands, chunkSize=4)
+        assert len(df) == 6
+
+    def test_by_regions_chunked_profile_hook(self):
+        hooks, ids = [], []
+        regions = ee.FeatureCollection([ee.Feature(ee.Geometry.Point([i, 0]), {"id": i}) for i in range(6)])
+
+        def reduce(obj):
+            hooks.append(ee.data._thread_locals.profile_hook)
+            return {"features": [{"id": "0", "properties": {"B1": 1.0}}]}
+
+        with ee.geetools.FakeBackend(seed=0) as backend:
+            backend.results.update({"Dictionary": {"size": 6, "labels": ["B1"]}, "Collection.map": reduce})
+            with ee.data.profiling(ids.append):
+                ee.Image(1).rename("B1").geetools.byRegionsChunked(regions, chunkSize=2, maxWorkers=3)
+        assert hooks == [ids.append] * 3
+
+    def test_by_regions_chunked_profiler_not_entered(self):
+        with pytest.raises(ValueError):
+            self.image.geetools.byRegionsChunked(self.ecoregions, profiler=ee.geetools.Profiler())
+
+    @property
+    def bands(self):
+        return ["01_tmean", "02_tmean"]
+
+    @property
+    def ecoregions(self):
+        return ee.FeatureCollection("projects/google/charts_feature_example").select(
+            ["label", "value", "warm"]
+        )
+
+    @property
+    def image(self):
+        return ee.ImageCollection("OREGONSTATE/PRISM/Norm91m").toBands()
+
+
 class TestPlotHist:
     """Test the ``plot_hist`` method."""
 
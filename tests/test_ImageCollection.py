@@ -159,6 +159,54 @@ class TestIloc:
         values = {k: np.nan if v is None else v for k, v in reduce(ic).getInfo().items()}
         num_regression.check(values)
 
+    def test_iloc_getitem(self, s2_sr):
+        ids = s2_sr.limit(5).aggregate_array("system:index")
+        image = s2_sr.limit(5).geetools.iloc[-1]
+        assert image.get("system:index").getInfo() == ids.get(4).getInfo()
+
+    def test_iloc_slice(self, s2_sr):
+        ic = s2_sr.limit(5)
+        ids = ic.aggregate_array("system:index").getInfo()
+        assert ic.geetools.iloc[1:3].aggregate_array("system:index").getInfo() == ids[1:3]
+        assert ic.geetools.iloc[-2:].aggregate_array("system:index").getInfo() == ids[-2:]
+        assert ic.geetools.iloc[::2].aggregate_array("system:index").getInfo() == ids[::2]
+        assert ic.geetools.iloc[4:2].size().getInfo() == 0
+
+    def test_iloc_cached_index(self, s2_sr):
+        ic = s2_sr.limit(5)
+        ids = ic.geetools.index()
+        assert ids == ic.aggregate_array("system:index").getInfo()
+        assert ic.geetools.iloc(3).get("system:index").getInfo() == ids[3]
+        assert ic.geetools.iloc[1:3].aggregate_array("system:index").getInfo() == ids[1:3]
+        assert ic.geetools.iloc[::-2].aggregate_array("system:index").getInfo() == ids[::-2]
+
+    def test_iloc_number(self, s2_sr):
+        ic = s2_sr.limit(5)
+        ids = ic.aggregate_array("system:index")
+        assert ic.geetools.iloc(ee.Number(-1)).get("system:index").getInfo() == ids.get(4).getInfo()
+        assert ic.geetools.iloc(ee.Number(2)).get("system:index").getInfo() == ids.get(2).getInfo()
+
+    def test_iloc_negative_step(self, s2_sr):
+        with pytest.raises(ValueError):
+            s2_sr.limit(5).geetools.iloc[::-1]
+
+    def test_iloc_index_cache(self):
+        with ee.geetools.FakeBackend(seed=0) as backend:
+            backend.results.update({"AggregateFeatureCollection.array": ["a", "b", "c"]})
+            ic = ee.ImageCollection("foo").limit(3)
+            ic.geetools.index()
+            ee.ImageCollection([]).geetools.index()
+            reverse = ee.serializer.toJSON(ee.ImageCollection("foo").limit(3).geetools.iloc[::-1])
+            assert reverse.index('"c"') < reverse.index('"b"') < reverse.index('"a"')
+            assert '"b"' in ee.serializer.toJSON(ic.geetools.iloc(1))
+
+    def test_iloc_duplicated_ids(self):
+        image = ee.Image.constant(0).set("system:index", "a")
+        ic = ee.ImageCollection([image.set("id", i) for i in range(3)])
+        ic.geetools.index()
+        assert ic.geetools.iloc(2).get("id").getInfo() == 2
+        assert ic.geetools.iloc[::-1].aggregate_array("id").getInfo() == [2, 1, 0]
+
 
 class TestIntegral:
     """Test the ``integral`` method."""
@@ -169,6 +217,56 @@ class TestIntegral:
         values = {k: np.nan if v is None else v for k, v in reduce(ic, amazonas).getInfo().items()}
         num_regression.check(values)
 
+    def test_integral_linear(self):
+        # the trapezoidal rule is exact for y = t
+        integral = self.collection([0, 1, 3]).geetools.integral("y", unit="day")
+        assert self.value(integral) == pytest.approx(4.5)
+
+    def test_integral_normalized(self):
+        integral = self.collection([0, 1, 3]).geetools.integral("y")
+        assert self.value(integral) == pytest.approx(1.5)
+
+    def test_integral_masked(self):
+        ic = self.collection([0, 1, 3], value=2)
+        ic = ic.map(lambda i: i.updateMask(ee.Image.constant(ee.Number(i.get("day")).neq(1))))
+        integral = ic.geetools.integral("y", unit="day")
+        assert self.value(integral) is None
+
+    def test_integral_ignore_masked(self):
+        ic = self.collection([0, 1, 3], value=2)
+        ic = ic.map(lambda i: i.updateMask(ee.Image.constant(ee.Number(i.get("day")).neq(1))))
+        integral = ic.geetools.integral("y", unit="day", ignoreMasked=True)
+        assert self.value(integral) == pytest.approx(6)
+
+    def test_integral_missing_time(self):
+        # the image without time is dropped instead of shifting the weights of the others
+        ic = self.collection([0, 1, 3]).merge(ee.ImageCollection([ee.Image.constant(100).rename("y")]))
+        integral = ic.geetools.integral("y", unit="day")
+        assert self.value(integral) == pytest.approx(4.5)
+
+    def test_integral_wrong_unit(self):
+        with pytest.raises(ValueError):
+            self.collection([0, 1]).geetools.integral("y", unit="foo")
+
+    @staticmethod
+    def collection(days: list, value: float | None = None) -> ee.ImageCollection:
+        """Build a collection of constant images at the given days since 2020-01-01."""
+        start = ee.Date("2020-01-01")
+        images = [
+            ee.Image.constant(d if value is None else value)
+            .rename("y")
+            .toFloat()
+            .set("system:time_start", start.advance(d, "day").millis(), "day", d)
+            for d in days
+        ]
+        return ee.ImageCollection(images)
+
+    @staticmethod
+    def value(image: ee.Image) -> float:
+        """Extract the integral value over a point."""
+        point = ee.Geometry.Point([0, 0])
+        return image.reduceRegion(ee.Reducer.first(), point, 10).get("integral").getInfo()
+
 
 class TestOutliers:
     """Test the ``outliers`` method."""
@@ -178,6 +276,49 @@ class TestOutliers:
         values = {k: np.nan if v is None else v for k, v in reduce(ic, amazonas).getInfo().items()}
         num_regression.check(values)
 
+    @pytest.mark.parametrize("method, sigma", [("stdDev", 1), ("mad", 2), ("iqr", 0.5)])
+    def test_outliers_methods(self, method, sigma):
+        ic = self.collection.geetools.outliers(["y"], sigma, method=method)
+        assert self.flags(ic) == [1, 0, 0, 0, 0, 1]
+
+    def test_outliers_drop(self):
+        ic = self.collection.geetools.outliers(["y"], 1, drop=True)
+        assert ic.first().bandNames().getInfo() == ["y"]
+        assert ic.map(lambda i: i.set("valid", self.value(i.mask()))).aggregate_sum("valid").getInfo() == 4
+
+    def test_outliers_precomputed_bounds(self):
+        bounds = self.collection.geetools.outlierBounds(["y"], 1)
+        assert bounds.bandNames().getInfo() == ["y_min", "y_max"]
+        ic = self.collection.geetools.outliers(["y"], bounds=bounds)
+        assert self.flags(ic) == [1, 0, 0, 0, 0, 1]
+
+    def test_outliers_sample(self):
+        bounds = self.collection.geetools.outlierBounds(["y"], 1, sample=6)
+        expected = self.collection.geetools.outlierBounds(["y"], 1)
+        upper, expected = self.value(bounds.select("y_max")), self.value(expected.select("y_max"))
+        assert upper.getInfo() == pytest.approx(expected.getInfo())
+
+    def test_outliers_wrong_method(self):
+        with pytest.raises(ValueError):
+            self.collection.geetools.outlierBounds(method="foo")
+
+    @property
+    def collection(self) -> ee.ImageCollection:
+        """The 1D example of the documentation as constant images."""
+        values = [1, 5, 6, 4, 7, 10]
+        return ee.ImageCollection([ee.Image.constant(v).rename("y").toFloat() for v in values])
+
+    @staticmethod
+    def value(image: ee.Image) -> float:
+        """Extract the value of a single band image over a point."""
+        point = ee.Geometry.Point([0, 0])
+        return ee.Number(image.reduceRegion(ee.Reducer.first(), point, 10).values().get(0))
+
+    def flags(self, ic: ee.ImageCollection) -> list:
+        """Extract the outlier flags of each image."""
+        ic = ic.map(lambda i: i.set("flag", self.value(i.select("y_outlier"))))
+        return ic.aggregate_array("flag").getInfo()
+
     def test_outliers_with_bands(self, s2_sr, amazonas, num_regression):
         ic = s2_sr.limit(10).geetools.outliers(bands=["B4", "B2"])
         values = {k: np.nan if v is None else v for k, v in reduce(ic, amazonas).getInfo().items()}
@@ -260,6 +401,33 @@ class TestContainsBandNames:
         ic = ic.geetools.containsAnyBands(["B5", "B6"])
         assert ic.size().getInfo() == 0
 
+    def test_contains_all_signatures(self, aster):
+        ic = aster.geetools.containsAllBands(
+            ["B3N", "B02", "B01"], bandNamesProperty="ORIGINAL_BANDS_PRESENT", signatures=True
+        )
+        assert ic.size().getInfo() == 2
+
+    def test_contains_any_signatures(self, aster):
+        ic = aster.geetools.containsAnyBands(
+            ["B3N", "B02", "B01"], bandNamesProperty="ORIGINAL_BANDS_PRESENT", signatures=True
+        )
+        assert ic.size().getInfo() == 2
+
+    def test_signatures_cached(self, s2_sr, monkeypatch):
+        ic = s2_sr.select(["B2", "B3", "B4"])
+        assert ic.geetools.bandSignatures() == [["B2", "B3", "B4"]]
+        monkeypatch.setattr(ee.data, "computeValue", lambda *args: pytest.fail("not cached"))
+        filtered = ic.geetools.containsAllBands(["B2", "B3"], signatures=True)
+        assert "Collection.filter" not in ee.serializer.toJSON(filtered)
+
+    @pytest.mark.parametrize("bands", [["B3N", "B02", "B01"], ["B01"]])
+    def test_signatures_same_output(self, aster, bands):
+        kwargs = {"bandNamesProperty": "ORIGINAL_BANDS_PRESENT"}
+        ic = aster.geetools.containsAllBands(bands, **kwargs)
+        screened = aster.geetools.containsAllBands(bands, signatures=True, **kwargs)
+        properties = lambda c: c.map(lambda i: ee.Feature(None, i.toDictionary())).getInfo()  # noqa: E731
+        assert properties(screened) == properties(ic)
+
 
 class TestAggregateArray:
     """Test the ``aggregateArray`` method."""
@@ -310,6 +478,20 @@ class TestGroupInterval:
             imgCollection = ee.ImageCollection(grouped.get(i))
             assert imgCollection.size().getInfo() != 0
 
+    def test_group_interval_single_join(self, jaxa_rainfall):
+        # the groups are built from a single join and never filter the collection per interval
+        ic = jaxa_rainfall.filterDate("2020-01-01", "2020-03-31")
+        graph = ee.serializer.toJSON(ic.geetools.groupInterval(duration=1, unit="hour"))
+        assert graph.count("Join.apply") == 1
+        assert "DateRange" not in graph
+
+    def test_group_interval_sorted(self, jaxa_rainfall):
+        ic = jaxa_rainfall.filterDate("2020-01-01", "2020-03-31")
+        grouped = ic.geetools.groupInterval()
+        starts = grouped.map(lambda c: ee.ImageCollection(c).aggregate_min("system:time_start"))
+        starts = starts.getInfo()
+        assert starts == sorted(starts)
+
 
 class TestReduceInterval:
     """Test the ``reduceInterval`` method."""
@@ -385,6 +567,57 @@ class TestClosestDate:
         num_regression.check(values)
 
 
+class TestFillGaps:
+    """Test the ``fillGaps`` method."""
+
+    def test_forward(self):
+        filled = self.collection.geetools.fillGaps("forward", count=1)
+        assert self.values(filled) == [0, 0, 4, 4]
+
+    def test_forward_window(self):
+        # the 4th image is too far from the 3rd to be filled
+        filled = self.collection.geetools.fillGaps("forward", window=1.5, unit="day")
+        assert self.values(filled) == [0, 0, 4, -1]
+
+    def test_linear(self):
+        # the last image has no following neighbour and remains masked
+        filled = self.collection.geetools.fillGaps("linear", count=2)
+        assert self.values(filled) == [0, 2, 4, -1]
+
+    def test_graph_size(self, s2_sr):
+        # the graph doesn't depend on the size of the collection
+        small = ee.serializer.toJSON(s2_sr.limit(10).geetools.fillGaps("linear", count=3))
+        large = ee.serializer.toJSON(s2_sr.limit(1000).geetools.fillGaps("linear", count=3))
+        assert abs(len(large) - len(small)) < 50
+
+    def test_duplicated_ids(self):
+        collection = self.collection.map(lambda i: i.set("system:index", "image"))
+        filled = collection.geetools.fillGaps("forward", count=1)
+        assert self.values(filled) == [0, 0, 4, 4]
+
+    def test_wrong_method(self):
+        with pytest.raises(ValueError):
+            self.collection.geetools.fillGaps("foo")
+
+    @property
+    def collection(self) -> ee.ImageCollection:
+        """4 images at days 0, 1, 2 and 5 with the values 0, masked, 4, masked."""
+        start, images = ee.Date("2020-01-01"), []
+        for day, value in [(0, 0), (1, None), (2, 4), (5, None)]:
+            image = ee.Image.constant(value or 0).rename("y").toFloat()
+            image = image.updateMask(0) if value is None else image
+            images.append(image.set("system:time_start", start.advance(day, "day").millis()))
+        return ee.ImageCollection(images)
+
+    @staticmethod
+    def values(ic: ee.ImageCollection) -> list:
+        """Extract the values of each image over a point, masked values are set to -1."""
+        point = ee.Geometry.Point([0, 0])
+        reduce = lambda i: i.unmask(-1).reduceRegion(ee.Reducer.first(), point, 10).get("y")  # noqa: E731
+        values = ic.map(lambda i: i.set("y", reduce(i)))
+        return values.aggregate_array("y").getInfo()
+
+
 class TestMedoid:
     """Test the ``medoid`` method."""
 
@@ -395,6 +628,27 @@ class TestMedoid:
         values = {k: np.nan if v is None else v for k, v in values.items()}
         num_regression.check(values)
 
+    @pytest.mark.parametrize("method", ["pairwise", "mean", "median"])
+    def test_medoid_methods(self, method):
+        # 2 has the smallest sum of distances to [1, 2, 10] and is the closest to both their mean and median.
+        # the original values are returned, not the normalized ones
+        images = [ee.Image.constant([v, v * 2]).rename(["a", "b"]) for v in [1, 2, 10]]
+        medoid = ee.ImageCollection(images).geetools.medoid(method)
+        values = medoid.reduceRegion(ee.Reducer.first(), ee.Geometry.Point([0, 0]), 10)
+        assert values.getInfo() == {"a": 2, "b": 4}
+
+    def test_medoid_linear_graph(self):
+        # the linear method builds a graph of the same order of magnitude as the exact one
+        images = [ee.Image.constant([v, v * 2]).rename(["a", "b"]) for v in range(20)]
+        ic = ee.ImageCollection(images)
+        exact = ee.serializer.toJSON(ic.geetools.medoid())
+        linear = ee.serializer.toJSON(ic.geetools.medoid("mean"))
+        assert len(linear) < 2 * len(exact)
+
+    def test_medoid_wrong_method(self, s2_sr):
+        with pytest.raises(ValueError):
+            s2_sr.geetools.medoid("foo")
+
 
 class TestSortMany:
     """Test the ``sortMany`` method."""
@@ -448,6 +702,73 @@ class TestSortMany:
         with pytest.raises(EEException):
             l8_toa.geetools.sortMany([prop1, prop2], [True]).getInfo()
 
+    def test_sort_many_key_matches_chain(self, l8_toa):
+        l8_toa = l8_toa.map(self.adjust_cloud_cover)
+        props, asc = ["CLOUD_COVER", "system:time_start"], [False, True]
+        key = l8_toa.geetools.sortMany(props, asc, method="key").aggregate_array("system:index")
+        chain = l8_toa.geetools.sortMany(props, asc, method="chain").aggregate_array("system:index")
+        assert key.getInfo() == chain.getInfo()
+
+    def test_sort_many_key_single_sort(self, l8_toa):
+        process = l8_toa.geetools.sortMany(["CLOUD_COVER", "system:time_start"], method="key")
+        graph = ee.serializer.toJSON(process)
+        assert graph.count("Collection.limit") == 1
+        assert "iterate" not in graph
+
+    def test_sort_many_key_missing_values(self):
+        image = ee.Image.constant(0)
+        values = [{"a": 1, "b": 2}, {"b": 1}, {"a": 0, "b": 3}, {"a": 1, "b": 1}]
+        ic = ee.ImageCollection([image.set(v).set("id", i) for i, v in enumerate(values)])
+        sortedAsc = ic.geetools.sortMany(["a", "b"], method="key").aggregate_array("id")
+        sortedDesc = ic.geetools.sortMany(["a", "b"], [False, True], method="key").aggregate_array("id")
+        assert sortedAsc.getInfo() == [2, 3, 0, 1]
+        assert sortedDesc.getInfo() == [3, 0, 2, 1]
+
+    def test_sort_many_wrong_method(self, l8_toa):
+        with pytest.raises(ValueError):
+            l8_toa.geetools.sortMany(["CLOUD_COVER"], method="foo")
+
+
+class TestDatesChunked:
+    """Test the ``datesChunked`` method."""
+
+    def test_dates_chunked_by_bands(self):
+        params = {"region": self.region.geometry(), "bands": ["NDVI", "EVI"], "scale": 500}
+        chunked = self.collection.geetools.datesChunked("bands", 3, **params)
+        assert chunked == self.collection.geetools.datesByBands(**params).getInfo()
+
+    def test_dates_chunked_by_regions(self):
+        params = {"band": "NDVI", "regions": self.region, "label": "label", "scale": 500}
+        chunked = self.collection.geetools.datesChunked("regions", 3, **params)
+        assert chunked == self.collection.geetools.datesByRegions(**params).getInfo()
+
+    def test_long_format(self):
+        table = self.collection.geetools.datesChunked(
+            "bands", 3, long=True, region=self.region.geometry(), bands=["NDVI"], scale=500
+        )
+        assert list(table.columns) == ["label", "date", "value"]
+        assert len(table) == self.collection.size().getInfo()
+
+    def test_wrong_method(self):
+        with pytest.raises(ValueError):
+            self.collection.geetools.datesChunked("foo")
+
+    @property
+    def region(self):
+        return (
+            ee.FeatureCollection("projects/google/charts_feature_example")
+            .select(["label", "value", "warm"])
+            .filter(ee.Filter.eq("label", "Grassland"))
+        )
+
+    @property
+    def collection(self):
+        return (
+            ee.ImageCollection("MODIS/061/MOD13A1")
+            .filter(ee.Filter.date("2010-01-01", "2010-06-01"))
+            .select(["NDVI", "EVI"])
+        )
+
 
 class TestPlotDatesByBands:
     """Test the ``plot_dates_by_bands`` method."""
@@ -674,6 +995,50 @@ class TestPlotDoyBySeasons:
         )
 
 
+class TestDoyTable:
+    """Test the ``doyTable`` method."""
+
+    def test_doy_table(self):
+        table = self.collection.geetools.doyTable(
+            "bands", region=self.region.geometry(), bands=["NDVI", "EVI"], scale=500
+        )
+        assert list(table.columns) == ["label", "doy", "value"]
+        assert set(table.label) == {"NDVI", "EVI"}
+        assert table.groupby("label").doy.is_monotonic_increasing.all()
+
+    def test_plot_from_table(self, monkeypatch):
+        table = self.collection.geetools.doyTable("years", band="NDVI", region=self.region.geometry())
+        monkeypatch.setattr(ee.data, "computeValue", lambda *args: pytest.fail("recomputed"))
+        ax = self.collection.geetools.plot_doy_by_years("NDVI", self.region.geometry(), data=table)
+        assert len(ax.lines) == table.label.nunique()
+
+    def test_single_join(self):
+        reduced = self.collection.geetools.doyByBands(self.region.geometry(), bands=["NDVI"])
+        graph = ee.serializer.toJSON(reduced)
+        assert graph.count("Join.saveAll") == 1
+        assert graph.count("Image.reduceRegion") == 1
+
+    def test_wrong_method(self):
+        with pytest.raises(ValueError):
+            self.collection.geetools.doyTable("foo")
+
+    @property
+    def region(self):
+        return (
+            ee.FeatureCollection("projects/google/charts_feature_example")
+            .select(["label", "value", "warm"])
+            .filter(ee.Filter.eq("label", "Grassland"))
+        )
+
+    @property
+    def collection(self):
+        return (
+            ee.ImageCollection("MODIS/061/MOD13A1")
+            .filter(ee.Filter.date("2012-01-01", "2012-12-31"))
+            .select(["NDVI", "EVI"])
+        )
+
+
 class TestReduceRegion:
     """Test the reduceRegion method."""
 
@@ -16,6 +16,58 @@ class TestByProperty:
         joined = ee.Join.geetools.byProperty(fc1, fc2, "id", outer=True)
         ee_feature_collection_regression.check(joined, prescision=4)
 
+    def test_composite_key(self, sites, visits):
+        joined = ee.Join.geetools.byProperty(sites, visits, ["site", "year"])
+        assert joined.aggregate_array("visit").getInfo() == [1]
+        names = ["ndvi", "site", "system:index", "visit", "year"]
+        assert joined.first().propertyNames().sort().getInfo() == names
+
+    def test_many_to_many(self, sites, visits):
+        joined = ee.Join.geetools.byProperty(sites, visits, "site", how="all")
+        assert sorted(joined.aggregate_array("visit").getInfo()) == [1, 1, 2, 2, 3, 3]
+
+    def test_many_to_many_outer(self, sites, visits):
+        joined = ee.Join.geetools.byProperty(sites, visits, ["site", "year"], outer=True, how="all")
+        assert joined.aggregate_array("ndvi").getInfo() == [0.5, 0.6, 0.7]
+        ids = sites.aggregate_array("system:index")
+        assert joined.aggregate_array("system:index").getInfo() == ids.getInfo()
+
+    def test_composite_key_values(self, sites):
+        properties = [{"site": "a", "year": 2020.0, "visit": 1}, {"site": None, "year": 2020, "visit": 2}]
+        visits = ee.FeatureCollection([ee.Feature(None, p) for p in properties])
+        nullSites = sites.merge(ee.FeatureCollection([ee.Feature(None, {"year": 2020, "ndvi": 0.8})]))
+        joined = ee.Join.geetools.byProperty(nullSites, visits, ["site", "year"], outer=True, how="all")
+        assert joined.aggregate_array("visit").getInfo() == [1]
+        assert joined.size().getInfo() == 4
+
+    def test_first_outer(self, sites, visits):
+        joined = ee.Join.geetools.byProperty(sites, visits, ["site", "year"], outer=True)
+        assert joined.size().getInfo() == 3
+        assert joined.aggregate_array("visit").getInfo() == [1]
+
+    def test_wrong_how(self, sites, visits):
+        with pytest.raises(ValueError):
+            ee.Join.geetools.byProperty(sites, visits, "site", how="last")
+
+    @pytest.fixture
+    def sites(self):
+        point = ee.Geometry.Point([0, 0])
+        properties = [
+            {"site": "a", "year": 2020, "ndvi": 0.5},
+            {"site": "a", "year": 2021, "ndvi": 0.6},
+            {"site": "b", "year": 2020, "ndvi": 0.7},
+        ]
+        return ee.FeatureCollection([ee.Feature(point, p) for p in properties])
+
+    @pytest.fixture
+    def visits(self):
+        properties = [
+            {"site": "a", "year": 2020, "visit": 1},
+            {"site": "a", "year": 2022, "visit": 2},
+            {"site": "b", "year": 2021, "visit": 3},
+        ]
+        return ee.FeatureCollection([ee.Feature(None, p) for p in properties])
+
     @pytest.fixture
     def fc1(self):
         point = ee.Geometry.Point([0, 0])
@@ -87,6 +87,20 @@ class TestReplaceMany:
         replaced_list = letter_list.geetools.replaceMany({"a": "foo", "c": "bar"})
         ee_list_regression.check(replaced_list, prescision=4)
 
+    def test_replace_simultaneously(self):
+        replaced_list = ee.List(["a", 1, "c"]).geetools.replaceMany({"a": "c", "c": "bar"})
+        assert replaced_list.getInfo() == ["c", 1, "bar"]
+
+    def test_literal(self, letter_list):
+        replaced_list = letter_list.geetools.replaceMany({"a": "foo"})
+        assert replaced_list.func is None
+
+    def test_server_side(self):
+        letters = ee.List(ee.Feature(None, {"letters": ["a", "b", "c"]}).get("letters"))
+        replaced_list = letters.geetools.replaceMany({"a": "foo", "c": "bar"})
+        assert replaced_list.func is not None
+        assert replaced_list.getInfo() == ["foo", "b", "bar"]
+
 
 class TestZip:
     """Test the zip method."""
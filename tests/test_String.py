@@ -45,3 +45,13 @@ class TestFormat:
         params = {"greeting": "Hello", "number": 3.1415, "date": 1577836800000}
         formatted_string = string.geetools.format(params)
         assert formatted_string.getInfo() == "Hello "
+
+    def test_format_literal(self, format_string_instance):
+        formatted_string = format_string_instance.geetools.format({"greeting": "Hello", "name": "bob"})
+        assert formatted_string.func is None
+
+    def test_format_server_side(self):
+        string = ee.String(ee.Feature(None, {"string": "{greeting} {name}"}).get("string"))
+        formatted_string = string.geetools.format({"greeting": "Hello", "name": "bob"})
+        assert formatted_string.func is not None
+        assert formatted_string.getInfo() == "Hello bob"
@@ -0,0 +1,29 @@
+"""Test the accessors module."""
+import ee
+
+import geetools  # noqa: F401
+
+
+class TestClassAccessor:
+    """Test the namespace registered by ``register_class_accessor``."""
+
+    def test_same_object(self):
+        image = ee.Image(1)
+        assert image.geetools is image.geetools
+
+    def test_other_object(self):
+        image, other = ee.Image(1), ee.Image(1)
+        accessor = image.geetools
+        assert other.geetools is not accessor
+        assert other.geetools._obj is other
+
+    def test_hash(self):
+        image = ee.Image(1)
+        image.geetools
+        assert hash(image) == hash(ee.Image(1))
+
+    def test_class(self):
+        assert ee.List.geetools._obj is None
+
+    def test_slots(self):
+        assert not hasattr(ee.Image(1).geetools, "__dict__")
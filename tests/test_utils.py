@@ -0,0 +1,30 @@
+"""Test the utils module."""
+import ee
+
+from geetools.utils import ClientCache, clear_cache
+
+
+class TestClientCache:
+    """Test the ``ClientCache`` class."""
+
+    def test_key(self):
+        key = ClientCache.key(ee.Number(1).add(1), "foo")
+        assert key == ClientCache.key(ee.Number(1).add(1), "foo")
+        assert key != ClientCache.key(ee.Number(1).add(2), "foo")
+        assert len(key) == 32
+
+    def test_least_recently_used(self):
+        cache = ClientCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        assert len(cache) == 2
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+
+    def test_clear_cache(self):
+        cache = ClientCache()
+        cache.set("a", 1)
+        clear_cache()
+        assert cache.get("a") is None